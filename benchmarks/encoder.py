@@ -0,0 +1,170 @@
+"""Benchmarks per object cost of encoding & decoding domain types.
+
+Times the reflection based codec (asdict / dir / fields per object) that preceded compiled
+codecs against the compiled codecs registered by stests.core.utils.encoder.
+
+Usage (from repository root): python -m benchmarks.encoder [iterations]
+
+"""
+import copy
+import dataclasses
+import datetime
+import sys
+import timeit
+
+from stests.core.utils import encoder
+from test.core import utils_factory as factory
+
+
+
+# Default number of iterations per measurement.
+ITERATIONS = 20000
+
+# Set: (label, factory) of types to be benchmarked.
+FIXTURES = (
+    ("Account", factory.create_account),
+    ("Deploy", factory.create_deploy),
+    ("Transfer", factory.create_transfer),
+    ("Node", factory.create_node),
+    ("ExecutionInfo", factory.create_execution_info),
+    ("ExecutionContext", factory.create_execution_context),
+)
+
+
+def main(iterations: int):
+    """Prints per object encode & decode timings - baseline vs compiled.
+
+    :param iterations: Number of iterations per measurement.
+
+    """
+    print(f"Per-object cost ({iterations} iterations, Python {sys.version.split()[0]}):")
+    print()
+    print(f"  {'type':<18} {'encode before/after':<22} decode before/after")
+    for label, create in FIXTURES:
+        data = create()
+        encoded = encoder.encode(data)
+        assert _baseline_encode(data) == encoded, f"{label} :: encoded output differs"
+
+        timings = [
+            _time_encode(_baseline_encode, data, iterations),
+            _time_encode(encoder.encode, data, iterations),
+            _time_decode(_baseline_decode, encoded, iterations),
+            _time_decode(encoder.decode, encoded, iterations),
+        ]
+        print("  {:<18} {:>7.1f}us / {:>5.1f}us     {:>6.1f}us / {:>4.1f}us".format(label, *timings))
+
+
+def _time_encode(encode, data, iterations: int) -> float:
+    """Returns mean microseconds per encoding.
+
+    """
+    return timeit.timeit(lambda: encode(data), number=iterations) * 1e6 / iterations
+
+
+def _time_decode(decode, encoded, iterations: int) -> float:
+    """Returns mean microseconds per decoding - decoders mutate their input, hence each decodes a copy.
+
+    """
+    copies = iter([copy.deepcopy(encoded) for _ in range(iterations)])
+
+    return timeit.timeit(lambda: decode(next(copies)), number=iterations) * 1e6 / iterations
+
+
+def _baseline_decode(obj):
+    """Reflection based decoding as per encoder.decode prior to compiled decoders.
+
+    """
+    if isinstance(obj, encoder.PRIMITIVES):
+        return obj
+
+    if isinstance(obj, tuple):
+        return tuple(map(_baseline_decode, obj))
+
+    if isinstance(obj, list):
+        return list(map(_baseline_decode, obj))
+
+    if isinstance(obj, dict) and '_type_key' in obj:
+        return _baseline_decode_dclass(obj)
+
+    if isinstance(obj, dict):
+        return {k: _baseline_decode(v) for k, v in obj.items()}
+
+    if isinstance(obj, str) and obj in encoder.ENUM_VALUE_MAP:
+        return encoder.ENUM_VALUE_MAP[obj]
+
+    return obj
+
+
+def _baseline_decode_dclass(obj):
+    """Reflection based decoding of a registered data class instance.
+
+    """
+    dcls = encoder.DCLASS_MAP[obj['_type_key']]
+    for field in dataclasses.fields(dcls):
+        if field.name not in obj:
+            continue
+
+        field_value = obj[field.name]
+        if isinstance(field_value, type(None)):
+            continue
+
+        field_type = encoder._get_field_type(field)
+        if field_type is datetime.datetime:
+            obj[field.name] = datetime.datetime.fromtimestamp(field_value)
+
+        elif field.type in encoder.ENUM_TYPE_SET:
+            obj[field.name] = field.type[obj[field.name]]
+
+        elif field_type in encoder.DCLASS_SET:
+            obj[field.name] = _baseline_decode_dclass(obj[field.name])
+
+        else:
+            obj[field.name] = _baseline_decode(obj[field.name])
+
+    return dcls(**obj)
+
+
+def _baseline_encode(data):
+    """Reflection based encoding as per encoder.encode prior to compiled encoders.
+
+    """
+    if isinstance(data, encoder.PRIMITIVES):
+        return data
+
+    if isinstance(data, datetime.datetime):
+        return data.timestamp()
+
+    if isinstance(data, dict):
+        return {k: _baseline_encode(v) for k, v in data.items()}
+
+    if isinstance(data, tuple):
+        return tuple(map(_baseline_encode, data))
+
+    if isinstance(data, list):
+        return list(map(_baseline_encode, data))
+
+    if type(data) in encoder.DCLASS_SET:
+        return _baseline_encode_dclass(data, dataclasses.asdict(data))
+
+    if type(data) in encoder.ENUM_TYPE_SET:
+        return data.name
+
+    return data
+
+
+def _baseline_encode_dclass(data, obj):
+    """Reflection based encoding of a registered data class instance.
+
+    """
+    obj['_type_key'] = f"{data.__module__}.{data.__class__.__name__}"
+
+    # Recurse through properties that are also registered data classes.
+    fields = [i for i in dir(data) if i in obj and not i.startswith('_')]
+    for field in [i for i in fields if type(getattr(data, i)) in encoder.DCLASS_SET]:
+        _baseline_encode_dclass(getattr(data, field), obj[field])
+
+    return _baseline_encode(obj)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else ITERATIONS)
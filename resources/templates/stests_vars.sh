@@ -2,9 +2,54 @@
 # Cache
 # --------------------------------------------------------------------
 
-# type (REDIS | STUB)
+# type (REDIS | REDIS_CLUSTER | STUB)
 export STESTS_CACHE_TYPE="REDIS"
 
+# directory within which completed runs are archived (defaults to ~/.stests/archive)
+export STESTS_CACHE_ARCHIVE_DIRECTORY=
+
+# flag indicating whether completed runs are archived & evicted from cache
+export STESTS_CACHE_ARCHIVE_ON_RUN_END=1
+
+# codec applied to cached values (JSON | JSON_ZLIB | MSGPACK | MSGPACK_ZLIB) - msgpack codecs require msgpack package
+export STESTS_CACHE_CODEC="JSON"
+
+# zlib compression level applied by *_ZLIB codecs
+export STESTS_CACHE_CODEC_ZLIB_LEVEL=6
+
+# seconds after which an unreleased finalized block lock expires
+export STESTS_CACHE_LOCK_TTL_BLOCK=3600
+
+# seconds after which an unreleased run/phase/step lock expires
+export STESTS_CACHE_LOCK_TTL_EXECUTION=86400
+
+# seconds after which an unrenewed stream lock expires - i.e. time taken to recover from a dead stream consumer
+export STESTS_CACHE_LOCK_TTL_STREAM=15
+
+# flag indicating whether cache operations are instrumented (call counts, latency histograms, bytes & keys)
+export STESTS_CACHE_METRICS=1
+
+# seconds between successive flushes of a worker process's cache metrics to the monitoring partition
+export STESTS_CACHE_METRICS_FLUSH_INTERVAL=30
+
+# seconds after which a cached finalized block expires - i.e. window within which duplicate block events are detected (0 = never)
+export STESTS_CACHE_RETENTION_MONITORING_BLOCK_TTL=86400
+
+# seconds after which the sweeper evicts a cached finalized block (0 = never)
+export STESTS_CACHE_RETENTION_MONITORING_BLOCK_MAX_AGE=0
+
+# maximum number of cached finalized blocks retained by the sweeper (0 = unbounded)
+export STESTS_CACHE_RETENTION_MONITORING_BLOCK_MAX_COUNT=0
+
+# seconds after which a cached finalized deploy expires - i.e. window within which duplicate deploy events are detected (0 = never)
+export STESTS_CACHE_RETENTION_MONITORING_DEPLOY_TTL=86400
+
+# seconds after which the sweeper evicts a cached finalized deploy (0 = never)
+export STESTS_CACHE_RETENTION_MONITORING_DEPLOY_MAX_AGE=0
+
+# maximum number of cached finalized deploys retained by the sweeper (0 = unbounded)
+export STESTS_CACHE_RETENTION_MONITORING_DEPLOY_MAX_COUNT=0
+
 # --------------------------------------------------------------------
 # Cache: REDIS
 # --------------------------------------------------------------------
@@ -18,6 +63,75 @@ export STESTS_CACHE_REDIS_HOST="localhost"
 # Cache -> REDIS -> port
 export STESTS_CACHE_REDIS_PORT=6379
 
+# Cache -> REDIS -> max connections per partition pool
+export STESTS_CACHE_REDIS_POOL_SIZE=16
+
+# Cache -> REDIS -> seconds to wait for a pooled connection
+export STESTS_CACHE_REDIS_POOL_TIMEOUT=20
+
+# Cache -> REDIS -> seconds to wait when connecting
+export STESTS_CACHE_REDIS_SOCKET_CONNECT_TIMEOUT=5
+
+# Cache -> REDIS -> seconds to wait for a command response
+export STESTS_CACHE_REDIS_SOCKET_TIMEOUT=30
+
+# --------------------------------------------------------------------
+# Cache: REDIS_CLUSTER
+# --------------------------------------------------------------------
+
+# Cache -> REDIS_CLUSTER -> host of a node from which topology is discovered
+export STESTS_CACHE_REDIS_CLUSTER_HOST="localhost"
+
+# Cache -> REDIS_CLUSTER -> port of a node from which topology is discovered
+export STESTS_CACHE_REDIS_CLUSTER_PORT=7000
+
+# Cache -> REDIS_CLUSTER -> max connections per node pool
+export STESTS_CACHE_REDIS_CLUSTER_POOL_SIZE=16
+
+# Cache -> REDIS_CLUSTER -> seconds to wait for a pooled connection
+export STESTS_CACHE_REDIS_CLUSTER_POOL_TIMEOUT=20
+
+# Cache -> REDIS_CLUSTER -> flag indicating whether reads may be served by replicas
+export STESTS_CACHE_REDIS_CLUSTER_READ_FROM_REPLICAS=0
+
+# Cache -> REDIS_CLUSTER -> seconds to wait when connecting
+export STESTS_CACHE_REDIS_CLUSTER_SOCKET_CONNECT_TIMEOUT=5
+
+# Cache -> REDIS_CLUSTER -> seconds to wait for a command response
+export STESTS_CACHE_REDIS_CLUSTER_SOCKET_TIMEOUT=30
+
+# --------------------------------------------------------------------
+# CLX
+# --------------------------------------------------------------------
+
+# CLX -> client pool -> seconds after which an unused client is evicted
+export STESTS_CLX_CLIENT_POOL_IDLE_TIMEOUT=300
+
+# CLX -> client pool -> seconds after which a client is recycled (0 = never)
+export STESTS_CLX_CLIENT_POOL_MAX_AGE=0
+
+# CLX -> router -> node selection strategy (EWMA | LEAST_OUTSTANDING | RANDOM | ROUND_ROBIN | WEIGHTED)
+export STESTS_CLX_ROUTER_STRATEGY="EWMA"
+
+# CLX -> router -> smoothing factor applied to node latency moving averages
+export STESTS_CLX_ROUTER_EWMA_ALPHA=0.3
+
+# CLX -> router -> seconds between nodeset change checks
+export STESTS_CLX_ROUTER_NODESET_CHECK_INTERVAL=1
+
+# CLX -> number of processes across which batched deploys are signed (0 = sign inline)
+export STESTS_CLX_SIGNING_PROCESSES=0
+
+# CLX -> minimum deploy batch size for which signing is delegated to processes
+export STESTS_CLX_SIGNING_PROCESSES_THRESHOLD=64
+
+# CLX -> keystore -> directory to which account private key PEM files are written (default = /dev/shm/stests-keys)
+export STESTS_KEYSTORE_DIRECTORY=
+
+# CLX -> keystore -> seconds after which unmodified run key directories are swept (0 = never)
+# Runs are flushed upon a single host only, hence other hosts sweep stale runs whenever a new run starts.
+export STESTS_KEYSTORE_MAX_AGE=86400
+
 # --------------------------------------------------------------------
 # Broker
 # --------------------------------------------------------------------
@@ -25,6 +139,12 @@ export STESTS_CACHE_REDIS_PORT=6379
 # type (REDIS | RABBIT | STUB)
 export STESTS_BROKER_TYPE="REDIS"
 
+# dispatch execution contexts by reference (1) rather than by value (0)
+export STESTS_BROKER_CONTEXT_BY_REFERENCE=0
+
+# number of run contexts cached per worker when dispatching by reference
+export STESTS_BROKER_CONTEXT_CACHE_SIZE=64
+
 # --------------------------------------------------------------------
 # Broker: REDIS
 # --------------------------------------------------------------------
@@ -78,3 +198,32 @@ export STESTS_MWARE_REDIS_HOST=localhost
 
 # Broker Middleware -> REDIS -> port
 export STESTS_MWARE_REDIS_PORT=6379
+
+# --------------------------------------------------------------------
+# Orchestration
+# --------------------------------------------------------------------
+
+# Orchestration -> proportion (0 -> 1) of finalized deploys individually verified
+export STESTS_ORCHESTRATION_DEPLOY_VERIFICATION_SAMPLE_RATE=1
+
+# --------------------------------------------------------------------
+# Monitoring
+# --------------------------------------------------------------------
+
+# Monitoring -> probe -> seconds between successive node probes
+export STESTS_MONITORING_PROBE_INTERVAL=10
+
+# Monitoring -> probe -> smoothing factor applied to probe latency & error rate averages
+export STESTS_MONITORING_PROBE_EWMA_ALPHA=0.3
+
+# Monitoring -> probe -> average error rate above which a node is deemed distressed
+export STESTS_MONITORING_PROBE_DISTRESSED_ERROR_RATE=0.2
+
+# Monitoring -> probe -> average latency (seconds) above which a node is deemed distressed
+export STESTS_MONITORING_PROBE_DISTRESSED_LATENCY=2
+
+# Monitoring -> probe -> consecutive probe failures after which a node is deemed down
+export STESTS_MONITORING_PROBE_DOWN_ERRORS=3
+
+# Monitoring -> sweeper -> seconds between successive sweeps of cached collections subject to a retention policy
+export STESTS_MONITORING_SWEEP_INTERVAL=300
@@ -23,8 +23,8 @@ REQUIRES = [
     'apscheduler',
     'casperlabs_client',
     'cryptography',
-    'redis',
-    'fakeredis',
+    'redis>=4.3',
+    'fakeredis[lua]',
     'hiredis',
     'dramatiq',
     'pytest',
@@ -34,12 +34,25 @@ alias stests-workers-stop=$STESTS_PATH_SH/workers/stop.sh
 alias stests-workers-reload=$STESTS_PATH_SH/workers/reload.sh
 alias stests-workers-reset-logs=$STESTS_PATH_SH/workers/reset_logs.sh
 
+# ###############################################################
+# ALIASES: cache - archive
+# ###############################################################
+
+alias stests-archive-run='_exec_cmd $STESTS_PATH_CLI/cache/archive_run.py'
+
 # ###############################################################
 # ALIASES: cache - flush
 # ###############################################################
 
-alias stests-flush='$STESTS_PATH_SH/cache/flush.sh'
-alias stests-flush-infra='$STESTS_PATH_SH/cache/flush_infra.sh'
+alias stests-flush='_exec_cmd $STESTS_PATH_CLI/cache/flush.py'
+alias stests-flush-infra='_exec_cmd $STESTS_PATH_CLI/cache/flush.py infra'
+alias stests-flush-run='_exec_cmd $STESTS_PATH_CLI/cache/flush_run.py'
+
+# ###############################################################
+# ALIASES: cache - stats
+# ###############################################################
+
+alias stests-cache-stats='_exec_cmd $STESTS_PATH_CLI/cache/list_cache_stats.py'
 
 # ###############################################################
 # ALIASES: cache - ls
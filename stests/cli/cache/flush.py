@@ -0,0 +1,75 @@
+import argparse
+
+import dramatiq
+
+from stests.cli.utils import get_flush_progress_logger
+from stests.core import cache
+from stests.core.cache.enums import StorePartition
+from stests.core.utils import logger
+
+
+
+# Flush target: message broker queues.
+_BROKER = "broker"
+
+# Set: flush targets.
+_TARGETS = [_BROKER] + [i.name.lower() for i in StorePartition]
+
+# Flush targets flushed when none are specified - infra is retained as it is manually registered.
+_DEFAULTS = [
+    _BROKER,
+    StorePartition.MONITORING.name.lower(),
+    StorePartition.ORCHESTRATION.name.lower(),
+    StorePartition.STATE.name.lower(),
+]
+
+
+def _validate_target(value):
+    """Argument verifier: flush target.
+
+    """
+    value = str(value).lower()
+    if value not in _TARGETS:
+        raise argparse.ArgumentTypeError(f"Invalid flush target: {value} - valid targets are {' '.join(_TARGETS)}")
+
+    return value
+
+
+# CLI argument parser.
+ARGS = argparse.ArgumentParser("Flushes cache partitions (each in parallel) & message broker queues.")
+
+# CLI argument: flush targets.
+ARGS.add_argument(
+    "targets",
+    help=f"Targets to be flushed ({' | '.join(_TARGETS)}) - defaults to {' '.join(_DEFAULTS)}.",
+    nargs="*",
+    type=_validate_target,
+    )
+
+
+def main(args):
+    """Entry point.
+    
+    :param args: Parsed CLI arguments.
+
+    """
+    targets = args.targets or _DEFAULTS
+
+    # Flush broker queues - declared by importing actors.
+    if _BROKER in targets:
+        import stests.initialiser
+        dramatiq.get_broker().flush_all()
+        logger.log("BROKER - queues flushed")
+
+    # Flush partitions.
+    partitions = [StorePartition[i.upper()] for i in targets if i != _BROKER]
+    counts = cache.flush_partitions(partitions, get_flush_progress_logger())
+
+    # Notify.
+    for partition, count in counts.items():
+        logger.log(f"{partition.name} - {count} keys flushed")
+
+
+# Entry point.
+if __name__ == '__main__':
+    main(ARGS.parse_args())
@@ -0,0 +1,59 @@
+import argparse
+
+from stests.cli.utils import get_flush_progress_logger
+from stests.core import cache
+from stests.core.utils import args_validator
+from stests.core.utils import factory
+from stests.core.utils import logger
+
+
+
+# CLI argument parser.
+ARGS = argparse.ArgumentParser("Flushes a run's cached information - each partition is flushed in parallel.")
+
+# CLI argument: network name.
+ARGS.add_argument(
+    "network",
+    help="Network name {type}{id}, e.g. lrt1.",
+    type=args_validator.validate_network
+    )
+
+# CLI argument: run type.
+ARGS.add_argument(
+    "run_type",
+    help="Generator type - e.g. wg-100.",
+    type=args_validator.validate_run_type,
+    )
+
+# CLI argument: run index.
+ARGS.add_argument(
+    "run_index",
+    help="Run identifier, e.g. 1-100.",
+    type=args_validator.validate_run_index,
+    )
+
+
+def main(args):
+    """Entry point.
+    
+    :param args: Parsed CLI arguments.
+
+    """
+    # Pull run context.
+    network_id = factory.create_network_id(args.network)
+    ctx = cache.orchestration.get_context(network_id.name, args.run_index, args.run_type)
+    if ctx is None:
+        logger.log_warning(f"Run {args.run_index} is not cached.")
+        return
+
+    # Flush.
+    counts = cache.flush_by_run(ctx, get_flush_progress_logger())
+
+    # Notify.
+    for partition, count in counts.items():
+        logger.log(f"{network_id.name} - {args.run_type} - Run {args.run_index} - {partition.name} - {count} keys flushed")
+
+
+# Entry point.
+if __name__ == '__main__':
+    main(ARGS.parse_args())
@@ -0,0 +1,104 @@
+import argparse
+
+from beautifultable import BeautifulTable
+
+from stests.cli.utils import get_table
+from stests.core import cache
+from stests.core.utils import logger
+
+
+
+# Map: sort order -> function returning sort key of an operation's metrics.
+_SORT_KEYS = {
+    "bytes": lambda i: i.bytes_encoded + i.bytes_decoded,
+    "count": lambda i: i.count,
+    "latency": lambda i: i.latency,
+    "scanned": lambda i: i.keys_scanned - i.keys_returned,
+}
+
+# CLI argument parser.
+ARGS = argparse.ArgumentParser("Displays cache operation metrics aggregated across worker processes - top offenders first.")
+
+# CLI argument: number of operations to display.
+ARGS.add_argument(
+    "--top",
+    help="Number of operations to display - defaults to 20.",
+    dest="top",
+    type=int,
+    default=20,
+    )
+
+# CLI argument: sort order.
+ARGS.add_argument(
+    "--sort",
+    help="Sort order (latency | count | bytes | scanned) - scanned orders by keys scanned but not returned - defaults to latency.",
+    dest="sort",
+    choices=list(_SORT_KEYS),
+    default="latency",
+    )
+
+# CLI argument: flag indicating whether metrics are to be reset once displayed.
+ARGS.add_argument(
+    "--reset",
+    help="Reset metrics once displayed.",
+    dest="reset",
+    action="store_true",
+    )
+
+
+def main(args):
+    """Entry point.
+    
+    :param args: Parsed CLI arguments.
+
+    """
+    # Pull data.
+    data = cache.metrics.get_metrics()
+    if not data:
+        logger.log("No cache metrics found - metrics are flushed by worker processes periodically.")
+        return
+
+    # Set cols/rows.
+    cols = ["Partition", "Operation", "Collection", "Calls", "Total (s)", "Avg (ms)", "p50 (ms)", "p99 (ms)", "Bytes Out", "Bytes In", "Scanned", "Returned"]
+    rows = map(lambda i: [
+        i.partition,
+        i.operation,
+        i.collection,
+        i.count,
+        format(i.latency, ".3f"),
+        format(i.latency_avg * 1000, ".3f"),
+        _get_percentile_label(i, 0.5),
+        _get_percentile_label(i, 0.99),
+        i.bytes_encoded,
+        i.bytes_decoded,
+        i.keys_scanned,
+        i.keys_returned,
+    ], sorted(data, key=_SORT_KEYS[args.sort], reverse=True)[:args.top])
+
+    # Set table.
+    t = get_table(cols, rows, max_width=200)
+    for col in cols[3:]:
+        t.column_alignments[col] = BeautifulTable.ALIGN_RIGHT
+
+    # Render.
+    print(t)
+    print(f"total operations = {len(data)} :: total calls = {sum(i.count for i in data)} :: total latency (s) = {format(sum(i.latency for i in data), '.3f')}")
+
+    # Reset.
+    if args.reset:
+        cache.metrics.reset_metrics()
+        logger.log("Cache metrics reset.")
+
+
+def _get_percentile_label(metrics: cache.metrics.OperationMetrics, percentile: float) -> str:
+    """Returns label of a latency percentile - i.e. upper bound of the histogram bucket within which it falls.
+
+    """
+    bound = metrics.get_percentile(percentile)
+
+    return f"<= {bound}" if bound is not None else f"> {cache.metrics.LATENCY_BUCKETS[-1]}"
+
+
+# Entry point.
+if __name__ == '__main__':
+    main(ARGS.parse_args())
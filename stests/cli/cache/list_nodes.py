@@ -32,7 +32,7 @@ def main(args):
     if network is None:
         logger.log_warning(f"Network {args.network} is unregistered.")
         return
-    data = cache.infra.get_nodes(network_id)
+    data = list(cache.infra.get_nodes(network_id))
     if not data:
         logger.log_warning(f"Network {args.network} has no nodes.")
         return
@@ -35,6 +35,17 @@ ARGS.add_argument(
     type=args_validator.validate_run_index,
     )
 
+# Set: execution information fields pulled from cache - i.e. those displayed.
+_FIELDS = [
+    "aspect",
+    "phase_index",
+    "run_index",
+    "status",
+    "step_index",
+    "step_label",
+    "tp_duration",
+    "ts_start",
+]
 
 
 def main(args):
@@ -45,7 +56,11 @@ def main(args):
     """
     # Pull data.
     network_id = factory.create_network_id(args.network)
-    data = cache.orchestration.get_info_list(network_id, args.run_type, args.run_index)
+    data = list(cache.orchestration.get_info_list(network_id, args.run_type, args.run_index, _FIELDS))
+
+    # Fallback to archive if run has been evicted from cache.
+    if not data:
+        data = list(cache.archive.get_info_list(network_id, args.run_type, args.run_index))
     if not data:
         logger.log("No run information found.")
         return
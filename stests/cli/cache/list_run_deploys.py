@@ -1,9 +1,12 @@
 import argparse
+import itertools
+import typing
 
 from beautifultable import BeautifulTable
 
 from stests.cli.utils import get_table
 from stests.core import cache
+from stests.core.domain import Deploy
 from stests.core.utils import args_validator
 from stests.core.utils import factory
 from stests.core.utils import logger
@@ -46,6 +49,9 @@ COLS = [
     ("Block Hash", BeautifulTable.ALIGN_RIGHT),
 ]
 
+# Number of deploys rendered per table.
+PAGE_SIZE = 1000
+
 
 def main(args):
     """Entry point.
@@ -53,13 +59,42 @@ def main(args):
     :param args: Parsed CLI arguments.
 
     """
-    # Pull data.
+    # Pull data - streamed from cache.
     network_id = factory.create_network_id(args.network)
     data = cache.state.get_deploys(network_id, args.run_type, args.run_index)
-    if not data:
+
+    # Render in pages so that memory usage is independent of deploy count.
+    count = 0
+    for page in _get_pages(data):
+        _render(page)
+        count += len(page)
+
+    # Fallback to archive if run has been evicted from cache.
+    if not count:
+        for page in _get_pages(cache.archive.get_deploys(network_id, args.run_type, args.run_index)):
+            _render(page)
+            count += len(page)
+    if not count:
         logger.log("No run deploys found.")
         return
 
+    print(f"{network_id.name} - {args.run_type}  - Run {args.run_index} - deploys = {count}")
+
+
+def _get_pages(data: typing.Iterator[Deploy]) -> typing.Iterator[typing.List[Deploy]]:
+    """Yields pages of deploys ready to be rendered.
+    
+    """
+    page = list(itertools.islice(data, PAGE_SIZE))
+    while page:
+        yield page
+        page = list(itertools.islice(data, PAGE_SIZE))
+
+
+def _render(page: typing.List[Deploy]):
+    """Renders a page of deploys to stdout.
+    
+    """
     # Set table cols/rows.
     cols = [i for i, _ in COLS]
     rows = map(lambda i: [
@@ -70,7 +105,7 @@ def main(args):
         i.dispatch_ts,
         i.label_finalization_time,
         i.block_hash or "--"
-    ], sorted(data, key=lambda i: i.dispatch_ts))
+    ], sorted(page, key=lambda i: i.dispatch_ts))
 
     # Set table.
     t = get_table(cols, rows, max_width=1080)
@@ -81,7 +116,7 @@ def main(args):
 
     # Render.
     print(t)
-    print(f"{network_id.name} - {args.run_type}  - Run {args.run_index}")
+
 
 # Entry point.
 if __name__ == '__main__':
@@ -29,6 +29,16 @@ ARGS.add_argument(
     type=args_validator.validate_run_type,
     )
 
+# Set: execution information fields pulled from cache - i.e. those displayed.
+_FIELDS = [
+    "aspect",
+    "run_index",
+    "run_type",
+    "status",
+    "tp_duration",
+    "ts_start",
+]
+
 
 def main(args):
     """Entry point.
@@ -38,8 +48,13 @@ def main(args):
     """
     # Pull data.
     network_id = factory.create_network_id(args.network)
-    data = cache.orchestration.get_info_list(network_id, args.run_type)
+    data = cache.orchestration.get_info_list(network_id, args.run_type, fields=_FIELDS)
     data = [i for i in data if i.aspect == ExecutionAspect.RUN]
+
+    # Merge runs that have been evicted from cache to archive.
+    cached = {(i.run_type, i.run_index) for i in data}
+    data += [i for i in cache.archive.get_info_list(network_id, args.run_type)
+             if i.aspect == ExecutionAspect.RUN and (i.run_type, i.run_index) not in cached]
     if not data:
         logger.log("No run information found.")
         return    
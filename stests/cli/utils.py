@@ -1,5 +1,11 @@
+import time
+import typing
+
 from beautifultable import BeautifulTable
 
+from stests.core.cache.enums import StorePartition
+from stests.core.utils import logger
+
 
 
 def get_table(cols, rows, max_width=120) -> BeautifulTable:
@@ -22,4 +28,21 @@ def get_table(cols, rows, max_width=120) -> BeautifulTable:
     t.header_separator_char = '-'
     t.bottom_border_char = "-"
 
-    return t    
\ No newline at end of file
+    return t    
+
+
+def get_flush_progress_logger(interval: float = 1.0) -> typing.Callable[[StorePartition, int], None]:
+    """Returns a callback logging running counts of flushed keys - at most once per interval per partition.
+
+    :param interval: Minimum number of seconds between successive logs of a partition's progress.
+
+    """
+    logged = {}
+
+    def log_progress(partition: StorePartition, count: int):
+        now = time.monotonic()
+        if now - logged.get(partition, 0) >= interval:
+            logged[partition] = now
+            logger.log(f"{partition.name} - {count} keys flushed ...")
+
+    return log_progress
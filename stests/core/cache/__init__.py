@@ -1,18 +1,92 @@
+import concurrent.futures
+import functools
+import typing
+
 from stests.core.domain import NetworkIdentifier
 from stests.core.orchestration import ExecutionContext
+from stests.core.utils import keystore
 
 import stests.core.cache.ops_infra as infra
 import stests.core.cache.ops_monitoring as monitoring
 import stests.core.cache.ops_orchestration as orchestration
 import stests.core.cache.ops_state as state
+from stests.core.cache import archive
+from stests.core.cache import metrics
+from stests.core.cache import retention
+from stests.core.cache import stores
+from stests.core.cache import utils
+from stests.core.cache.batch import batch
+from stests.core.cache.enums import StorePartition
 
 
 
-def flush_by_run(ctx: ExecutionContext):
-    """Flushes all information pertaining to a run.
+def flush_by_run(
+    ctx: ExecutionContext,
+    on_progress: typing.Callable[[StorePartition, int], None] = None,
+    ) -> typing.Dict[StorePartition, int]:
+    """Flushes all information pertaining to a run - each partition is flushed in a single pass & in parallel.
 
     :param ctx: Execution context information.
+    :param on_progress: Callback invoked with (partition, running count of flushed keys) as keys are flushed.
+
+    :returns: Map: partition -> count of flushed keys.
+
+    """
+    counts = _flush_in_parallel({
+        partition: functools.partial(utils.flush, partition, list(module.flush_by_run.keypaths(ctx)))
+        for partition, module in archive.PARTITIONS
+    }, on_progress)
+
+    # Run account signing keys are no longer required - other hosts sweep theirs (see keystore.sweep).
+    keystore.flush_by_run(ctx.network, ctx.run_type, ctx.run_index)
+
+    return counts
+
+
+def flush_partitions(
+    partitions: typing.List[StorePartition],
+    on_progress: typing.Callable[[StorePartition, int], None] = None,
+    ) -> typing.Dict[StorePartition, int]:
+    """Flushes all information within a set of partitions - partitions are flushed in parallel.
+
+    :param partitions: Partitions to be flushed.
+    :param on_progress: Callback invoked with (partition, running count of flushed keys) as keys are flushed.
+
+    :returns: Map: partition -> count of flushed keys.
+
+    """
+    counts = _flush_in_parallel({
+        partition: functools.partial(utils.flush_partition, partition)
+        for partition in partitions
+    }, on_progress)
+
+    # Account signing keys are no longer required - other hosts sweep theirs (see keystore.sweep).
+    if StorePartition.STATE in partitions:
+        keystore.flush()
+
+    return counts
+
+
+def get_store_stats() -> dict:
+    """Returns statistics pertaining to the current process's cache connection pools.
+
+    :returns: Map: partition name -> pool statistics.
 
     """
-    for partition in (orchestration, state):
-        partition.flush_by_run(ctx)
+    return stores.get_stats()
+
+
+def _flush_in_parallel(
+    flushers: typing.Dict[StorePartition, typing.Callable],
+    on_progress: typing.Callable[[StorePartition, int], None] = None,
+    ) -> typing.Dict[StorePartition, int]:
+    """Invokes a flush function per partition - each within a worker thread.
+
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(flushers) or 1, thread_name_prefix="cache-flush") as executor:
+        futures = {
+            partition: executor.submit(flusher, on_progress and functools.partial(on_progress, partition))
+            for partition, flusher in flushers.items()
+        }
+
+    return {partition: future.result() for partition, future in futures.items()}
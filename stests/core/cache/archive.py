@@ -0,0 +1,271 @@
+import glob
+import gzip
+import json
+import os
+import typing
+from datetime import datetime
+
+import stests.core.cache.ops_orchestration as orchestration
+import stests.core.cache.ops_state as state
+from stests.core.cache import codecs
+from stests.core.cache import stores
+from stests.core.cache import utils
+from stests.core.cache.enums import StorePartition
+from stests.core.domain import Deploy
+from stests.core.domain import NetworkIdentifier
+from stests.core.orchestration import ExecutionContext
+from stests.core.orchestration import ExecutionInfo
+from stests.core.utils import encoder
+from stests.core.utils import env
+from stests.core.utils.exceptions import ArchiveVerificationError
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Directory within which run archives are written.
+    DIRECTORY = env.get_var('CACHE_ARCHIVE_DIRECTORY', os.path.join(os.path.expanduser("~"), ".stests", "archive"))
+
+    # Flag indicating whether runs are archived (& evicted from cache) upon completion.
+    ON_RUN_END = env.get_var('CACHE_ARCHIVE_ON_RUN_END', 1, int)
+
+
+# Partitions holding run scoped keys -> cache operations module declaring the run's keys (via flush_by_run).
+PARTITIONS = (
+    (StorePartition.ORCHESTRATION, orchestration),
+    (StorePartition.STATE, state),
+)
+
+# Archive file format version - written to each archive's header record.
+_FORMAT_VERSION = 1
+
+
+def archive_run(ctx: ExecutionContext, evict: bool = True) -> typing.Tuple[str, int]:
+    """Streams a run's cached keys into a gzip compressed JSON lines file, verifies it & then evicts the keys.
+
+    :param ctx: Execution context information.
+    :param evict: Flag indicating whether archived keys are to be evicted from cache.
+
+    :returns: 2 member tuple: archive file path, count of archived keys.
+
+    """
+    encoder.initialise()
+    fpath = get_path(ctx.network, ctx.run_type, ctx.run_index)
+
+    # Write to a temporary file so that readers never observe a partial archive.
+    os.makedirs(os.path.dirname(fpath), exist_ok=True)
+    fpath_tmp = f"{fpath}.tmp"
+    try:
+        with gzip.open(fpath_tmp, "wt", encoding="utf-8") as fstream:
+            fstream.write(_to_line({
+                "archive": {
+                    "network": ctx.network,
+                    "run_index": ctx.run_index,
+                    "run_type": ctx.run_type,
+                    "ts_archived": datetime.now().timestamp(),
+                    "version": _FORMAT_VERSION,
+                }
+            }))
+            count = 0
+            for record in _iter_run_records(ctx):
+                fstream.write(_to_line(record))
+                count += 1
+
+        # Verify that archive decompresses & parses in full.
+        if sum(1 for _ in iter_records(fpath_tmp)) != count:
+            raise ArchiveVerificationError(f"Archive record count mismatch: {fpath_tmp}")
+
+    except Exception:
+        if os.path.exists(fpath_tmp):
+            os.unlink(fpath_tmp)
+        raise
+
+    os.replace(fpath_tmp, fpath)
+
+    # Evict - imported upon use as the cache package imports this module.
+    if evict:
+        from stests.core import cache
+        cache.flush_by_run(ctx)
+
+    return fpath, count
+
+
+def get_context(network: str, run_index: int, run_type: str) -> typing.Optional[ExecutionContext]:
+    """Returns archived domain object: ExecutionContext.
+
+    :param network: Name of network being tested.
+    :param run_index: Generator run index.
+    :param run_type: Generator run type, e.g. wg-100.
+
+    :returns: Archived run context information - none if run is unarchived.
+
+    """
+    for fpath in get_paths(network, run_type, run_index):
+        for record in iter_records(fpath, StorePartition.ORCHESTRATION):
+            if _get_collection(record["key"]) == "context":
+                return encoder.decode(record["value"])
+
+
+def get_deploys(network_id: NetworkIdentifier, run_type: str = None, run_index: int = None) -> typing.Iterator[Deploy]:
+    """Yields archived domain objects: Deploy.
+
+    :param network_id: A network identifier.
+    :param run_type: Type of run that was executed - if unspecified then all runs are read.
+    :param run_index: Index of a run - if unspecified then all runs of a type are read.
+
+    :returns: Generator of archived deploys.
+
+    """
+    for fpath in get_paths(network_id.name, run_type, run_index):
+        for record in iter_records(fpath, StorePartition.STATE):
+            if _get_collection(record["key"]) == "deploy":
+                yield encoder.decode(record["value"])
+
+
+def get_info_list(
+    network_id: NetworkIdentifier,
+    run_type: str = None,
+    run_index: int = None,
+    fields: typing.List[str] = None,
+    ) -> typing.Iterator[ExecutionInfo]:
+    """Yields archived domain objects: ExecutionInfo.
+
+    :param network_id: A network identifier.
+    :param run_type: Type of run that was executed - if unspecified then all runs are read.
+    :param run_index: Index of a run - if unspecified then all runs of a type are read.
+    :param fields: Unused - archived information is always complete - declared for parity with cache.orchestration.get_info_list.
+
+    :returns: Generator of archived execution information.
+
+    """
+    for fpath in get_paths(network_id.name, run_type, run_index):
+        for record in iter_records(fpath, StorePartition.ORCHESTRATION):
+            if _get_collection(record["key"]) == "info":
+                yield encoder.decode(record["value"])
+
+
+def get_path(network: str, run_type: str, run_index: int) -> str:
+    """Returns path to a run's archive file.
+
+    :param network: Name of network being tested.
+    :param run_type: Type of run that was executed.
+    :param run_index: Index of a run.
+
+    :returns: Path to archive file.
+
+    """
+    return _get_path(network, run_type, f"R-{str(run_index).zfill(3)}")
+
+
+def get_paths(network: str, run_type: str = None, run_index: int = None) -> typing.List[str]:
+    """Returns paths to archive files matching a run filter.
+
+    :param network: Name of network being tested.
+    :param run_type: Type of run that was executed - if unspecified then all run types are matched.
+    :param run_index: Index of a run - if unspecified then all runs are matched.
+
+    :returns: Sorted paths to archive files.
+
+    """
+    run_index_label = f"R-{str(run_index).zfill(3)}" if run_index else "R-*"
+
+    return sorted(glob.glob(_get_path(network, run_type or "*", run_index_label)))
+
+
+def iter_records(fpath: str, partition: StorePartition = None) -> typing.Iterator[dict]:
+    """Yields records within an archive file - header record excepted.
+
+    :param fpath: Path to archive file.
+    :param partition: Partition whose records are to be yielded - if unspecified then all records are yielded.
+
+    :returns: Generator of archived records.
+
+    """
+    with gzip.open(fpath, "rt", encoding="utf-8") as fstream:
+        for line in fstream:
+            record = json.loads(line)
+            if "archive" in record:
+                continue
+            if partition is None or record["partition"] == partition.name:
+                yield record
+            # Records are grouped by partition, hence escape once past the partition of interest.
+            elif _is_past(record["partition"], partition):
+                return
+
+
+def _get_collection(key: str) -> str:
+    """Returns collection to which an archived key belongs.
+
+    """
+    return key.split(":{")[0].split(":")[-1]
+
+
+def _get_path(network: str, run_type: str, run_index_label: str) -> str:
+    """Returns path to an archive file (or a glob pattern if any segment is a wildcard).
+
+    """
+    return os.path.join(EnvVars.DIRECTORY, network, run_type, f"{run_index_label}.jsonl.gz")
+
+
+def _is_past(partition_name: str, partition: StorePartition) -> bool:
+    """Returns flag indicating whether a record's partition is archived after the partition of interest.
+
+    """
+    order = [i.name for i, _ in PARTITIONS]
+
+    return order.index(partition_name) > order.index(partition.name)
+
+
+def _iter_run_records(ctx: ExecutionContext) -> typing.Iterator[dict]:
+    """Yields a run's cached keys as archive records - grouped by partition.
+
+    """
+    for partition, module in PARTITIONS:
+        with stores.get_store(partition) as store:
+            for keys in utils.iter_keys(partition, module.flush_by_run.keypaths(ctx)):
+                yield from _pull_records(store, partition, keys)
+
+
+def _pull_records(store: typing.Any, partition: StorePartition, keys: typing.List[bytes]) -> typing.Iterator[dict]:
+    """Yields archive records of a chunk of keys - pulled in two round trips (key types, values).
+
+    """
+    pipeline = store.pipeline(transaction=False)
+    for key in keys:
+        pipeline.type(key)
+    types = [i.decode("utf-8") if isinstance(i, bytes) else i for i in pipeline.execute()]
+
+    pipeline = store.pipeline(transaction=False)
+    for key, typeof in zip(keys, types):
+        if typeof == "hash":
+            pipeline.hgetall(key)
+        else:
+            pipeline.get(key)
+
+    # Keys may have been deleted between scan & pull.
+    for key, typeof, value in zip(keys, types, pipeline.execute()):
+        if not value:
+            continue
+        yield {
+            "key": key.decode("utf-8"),
+            "partition": partition.name,
+            "type": typeof,
+            "value": _decode_value(typeof, value),
+        }
+
+
+def _decode_value(typeof: str, value: typing.Any) -> typing.Any:
+    """Returns a cached value decoded in readiness for archival - i.e. codec independent JSON.
+
+    """
+    if typeof == "hash":
+        return {k.decode("utf-8"): json.loads(v) for k, v in value.items()}
+
+    return codecs.decode(value)
+
+
+def _to_line(record: dict) -> str:
+    """Returns an archive record as a line of JSON.
+
+    """
+    return json.dumps(record, separators=(",", ":")) + "\n"
@@ -0,0 +1,125 @@
+import contextlib
+import threading
+import typing
+
+from stests.core.cache.enums import StoreOperation
+from stests.core.cache.enums import StorePartition
+from stests.core.cache import metrics
+from stests.core.cache import stores
+
+
+
+# Thread local storage used to track a thread's active batch (dramatiq workers are threaded).
+_LOCAL = threading.local()
+
+
+class CacheBatchResult():
+    """A deferred result of a batched cache operation - resolved lazily upon first access.
+
+    """
+    def __init__(self, batch: "CacheBatch", decoder: typing.Callable):
+        """Constructor.
+
+        :param batch: Batch within which the operation was queued.
+        :param decoder: Function to apply to raw store response.
+
+        """
+        self._batch = batch
+        self._decoder = decoder
+        self._is_resolved = False
+        self._value = None
+
+    @property
+    def value(self) -> typing.Any:
+        """Operation result - accessing it flushes the associated batch if necessary."""
+        if not self._is_resolved:
+            self._batch.execute()
+
+        # Results resolved in stages (e.g. via a pointer) are chained.
+        if isinstance(self._value, CacheBatchResult):
+            return self._value.value
+
+        return self._value
+
+
+    def resolve(self, raw: typing.Any):
+        """Sets operation result from a raw store response.
+
+        """
+        self._value = self._decoder(raw) if self._decoder else raw
+        self._is_resolved = True
+
+
+class CacheBatch():
+    """A set of cache operations dispatched to the store as one pipeline per partition.
+
+    """
+    def __init__(self):
+        """Constructor.
+
+        """
+        # Map: partition -> queued (command, result) pairs.
+        self.operations: typing.Dict[StorePartition, typing.List[typing.Tuple[typing.Callable, CacheBatchResult]]] = {}
+
+
+    def enqueue(self, partition: StorePartition, command: typing.Callable, decoder: typing.Callable = None) -> CacheBatchResult:
+        """Queues an operation for subsequent dispatch.
+
+        :param partition: Partition against which operation will be executed.
+        :param command: Function that queues a command upon a pipeline.
+        :param decoder: Function to apply to raw store response.
+
+        :returns: A deferred operation result.
+
+        """
+        result = CacheBatchResult(self, decoder)
+        self.operations.setdefault(partition, []).append((command, result))
+
+        return result
+
+
+    def execute(self):
+        """Dispatches queued operations - one round trip per partition.
+
+        Decoders may queue subsequent operations (e.g. pulling items via pointers), hence dispatch continues until none remain.
+
+        """
+        while self.operations:
+            operations, self.operations = self.operations, {}
+            for partition, queued in operations.items():
+                with metrics.measure(partition, StoreOperation.BATCH, metrics.ANY_COLLECTION):
+                    with stores.get_store(partition) as store:
+                        pipeline = store.pipeline(transaction=False)
+                        for command, _ in queued:
+                            command(pipeline)
+                        for (_, result), raw in zip(queued, pipeline.execute()):
+                            result.resolve(raw)
+
+
+@contextlib.contextmanager
+def batch() -> typing.Generator[CacheBatch, None, None]:
+    """Context manager within which cache operations are pipelined.
+
+    Reads return a CacheBatchResult whose value is resolved lazily (wildcard reads execute immediately),
+    writes are dispatched upon exit.
+    Nested usage joins the outermost batch.
+
+    """
+    active = get_active()
+    if active is not None:
+        yield active
+        return
+
+    _LOCAL.batch = CacheBatch()
+    try:
+        yield _LOCAL.batch
+        _LOCAL.batch.execute()
+    finally:
+        _LOCAL.batch = None
+
+
+def get_active() -> typing.Optional[CacheBatch]:
+    """Returns the calling thread's active batch (if any).
+
+    """
+    return getattr(_LOCAL, "batch", None)
@@ -0,0 +1,120 @@
+import json
+import typing
+import zlib
+
+from stests.core.utils import env
+from stests.core.utils.exceptions import InvalidEnvironmentVariable
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Codec applied when writing to cache: JSON | JSON_ZLIB | MSGPACK | MSGPACK_ZLIB.
+    CODEC = env.get_var('CACHE_CODEC', "JSON")
+
+    # zlib compression level applied by compressing codecs.
+    CODEC_ZLIB_LEVEL = env.get_var('CACHE_CODEC_ZLIB_LEVEL', 6, int)
+
+
+# Header bytes prefixed to encoded values - chosen so as not to collide with the first byte of a legacy JSON document.
+HEADER_JSON = b"\x01"
+HEADER_JSON_ZLIB = b"\x02"
+HEADER_MSGPACK = b"\x03"
+HEADER_MSGPACK_ZLIB = b"\x04"
+
+
+def _from_json(payload: bytes) -> typing.Any:
+    return json.loads(payload)
+
+
+def _from_msgpack(payload: bytes) -> typing.Any:
+    if msgpack is None:
+        raise ImportError("msgpack must be installed in order to decode msgpack encoded cache items.")
+    return msgpack.unpackb(payload, raw=False)
+
+
+def _to_json(obj: typing.Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _to_msgpack(obj: typing.Any) -> bytes:
+    return msgpack.packb(obj, use_bin_type=True)
+
+
+def _compress(payload: bytes) -> bytes:
+    return zlib.compress(payload, EnvVars.CODEC_ZLIB_LEVEL)
+
+
+# Map: codec name -> (header, encoder).
+ENCODERS = {
+    "JSON": (HEADER_JSON, _to_json),
+    "JSON_ZLIB": (HEADER_JSON_ZLIB, lambda obj: _compress(_to_json(obj))),
+    "MSGPACK": (HEADER_MSGPACK, _to_msgpack),
+    "MSGPACK_ZLIB": (HEADER_MSGPACK_ZLIB, lambda obj: _compress(_to_msgpack(obj))),
+}
+
+# Map: header -> decoder.
+DECODERS = {
+    HEADER_JSON: _from_json,
+    HEADER_JSON_ZLIB: lambda payload: _from_json(zlib.decompress(payload)),
+    HEADER_MSGPACK: _from_msgpack,
+    HEADER_MSGPACK_ZLIB: lambda payload: _from_msgpack(zlib.decompress(payload)),
+}
+
+
+def decode(value: typing.Union[bytes, str]) -> typing.Any:
+    """Decodes a cached value - dispatching upon it's header byte.
+
+    :param value: A value pulled from cache.
+
+    :returns: Decoded (but not yet domain typed) data.
+
+    """
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+
+    # Values written prior to codec headers are indented JSON documents.
+    try:
+        decoder = DECODERS[value[:1]]
+    except KeyError:
+        return json.loads(value)
+    else:
+        return decoder(value[1:])
+
+
+def encode(obj: typing.Any, codec: str = None) -> bytes:
+    """Encodes data in readiness for caching.
+
+    :param obj: Data to be encoded (output of encoder.encode).
+    :param codec: Name of codec to apply - defaults to that declared by env-var.
+
+    :returns: Header prefixed encoded data.
+
+    """
+    header, encoder = get_encoder(codec or EnvVars.CODEC)
+
+    return header + encoder(obj)
+
+
+def get_encoder(codec: str) -> typing.Tuple[bytes, typing.Callable]:
+    """Returns a codec's header & encoding function.
+
+    :param codec: Name of codec to apply.
+
+    :returns: 2 member tuple: header, encoding function.
+
+    """
+    try:
+        header, encoder = ENCODERS[codec.upper()]
+    except KeyError:
+        raise InvalidEnvironmentVariable("CACHE_CODEC", codec, sorted(ENCODERS))
+
+    if header in (HEADER_MSGPACK, HEADER_MSGPACK_ZLIB) and msgpack is None:
+        raise InvalidEnvironmentVariable("CACHE_CODEC", codec, "msgpack package must be installed")
+
+    return header, encoder
@@ -6,6 +6,9 @@ class StoreOperation(enum.Enum):
     """Enumeration over types of cache operation.
     
     """
+    # Dispatch a pipeline of batched operations.
+    BATCH = enum.auto()
+
     # Delete a key.
     DELETE = enum.auto()
 
@@ -15,21 +18,51 @@ class StoreOperation(enum.Enum):
     # Get cached item.
     GET = enum.auto()
 
-    # Get count of cached item.
+    # Get a count held within a counter hash.
     GET_COUNT = enum.auto()
 
+    # Get value of a counter - zero if not cached.
+    GET_COUNTER = enum.auto()
+
+    # Get cached item held as a hash of fields.
+    GET_HASH = enum.auto()
+
+    # Get cached items held as hashes of fields lazily.
+    GET_HASH_ITER = enum.auto()
+
+    # Get cached item via a secondary index pointer.
+    GET_INDEXED = enum.auto()
+
+    # Get cached items lazily.
+    GET_ITER = enum.auto()
+
     # Atomically increment a counter.
     INCR = enum.auto()
 
+    # Atomically increment a set of counts held within a counter hash.
+    INCR_COUNTS = enum.auto()
+
     # Atomically set a lock.
     LOCK = enum.auto()
 
     # Set an item.
     SET = enum.auto()
 
+    # Set a count held within a counter hash.
+    SET_COUNT = enum.auto()
+
+    # Set an item as a hash of fields.
+    SET_HASH = enum.auto()
+
+    # Atomically set status, end timestamp & duration of an item held as a hash of fields.
+    SET_HASH_END = enum.auto()
+
     # Set cached item plus flag indicating whether it already was cached.
     SET_SINGLETON = enum.auto()
 
+    # Set cached item plus a secondary index pointer to it.
+    SET_INDEXED = enum.auto()
+
 
 class StorePartition(enum.Enum):
     """Enumeration over set of types of store partition.
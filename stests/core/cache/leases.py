@@ -0,0 +1,139 @@
+import contextlib
+import threading
+import time
+import typing
+import uuid
+
+from stests.core.cache import scripts
+from stests.core.cache import stores
+from stests.core.cache.enums import StorePartition
+from stests.core.orchestration import BlockLock
+from stests.core.orchestration import RunLock
+from stests.core.orchestration import StreamLock
+from stests.core.utils import env
+from stests.core.utils import logger
+from stests.core.utils.exceptions import LeaseLostError
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Seconds after which an unreleased finalized block lock expires.
+    TTL_BLOCK = env.get_var('CACHE_LOCK_TTL_BLOCK', 3600, int)
+
+    # Seconds after which an unreleased run/phase/step lock expires.
+    TTL_EXECUTION = env.get_var('CACHE_LOCK_TTL_EXECUTION', 86400, int)
+
+    # Seconds after which an unrenewed stream lock expires - i.e. upper bound upon recovery of a dead stream consumer.
+    TTL_STREAM = env.get_var('CACHE_LOCK_TTL_STREAM', 15, int)
+
+
+class Lease():
+    """A lock held for a limited period of time by an owner identified by a unique token.
+
+    """
+    def __init__(self, partition: StorePartition, key: str, value: bytes, ttl: int):
+        """Constructor.
+
+        :param partition: Partition within which lock is held.
+        :param key: Lock key.
+        :param value: Encoded lock value - embeds owner token hence unique to owner.
+        :param ttl: Lease duration in seconds.
+
+        """
+        self.key = key
+        self.partition = partition
+        self.ttl = ttl
+        self.value = value
+
+        # Set once renewal detects that the lease has been lost.
+        self.lost = threading.Event()
+
+
+    def release(self) -> bool:
+        """Releases lease - only if still held by owner.
+
+        :returns: Flag indicating whether lease was released.
+
+        """
+        with stores.get_store(self.partition) as store:
+            release = store.register_script(scripts.RELEASE_LEASE)
+            return bool(release(keys=[self.key], args=[self.value], client=store))
+
+
+    def renew(self) -> bool:
+        """Renews lease - only if still held by owner.
+
+        :returns: Flag indicating whether lease was renewed.
+
+        """
+        with stores.get_store(self.partition) as store:
+            renew = store.register_script(scripts.RENEW_LEASE)
+            return bool(renew(keys=[self.key], args=[self.value, self.ttl * 1000], client=store))
+
+
+    def verify(self):
+        """Verifies lease has not been lost - long-lived lock holders invoke this so as to stop work once lost.
+
+        """
+        if self.lost.is_set():
+            raise LeaseLostError(f"Lease lost: {self.key}")
+
+
+    @contextlib.contextmanager
+    def renewal(self) -> typing.Generator["Lease", None, None]:
+        """Context manager within which lease is renewed in background - for long-lived lock holders.
+
+        If renewal fails then the lease is flagged as lost, see verify.
+
+        """
+        stopped = threading.Event()
+
+        def renew():
+            ts_renewed = time.monotonic()
+            while not stopped.wait(self.ttl / 3):
+                try:
+                    if self.renew():
+                        ts_renewed = time.monotonic()
+                        continue
+                    logger.log_warning(f"CACHE :: lease lost :: {self.key}")
+                except Exception as err:
+                    logger.log_warning(f"CACHE :: lease renewal error :: {self.key} :: {err}")
+                    # Lease is retained until it expires.
+                    if time.monotonic() - ts_renewed < self.ttl:
+                        continue
+                self.lost.set()
+                return
+
+        renewer = threading.Thread(target=renew, name=f"lease-renewal:{self.key}", daemon=True)
+        renewer.start()
+        try:
+            yield self
+        finally:
+            stopped.set()
+            renewer.join()
+
+
+def create_token() -> str:
+    """Returns a token unique to a lease owner.
+
+    """
+    return uuid.uuid4().hex
+
+
+def get_ttl(lock: typing.Any) -> int:
+    """Returns lease duration in seconds of a lock.
+
+    :param lock: Lock information.
+
+    :returns: Lease duration.
+
+    """
+    if isinstance(lock, StreamLock):
+        return EnvVars.TTL_STREAM
+    if isinstance(lock, BlockLock):
+        return EnvVars.TTL_BLOCK
+    if isinstance(lock, RunLock):
+        return EnvVars.TTL_EXECUTION
+
+    raise TypeError(f"Unsupported lock type: {type(lock)}")
@@ -0,0 +1,403 @@
+import atexit
+import contextlib
+import contextvars
+import dataclasses
+import os
+import threading
+import time
+import typing
+
+from stests.core.cache import stores
+from stests.core.cache.enums import StoreOperation
+from stests.core.cache.enums import StorePartition
+from stests.core.utils import env
+from stests.core.utils import logger
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Flag indicating whether cache operations are instrumented.
+    ENABLED = env.get_var('CACHE_METRICS', 1, int)
+
+    # Seconds between successive flushes of a process's aggregated metrics to cache.
+    FLUSH_INTERVAL = env.get_var('CACHE_METRICS_FLUSH_INTERVAL', 30, float)
+
+
+# Upper bounds (in milliseconds) of latency histogram buckets - a final bucket holds slower operations.
+LATENCY_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+# Collection label of operations spanning collections, e.g. batch pipelines.
+ANY_COLLECTION = "*"
+
+# Keypath of aggregated metrics within monitoring partition.
+_KEYPATH = "cache-metrics"
+
+
+@dataclasses.dataclass
+class OperationMetrics:
+    """Metrics aggregated over calls to a cache operation upon a collection.
+
+    """
+    # Partition against which operation is executed.
+    partition: str
+
+    # Type of cache operation.
+    operation: str
+
+    # Collection upon which operation is executed - i.e. first segment of keypath.
+    collection: str
+
+    # Number of calls.
+    count: int = 0
+
+    # Total latency (in seconds) of calls.
+    latency: float = 0.0
+
+    # Number of calls per latency bucket.
+    histogram: typing.List[int] = dataclasses.field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+
+    # Number of encoded bytes written to cache.
+    bytes_encoded: int = 0
+
+    # Number of encoded bytes read from cache.
+    bytes_decoded: int = 0
+
+    # Number of keys matched by scans.
+    keys_scanned: int = 0
+
+    # Number of items returned.
+    keys_returned: int = 0
+
+    @property
+    def latency_avg(self) -> float:
+        return self.latency / self.count if self.count else 0.0
+
+
+    def get_percentile(self, percentile: float) -> typing.Optional[float]:
+        """Returns upper bound (in milliseconds) of the latency bucket within which a percentile falls - none if unbounded.
+
+        :param percentile: Percentile (0 -> 1) of interest.
+
+        """
+        threshold = percentile * self.count
+        running = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.histogram):
+            running += count
+            if running >= threshold:
+                return bound
+
+
+class _Accumulator():
+    """Byte & key counts accumulated by a single call to a cache operation.
+
+    """
+    __slots__ = ("bytes_encoded", "bytes_decoded", "keys_scanned", "keys_returned")
+
+    def __init__(self):
+        self.bytes_encoded = 0
+        self.bytes_decoded = 0
+        self.keys_scanned = 0
+        self.keys_returned = 0
+
+
+# Accumulator of the cache operation being executed within the current context (if any).
+_ACTIVE: contextvars.ContextVar = contextvars.ContextVar("cache_metrics", default=None)
+
+# Map: (partition, operation, collection) -> metrics aggregated since last flush (scoped to current process).
+_METRICS: typing.Dict[typing.Tuple[str, str, str], OperationMetrics] = {}
+
+# Guards aggregated metrics across worker threads.
+_METRICS_LOCK = threading.Lock()
+
+# Identifier of process within which the flusher thread was started - used to detect forks.
+_FLUSHER_PID: int = None
+
+
+@contextlib.contextmanager
+def measure(partition: StorePartition, operation: StoreOperation, collection: str) -> typing.Generator[None, None, None]:
+    """Context manager measuring a call to a cache operation.
+
+    :param partition: Partition against which operation is executed.
+    :param operation: Type of cache operation.
+    :param collection: Collection upon which operation is executed.
+
+    """
+    if not EnvVars.ENABLED:
+        yield
+        return
+
+    accumulator = _Accumulator()
+    token = _ACTIVE.set(accumulator)
+    ts_start = time.perf_counter()
+    try:
+        yield
+    finally:
+        latency = time.perf_counter() - ts_start
+        _ACTIVE.reset(token)
+        _aggregate(partition, operation, collection, accumulator, latency)
+
+
+def measure_iter(
+    partition: StorePartition,
+    operation: StoreOperation,
+    collection: str,
+    iterator: typing.Iterator[typing.Any],
+    ) -> typing.Iterator[typing.Any]:
+    """Yields items of an iterator over a cache operation's results - measuring time spent within the iterator only.
+
+    :param partition: Partition against which operation is executed.
+    :param operation: Type of cache operation.
+    :param collection: Collection upon which operation is executed.
+    :param iterator: Iterator to be measured.
+
+    """
+    if not EnvVars.ENABLED:
+        yield from iterator
+        return
+
+    accumulator = _Accumulator()
+    latency = 0.0
+    try:
+        while True:
+            # Context is only set whilst the iterator executes, i.e. never across a yield.
+            token = _ACTIVE.set(accumulator)
+            ts_start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                latency += time.perf_counter() - ts_start
+                _ACTIVE.reset(token)
+            yield item
+    finally:
+        _aggregate(partition, operation, collection, accumulator, latency)
+
+
+async def measure_aiter(
+    partition: StorePartition,
+    operation: StoreOperation,
+    collection: str,
+    iterator: typing.AsyncIterator[typing.Any],
+    ) -> typing.AsyncIterator[typing.Any]:
+    """Yields items of an async iterator over a cache operation's results - asyncio variant of measure_iter.
+
+    """
+    if not EnvVars.ENABLED:
+        async for item in iterator:
+            yield item
+        return
+
+    accumulator = _Accumulator()
+    latency = 0.0
+    try:
+        while True:
+            token = _ACTIVE.set(accumulator)
+            ts_start = time.perf_counter()
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                latency += time.perf_counter() - ts_start
+                _ACTIVE.reset(token)
+            yield item
+    finally:
+        _aggregate(partition, operation, collection, accumulator, latency)
+
+
+def on_decoded(size: int):
+    """Records bytes read from cache by the active operation.
+
+    :param size: Number of encoded bytes decoded into a returned item.
+
+    """
+    accumulator = _ACTIVE.get()
+    if accumulator is not None:
+        accumulator.bytes_decoded += size
+        accumulator.keys_returned += 1
+
+
+def on_encoded(size: int):
+    """Records bytes written to cache by the active operation.
+
+    :param size: Number of encoded bytes.
+
+    """
+    accumulator = _ACTIVE.get()
+    if accumulator is not None:
+        accumulator.bytes_encoded += size
+
+
+def on_scanned(count: int):
+    """Records keys matched by a scan performed by the active operation.
+
+    :param count: Number of matched keys.
+
+    """
+    accumulator = _ACTIVE.get()
+    if accumulator is not None:
+        accumulator.keys_scanned += count
+
+
+def flush():
+    """Flushes metrics aggregated by current process to cache - counters are incremented so that processes aggregate.
+
+    """
+    with _METRICS_LOCK:
+        pending = list(_METRICS.values())
+        _METRICS.clear()
+    if not pending:
+        return
+
+    with stores.get_store(StorePartition.MONITORING) as store:
+        pipeline = store.pipeline(transaction=False)
+        for metrics in pending:
+            key = _get_key(metrics.partition, metrics.operation, metrics.collection)
+            for field, value in _get_counters(metrics).items():
+                if value:
+                    pipeline.hincrby(key, field, value)
+            pipeline.hincrbyfloat(key, "latency", metrics.latency)
+        pipeline.execute()
+
+
+def get_metrics() -> typing.List[OperationMetrics]:
+    """Returns metrics aggregated across processes since last reset.
+
+    :returns: Metrics per (partition, operation, collection).
+
+    """
+    with stores.get_store(StorePartition.MONITORING) as store:
+        keys = list(store.scan_iter(match=_get_key("*"), count=1000))
+        pipeline = store.pipeline(transaction=False)
+        for key in keys:
+            pipeline.hgetall(key)
+
+        # Keys may have been deleted between scan & pull.
+        return [_decode_metrics(k.decode("utf-8"), v) for k, v in zip(keys, pipeline.execute()) if v]
+
+
+def reset_metrics() -> int:
+    """Deletes metrics aggregated across processes.
+
+    :returns: Count of deleted keys.
+
+    """
+    with stores.get_store(StorePartition.MONITORING) as store:
+        # Metrics keys span cluster slots, hence are unlinked one by one within a pipeline.
+        pipeline = store.pipeline(transaction=False)
+        for key in store.scan_iter(match=_get_key("*"), count=1000):
+            pipeline.unlink(key)
+
+        return sum(pipeline.execute())
+
+
+def _aggregate(partition: StorePartition, operation: StoreOperation, collection: str, accumulator: _Accumulator, latency: float):
+    """Aggregates a measured call to a cache operation.
+
+    """
+    _start_flusher()
+
+    latency_ms = latency * 1000
+    bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS) if latency_ms <= bound), len(LATENCY_BUCKETS))
+
+    key = (partition.name, operation.name, collection)
+    with _METRICS_LOCK:
+        try:
+            metrics = _METRICS[key]
+        except KeyError:
+            metrics = _METRICS[key] = OperationMetrics(*key)
+        metrics.count += 1
+        metrics.latency += latency
+        metrics.histogram[bucket] += 1
+        metrics.bytes_encoded += accumulator.bytes_encoded
+        metrics.bytes_decoded += accumulator.bytes_decoded
+        metrics.keys_scanned += accumulator.keys_scanned
+        metrics.keys_returned += accumulator.keys_returned
+
+
+def _decode_metrics(key: str, fields: typing.Dict[bytes, bytes]) -> OperationMetrics:
+    """Returns metrics decoded from a cached hash.
+
+    """
+    fields = {k.decode("utf-8"): v for k, v in fields.items()}
+    partition, operation, collection = key.split(f"{_KEYPATH}:", 1)[-1].split(":", 2)
+
+    return OperationMetrics(
+        partition=partition,
+        operation=operation,
+        collection=collection,
+        count=int(fields.get("count", 0)),
+        latency=float(fields.get("latency", 0)),
+        histogram=[int(fields.get(f"latency_le_{i}", 0)) for i in _get_bucket_labels()],
+        bytes_encoded=int(fields.get("bytes_encoded", 0)),
+        bytes_decoded=int(fields.get("bytes_decoded", 0)),
+        keys_scanned=int(fields.get("keys_scanned", 0)),
+        keys_returned=int(fields.get("keys_returned", 0)),
+    )
+
+
+def _get_key(*segments: str) -> str:
+    """Returns key of (or pattern matching) aggregated metrics within monitoring partition.
+
+    """
+    return stores.get_key_prefix(StorePartition.MONITORING) + ":".join([_KEYPATH, *segments])
+
+
+def _get_bucket_labels() -> typing.List[str]:
+    """Returns labels of latency histogram buckets.
+
+    """
+    return [str(i) for i in LATENCY_BUCKETS] + ["inf"]
+
+
+def _get_counters(metrics: OperationMetrics) -> typing.Dict[str, int]:
+    """Returns integer counters to be incremented when flushing metrics.
+
+    """
+    return {
+        "count": metrics.count,
+        "bytes_encoded": metrics.bytes_encoded,
+        "bytes_decoded": metrics.bytes_decoded,
+        "keys_scanned": metrics.keys_scanned,
+        "keys_returned": metrics.keys_returned,
+        **{f"latency_le_{i}": j for i, j in zip(_get_bucket_labels(), metrics.histogram)},
+    }
+
+
+def _start_flusher():
+    """Starts (once per process) a background thread periodically flushing aggregated metrics.
+
+    """
+    global _FLUSHER_PID
+
+    if _FLUSHER_PID == os.getpid():
+        return
+
+    with _METRICS_LOCK:
+        if _FLUSHER_PID == os.getpid():
+            return
+        # Metrics aggregated by a parent process are flushed by the parent.
+        _METRICS.clear()
+        _FLUSHER_PID = os.getpid()
+
+    def flush_periodically():
+        while True:
+            time.sleep(EnvVars.FLUSH_INTERVAL)
+            try:
+                flush()
+            except Exception as err:
+                logger.log_warning(f"CACHE :: metrics flush error :: {err}")
+
+    threading.Thread(target=flush_periodically, name="cache-metrics-flusher", daemon=True).start()
+
+
+# Metrics aggregated since the last periodic flush are flushed upon exit.
+@atexit.register
+def _flush_at_exit():
+    if _FLUSHER_PID == os.getpid():
+        try:
+            flush()
+        except Exception:
+            pass
@@ -1,8 +1,9 @@
-import random
 import typing
 
+from stests.core.cache.batch import batch
 from stests.core.cache.enums import StoreOperation
 from stests.core.cache.enums import StorePartition
+from stests.core.cache.utils import aio_variant_of
 from stests.core.cache.utils import cache_op
 from stests.core.domain import *
 from stests.core.orchestration import *
@@ -53,6 +54,14 @@ def get_network_by_name(name: str) -> Network:
     return get_network(factory.create_network_id(name))
 
 
+@aio_variant_of(get_network_by_name)
+async def _get_network_by_name_aio(name: str) -> Network:
+    """Asyncio variant of get_network_by_name.
+
+    """
+    return await get_network.aio(factory.create_network_id(name))
+
+
 @cache_op(StorePartition.INFRA, StoreOperation.GET)
 def get_networks() -> typing.List[Network]:
     """Decaches domain objects: Network.
@@ -79,55 +88,29 @@ def get_node(node_id: NodeIdentifier) -> Node:
     ]
 
 
-def get_node_by_network_id(network_id: NetworkIdentifier) -> Node:
-    """Decaches domain object: Node.
-    
-    :param network_id: A network identifier.
-
-    :returns: A registered node selected at random from a network's nodeset.
-
-    """
-    # Pull operational nodeset.
-    nodeset = get_nodes_operational(network_id) 
-    if not nodeset:
-        raise ValueError(f"Network {network_id.name} has no registered operational nodes.")
-
-    # Select random node.
-    return random.choice(nodeset)
-    
-
-def get_node_by_run_context(ctx: ExecutionContext) -> Node:
-    """Decaches domain object: Node.
+@cache_op(StorePartition.INFRA, StoreOperation.GET)
+def get_node_health(node_id: NodeIdentifier) -> NodeHealth:
+    """Decaches domain object: NodeHealth.
     
-    :param ctx: Execution context information.
+    :param node_id: A node identifier.
 
-    :returns: A registered node.
+    :returns: Node health statistics.
 
     """
-    # Pull operational nodes.
-    network_id = factory.create_network_id(ctx.network)
-    nodeset = get_nodes_operational(network_id)
-    if not nodeset:
-        raise ValueError(f"Network {network_id.name} has no registered operational nodes.")
-    
-    # Select random if node index unspecified.
-    if ctx.node_index <= 0 or ctx.node_index is None:
-        return random.choice(nodeset)
-
-    # Select specific with fallback to random.
-    try:
-        return nodeset[ctx.node_index - 1]
-    except IndexError:
-        return random.choice(nodeset)
+    return [
+        "node-health",
+        node_id.network.name,
+        f"N-{str(node_id.index).zfill(4)}"
+    ]
 
 
-@cache_op(StorePartition.INFRA, StoreOperation.GET)
-def get_nodes(network: typing.Union[NetworkIdentifier, Network]=None) -> typing.List[Node]:
+@cache_op(StorePartition.INFRA, StoreOperation.GET_ITER)
+def get_nodes(network: typing.Union[NetworkIdentifier, Network]=None) -> typing.Iterator[Node]:
     """Decaches domain objects: Node.
 
     :param network: A pointer to either a network or network identifier.
 
-    :returns: Collection of registered nodes.
+    :returns: Iterator over registered nodes.
     
     """
     if network is None:
@@ -140,6 +123,21 @@ def get_nodes(network: typing.Union[NetworkIdentifier, Network]=None) -> typing.
         ]
 
 
+@cache_op(StorePartition.INFRA, StoreOperation.GET_COUNTER)
+def get_nodeset_version(network_id: NetworkIdentifier) -> int:
+    """Decaches version of a network's nodeset - incremented whenever a node is encached.
+
+    :param network_id: A network identifier.
+
+    :returns: Nodeset version.
+
+    """
+    return [
+        "nodeset-version",
+        network_id.name
+    ]
+
+
 def get_nodes_operational(network: typing.Union[NetworkIdentifier, Network]=None) -> typing.List[Node]:
     """Decaches domain objects: Node (if operational).
 
@@ -151,6 +149,14 @@ def get_nodes_operational(network: typing.Union[NetworkIdentifier, Network]=None
     return [i for i in get_nodes(network) if i.is_operational]
 
 
+@aio_variant_of(get_nodes_operational)
+async def _get_nodes_operational_aio(network: typing.Union[NetworkIdentifier, Network]=None) -> typing.List[Node]:
+    """Asyncio variant of get_nodes_operational.
+
+    """
+    return [i async for i in get_nodes.aio(network) if i.is_operational]
+
+
 @cache_op(StorePartition.INFRA, StoreOperation.SET)
 def set_client_contract(contract: ClientContract) -> typing.Tuple[typing.List[str], Network]:
     """Encaches domain object: ClientContract.
@@ -182,8 +188,59 @@ def set_network(network: Network) -> typing.Tuple[typing.List[str], Network]:
     ], network
 
 
+@cache_op(StorePartition.INFRA, StoreOperation.INCR)
+def increment_nodeset_version(network: str) -> typing.List[str]:
+    """Increments version of a network's nodeset so that in-process nodeset snapshots are refreshed.
+
+    :param network: Name of network whose nodeset has changed.
+
+    :returns: Keypath of nodeset version.
+
+    """
+    return [
+        "nodeset-version",
+        network
+    ]
+
+
+def set_node(node: Node):
+    """Encaches domain object: Node - bumping associated nodeset version.
+    
+    :param node: Node domain object instance to be cached.
+
+    """
+    with batch():
+        _set_node(node)
+        increment_nodeset_version(node.network)
+
+
+@aio_variant_of(set_node)
+async def _set_node_aio(node: Node):
+    """Asyncio variant of set_node.
+
+    """
+    await _set_node.aio(node)
+    await increment_nodeset_version.aio(node.network)
+
+
+@cache_op(StorePartition.INFRA, StoreOperation.SET)
+def set_node_health(health: NodeHealth) -> typing.Tuple[typing.List[str], NodeHealth]:
+    """Encaches domain object: NodeHealth.
+    
+    :param health: NodeHealth domain object instance to be cached.
+
+    :returns: Keypath + domain object instance.
+
+    """
+    return [
+        "node-health",
+        health.network,
+        f"N-{str(health.index).zfill(4)}"
+    ], health
+
+
 @cache_op(StorePartition.INFRA, StoreOperation.SET)
-def set_node(node: Node) -> typing.Tuple[typing.List[str], Node]:
+def _set_node(node: Node) -> typing.Tuple[typing.List[str], Node]:
     """Encaches domain object: Node.
     
     :param node: Node domain object instance to be cached.
@@ -4,26 +4,26 @@ from stests.core.cache.enums import StoreOperation
 from stests.core.cache.enums import StorePartition
 from stests.core.cache.utils import cache_op
 from stests.core.domain import *
+from stests.core.orchestration import BlockLock
 from stests.core.orchestration import StreamLock
 
 
 
 
 @cache_op(StorePartition.MONITORING, StoreOperation.DELETE)
-def delete_stream_lock(lock: StreamLock) -> typing.Generator:
-    """Deletes astream lock.
+def delete_deploy(deploy: Deploy) -> typing.List[str]:
+    """Uncaches domain object: Deploy - thereby releasing its claim upon processing.
 
-    :param ctx: Execution context information.
+    :param deploy: Deploy domain object instance to be uncached.
+
+    :returns: Keypath to be deleted.
 
-    :returns: A keypath to be deleted.
-    
     """
     return [
-        "stream-lock",
-        lock.network,
-        lock.lock_index,
+        "deploy",
+        deploy.network,
+        f"{deploy.block_hash}.{deploy.deploy_hash}"
     ]
-    
 
 
 @cache_op(StorePartition.MONITORING, StoreOperation.FLUSH)
@@ -41,6 +41,60 @@ def flush_stream_locks() -> typing.Generator:
     ]
 
 
+@cache_op(StorePartition.MONITORING, StoreOperation.GET_COUNTER)
+def get_block_duplicate_count(network: str) -> typing.List[str]:
+    """Decaches metric: number of finalized block events discarded as duplicates.
+
+    :param network: Name of network being monitored.
+
+    :returns: Keypath of metric.
+
+    """
+    return [
+        "block-duplicate-count",
+        network,
+    ]
+
+
+@cache_op(StorePartition.MONITORING, StoreOperation.GET_COUNTER)
+def get_monitoring_epoch() -> typing.List[str]:
+    """Decaches epoch of monitoring - used to stop superseded monitoring loops.
+
+    :returns: Keypath of monitoring epoch.
+
+    """
+    return [
+        "monitoring-epoch",
+    ]
+
+
+@cache_op(StorePartition.MONITORING, StoreOperation.INCR)
+def increment_block_duplicate_count(network: str) -> typing.List[str]:
+    """Increments metric: number of finalized block events discarded as duplicates.
+
+    :param network: Name of network being monitored.
+
+    :returns: Keypath of metric.
+
+    """
+    return [
+        "block-duplicate-count",
+        network,
+    ]
+
+
+@cache_op(StorePartition.MONITORING, StoreOperation.INCR)
+def increment_monitoring_epoch() -> typing.List[str]:
+    """Increments epoch of monitoring - thereby superseding active monitoring loops.
+
+    :returns: Keypath of monitoring epoch.
+
+    """
+    return [
+        "monitoring-epoch",
+    ]
+
+
 @cache_op(StorePartition.MONITORING, StoreOperation.SET_SINGLETON)
 def set_block(block: Block) -> typing.Tuple[typing.List[str], Block]:
     """Encaches domain object: Block.
@@ -73,9 +127,23 @@ def set_deploy(deploy: Deploy) -> typing.Tuple[typing.List[str], Deploy]:
     ], deploy
 
 
+@cache_op(StorePartition.MONITORING, StoreOperation.LOCK)
+def set_block_lock(lock: BlockLock) -> typing.Tuple[typing.List[str], BlockLock]:
+    """Encaches a lock: BlockLock - claims processing of a finalized block - returns lease + acquired flag.
+
+    :param lock: Information to be locked.
+
+    """
+    return [
+        "block-lock",
+        lock.network,
+        lock.block_hash,
+    ], lock
+
+
 @cache_op(StorePartition.MONITORING, StoreOperation.LOCK)
 def set_stream_lock(lock: StreamLock) -> typing.Tuple[typing.List[str], StreamLock]:
-    """Encaches a lock: StreamLock.
+    """Encaches a lock: StreamLock - returns lease (to be renewed whilst streaming) + acquired flag.
 
     :param lock: Information to be locked.
 
@@ -1,10 +1,13 @@
 import random
 import typing
+from datetime import datetime
 
 import stests.core.cache.ops_infra as infra
 from stests.core.cache.enums import StoreOperation
 from stests.core.cache.enums import StorePartition
+from stests.core.cache.utils import aio_variant_of
 from stests.core.cache.utils import cache_op
+from stests.core.cache.utils import get_run_scope
 from stests.core.domain import *
 from stests.core.orchestration import *
 from stests.core.utils import factory
@@ -20,20 +23,17 @@ def flush_by_run(ctx: ExecutionContext) -> typing.Generator:
     :returns: A generator of keypaths to be flushed.
     
     """
+    # Patterns match both a run's own key & keys nested beneath it.
     for collection in [
         "context",
-        "deploy-count",
         "info",
         "lock",
         "state",
     ]:
-        yield [
-            collection,
-            ctx.network,
-            ctx.run_type,
-            ctx.run_index_label,
-            "*"
-        ]
+        yield _get_keypath_run_pattern(collection, ctx)
+
+    # Deploy counts are held within a single hash per run.
+    yield _get_keypath_deploy_count(ctx)
 
 
 @cache_op(StorePartition.ORCHESTRATION, StoreOperation.FLUSH)
@@ -45,12 +45,7 @@ def flush_locks(ctx: ExecutionContext) -> typing.Generator:
     :returns: A generator of keypaths to be flushed.
     
     """
-    yield [
-        "lock",
-        ctx.network,
-        ctx.run_type,
-        f"{ctx.run_index_label}*",
-    ]
+    yield _get_keypath_run_pattern("lock", ctx)
 
 
 @cache_op(StorePartition.ORCHESTRATION, StoreOperation.GET)
@@ -68,9 +63,7 @@ def get_context(network: str, run_index: int, run_type: str) -> ExecutionContext
 
     return [
         "context",
-        network,
-        run_type,
-        run_index_label
+        *get_run_scope(network, run_type, run_index_label),
     ]
 
 
@@ -85,8 +78,7 @@ def get_contexts(network: str, run_type: str) -> ExecutionContext:
     """
     return [
         "context",
-        network,
-        run_type,
+        *get_run_scope(network, run_type),
         "*"
     ]
 
@@ -103,6 +95,14 @@ def get_run_network(ctx: ExecutionContext) -> Network:
     return infra.get_network(network_id)
 
 
+@aio_variant_of(get_run_network)
+async def _get_run_network_aio(ctx: ExecutionContext) -> Network:
+    """Asyncio variant of get_run_network.
+
+    """
+    return await infra.get_network.aio(factory.create_network_id(ctx.network))
+
+
 def get_step(ctx: ExecutionContext) -> ExecutionInfo:
     """Decaches domain object: ExecutionInfo.
     
@@ -117,6 +117,16 @@ def get_step(ctx: ExecutionContext) -> ExecutionInfo:
     return steps[-1] if steps else None
 
 
+@aio_variant_of(get_step)
+async def _get_step_aio(ctx: ExecutionContext) -> ExecutionInfo:
+    """Asyncio variant of get_step.
+
+    """
+    steps = sorted(await get_steps.aio(ctx), key=lambda i: i.ts_start)
+
+    return steps[-1] if steps else None
+
+
 @cache_op(StorePartition.ORCHESTRATION, StoreOperation.GET)
 def get_steps(ctx: ExecutionContext) -> typing.List[ExecutionInfo]:
     """Decaches collection of domain objects: ExecutionInfo.
@@ -128,9 +138,7 @@ def get_steps(ctx: ExecutionContext) -> typing.List[ExecutionInfo]:
     """
     return [
         "step",
-        ctx.network,
-        ctx.run_type,
-        ctx.run_index_label,
+        *get_run_scope(ctx.network, ctx.run_type, ctx.run_index_label),
         "*"
         ]
         
@@ -145,29 +153,36 @@ def get_deploy_count(ctx: ExecutionContext, aspect: ExecutionAspect) -> int:
     :returns: Count of deploys.
 
     """
-    return _get_keypath_deploy_count(ctx, aspect)
+    return _get_keypath_deploy_count(ctx), _get_field_deploy_count(ctx, aspect)
 
 
-@cache_op(StorePartition.ORCHESTRATION, StoreOperation.INCR)
-def increment_deploy_count(ctx: ExecutionContext, aspect: ExecutionAspect = ExecutionAspect.STEP):
-    """Increments (atomically) count of run step deploys.
+@cache_op(StorePartition.ORCHESTRATION, StoreOperation.INCR_COUNTS)
+def increment_deploy_counts(ctx: ExecutionContext) -> typing.Tuple[int, int, int, typing.Optional[int]]:
+    """Increments (atomically) run, phase & step deploy counts in a single round trip.
 
     :param ctx: Execution context information.
-    :param aspect: Aspect of execution in scope.
+
+    :returns: 4 member tuple: run, phase & step deploy counts, expected step deploy count (if set).
 
     """
-    return _get_keypath_deploy_count(ctx, aspect)
+    return _get_keypath_deploy_count(ctx), [
+        _get_field_deploy_count(ctx, ExecutionAspect.RUN),
+        _get_field_deploy_count(ctx, ExecutionAspect.PHASE),
+        _get_field_deploy_count(ctx, ExecutionAspect.STEP),
+    ], _get_field_deploy_count_expected(ctx)
 
 
-def increment_deploy_counts(ctx: ExecutionContext):
-    """Increments (atomically) count of deploys.
+@cache_op(StorePartition.ORCHESTRATION, StoreOperation.SET_COUNT)
+def set_expected_deploy_count(ctx: ExecutionContext, count: int) -> typing.Tuple[typing.List[str], str, int]:
+    """Encaches count of deploys that a step is expected to dispatch.
 
     :param ctx: Execution context information.
+    :param count: Expected count of step deploys.
+
+    :returns: Keypath + field + count.
 
     """
-    increment_deploy_count(ctx, ExecutionAspect.RUN)
-    increment_deploy_count(ctx, ExecutionAspect.PHASE)
-    increment_deploy_count(ctx, ExecutionAspect.STEP)
+    return _get_keypath_deploy_count(ctx), _get_field_deploy_count_expected(ctx), count
 
 
 @cache_op(StorePartition.ORCHESTRATION, StoreOperation.GET)
@@ -181,9 +196,7 @@ def get_lock_run(ctx: ExecutionContext) -> typing.Tuple[typing.List[str], RunLoc
     """
     return [
         "lock",
-        ctx.network,
-        ctx.run_type,
-        ctx.run_index_label
+        *get_run_scope(ctx.network, ctx.run_type, ctx.run_index_label),
     ]
 
 
@@ -196,9 +209,7 @@ def lock_run(lock: RunLock) -> typing.Tuple[typing.List[str], RunLock]:
     """
     return [
         "lock",
-        lock.network,
-        lock.run_type,
-        lock.run_index_label
+        *get_run_scope(lock.network, lock.run_type, lock.run_index_label),
     ], lock
 
 
@@ -211,9 +222,8 @@ def lock_phase(lock: PhaseLock) -> typing.Tuple[typing.List[str], PhaseLock]:
     """
     return [
         "lock",
-        lock.network,
-        lock.run_type,
-        f"{lock.run_index_label}.{lock.phase_index_label}",
+        *get_run_scope(lock.network, lock.run_type, lock.run_index_label),
+        lock.phase_index_label,
     ], lock
 
 
@@ -226,158 +236,136 @@ def lock_step(lock: StepLock) -> typing.Tuple[typing.List[str], StepLock]:
     """
     return [
         "lock",
-        lock.network,
-        lock.run_type,
-        f"{lock.run_index_label}.{lock.phase_index_label}.{lock.step_index_label}",
+        *get_run_scope(lock.network, lock.run_type, lock.run_index_label),
+        f"{lock.phase_index_label}.{lock.step_index_label}",
     ], lock
 
 
-@cache_op(StorePartition.ORCHESTRATION, StoreOperation.GET)
-def get_run_info(ctx: ExecutionContext) -> ExecutionContext:
-    """Decaches domain object: ExecutionContext.
-    
-    :param ctx: Execution context information.
+@cache_op(StorePartition.ORCHESTRATION, StoreOperation.LOCK)
+def lock_step_end(lock: StepLock) -> typing.Tuple[typing.List[str], StepLock]:
+    """Encaches a lock: StepLock - claimed by whichever finalized deploy ends the step.
 
-    :returns: Keypath to domain object instance.
+    :param lock: Information to be locked.
 
     """
     return [
-        "info",
-        ctx.network,
-        ctx.run_type,
-        ctx.run_index_label,
-        "-"
-    ]
+        "lock",
+        *get_run_scope(lock.network, lock.run_type, lock.run_index_label),
+        f"{lock.phase_index_label}.{lock.step_index_label}.end",
+    ], lock
 
 
-@cache_op(StorePartition.ORCHESTRATION, StoreOperation.GET)
-def get_info_list(network_id: NetworkIdentifier, run_type: str, run_index: int = None) -> typing.List[ExecutionInfo]:
-    """Decaches domain object: ExecutionContext.
+@cache_op(StorePartition.ORCHESTRATION, StoreOperation.GET_HASH)
+def get_run_info(ctx: ExecutionContext) -> typing.Tuple[typing.List[str], typing.Optional[typing.List[str]]]:
+    """Decaches domain object: ExecutionInfo.
     
     :param ctx: Execution context information.
+
+    :returns: Keypath to domain object instance + fields to be pulled.
+
+    """
+    return _get_keypath_info(ctx, ExecutionAspect.RUN), None
+
+
+@cache_op(StorePartition.ORCHESTRATION, StoreOperation.GET_HASH_ITER)
+def get_info_list(
+    network_id: NetworkIdentifier,
+    run_type: str,
+    run_index: int = None,
+    fields: typing.List[str] = None,
+    ) -> typing.Iterator[ExecutionInfo]:
+    """Decaches domain objects: ExecutionInfo.
+    
+    :param network_id: A network identifier.
     :param run_type: Type of run that was executed.
     :param run_index: Index of a run.
+    :param fields: Fields to be pulled - others are set to none - if unspecified then all fields are pulled.
 
-    :returns: Keypath to domain object instance.
+    :returns: Keypath to domain object instances + fields to be pulled.
 
     """
     if not run_type:
         return [
             "info",
-            network_id.name,
+            *get_run_scope(network_id.name),
             "*"
-        ]
+        ], fields
     elif run_index:
         run_index_label = f"R-{str(run_index).zfill(3)}"
         return [
             "info",
-            network_id.name,
-            run_type,
-            run_index_label,
+            *get_run_scope(network_id.name, run_type, run_index_label),
             "*"
-        ]
+        ], fields
     else:
         return [
             "info",
-            network_id.name,
-            run_type,
+            *get_run_scope(network_id.name, run_type),
             "*"
-        ]
+        ], fields
 
 
-def update_run_info(ctx: ExecutionContext) -> ExecutionInfo:
-    """Updates domain object: ExecutionContext.
+@cache_op(StorePartition.ORCHESTRATION, StoreOperation.SET_HASH_END)
+def update_run_info(ctx: ExecutionContext) -> typing.Tuple[typing.List[str], str, float]:
+    """Updates (atomically) domain object: ExecutionInfo.
     
     :param ctx: Execution context information.
 
-    :returns: Keypath + domain object instance.
+    :returns: Keypath + end status + end timestamp.
 
     """
-    # Pull.
-    info = get_run_info(ctx)
-
-    # Update.
     # TODO: set error from context.
-    info.end(ctx.status, None)
+    return _get_keypath_info(ctx, ExecutionAspect.RUN), ctx.status.name, datetime.now().timestamp()
 
-    # Recache.
-    set_info(info)
 
-    return info
-
-
-@cache_op(StorePartition.ORCHESTRATION, StoreOperation.GET)
-def get_phase_info(ctx: ExecutionContext) -> ExecutionInfo:
+@cache_op(StorePartition.ORCHESTRATION, StoreOperation.GET_HASH)
+def get_phase_info(ctx: ExecutionContext) -> typing.Tuple[typing.List[str], typing.Optional[typing.List[str]]]:
     """Decaches domain object: ExecutionInfo.
     
     :param ctx: Execution context information.
 
-    :returns: Keypath to domain object instance.
+    :returns: Keypath to domain object instance + fields to be pulled.
 
     """
-    return [
-        "info",
-        ctx.network,
-        ctx.run_type,
-        ctx.run_index_label,
-        ctx.phase_index_label,
-    ]
+    return _get_keypath_info(ctx, ExecutionAspect.PHASE), None
 
 
-def update_phase_info(ctx: ExecutionContext, status: ExecutionStatus) -> ExecutionInfo:
-    """Updates domain object: ExecutionInfo.
+@cache_op(StorePartition.ORCHESTRATION, StoreOperation.SET_HASH_END)
+def update_phase_info(ctx: ExecutionContext, status: ExecutionStatus) -> typing.Tuple[typing.List[str], str, float]:
+    """Updates (atomically) domain object: ExecutionInfo.
     
     :param ctx: Execution context information.
     :param status: New execution state.
 
-    :returns: Keypath + domain object instance.
+    :returns: Keypath + end status + end timestamp.
 
     """
-    # Pull & update.
-    info = get_phase_info(ctx)
-    info.end(status, None)
-
-    # Recache.
-    set_info(info)
-
-    return info
+    return _get_keypath_info(ctx, ExecutionAspect.PHASE), status.name, datetime.now().timestamp()
 
 
-@cache_op(StorePartition.ORCHESTRATION, StoreOperation.GET)
-def get_step_info(ctx: ExecutionContext) -> ExecutionInfo:
+@cache_op(StorePartition.ORCHESTRATION, StoreOperation.GET_HASH)
+def get_step_info(ctx: ExecutionContext) -> typing.Tuple[typing.List[str], typing.Optional[typing.List[str]]]:
     """Decaches domain object: ExecutionInfo.
     
     :param ctx: Execution context information.
 
-    :returns: Keypath to domain object instance.
+    :returns: Keypath to domain object instance + fields to be pulled.
 
     """
-    return [
-        "info",
-        ctx.network,
-        ctx.run_type,
-        ctx.run_index_label,
-        f"{ctx.phase_index_label}.{ctx.step_index_label}"
-    ]
+    return _get_keypath_info(ctx, ExecutionAspect.STEP), None
 
 
-def update_step_info(ctx: ExecutionContext, status: ExecutionStatus) -> ExecutionInfo:
-    """Updates domain object: ExecutionInfo.
+@cache_op(StorePartition.ORCHESTRATION, StoreOperation.SET_HASH_END)
+def update_step_info(ctx: ExecutionContext, status: ExecutionStatus) -> typing.Tuple[typing.List[str], str, float]:
+    """Updates (atomically) domain object: ExecutionInfo.
     
     :param ctx: Execution context information.
     :param status: New execution state.
 
-    :returns: Keypath + domain object instance.
+    :returns: Keypath + end status + end timestamp.
 
     """
-    # Pull & update.
-    info = get_step_info(ctx)
-    info.end(status, None)
-
-    # Recache.
-    set_info(info)
-
-    return info
+    return _get_keypath_info(ctx, ExecutionAspect.STEP), status.name, datetime.now().timestamp()
 
 
 @cache_op(StorePartition.ORCHESTRATION, StoreOperation.SET)
@@ -391,45 +379,20 @@ def set_context(ctx: ExecutionContext) -> typing.Tuple[typing.List[str], Executi
     """
     return [
         "context",
-        ctx.network,
-        ctx.run_type,
-        ctx.run_index_label
+        *get_run_scope(ctx.network, ctx.run_type, ctx.run_index_label),
     ], ctx
 
 
-@cache_op(StorePartition.ORCHESTRATION, StoreOperation.SET)
+@cache_op(StorePartition.ORCHESTRATION, StoreOperation.SET_HASH)
 def set_info(info: ExecutionInfo) -> typing.Tuple[typing.List[str], ExecutionInfo]:
-    """Encaches domain object: ExecutionInfo.
+    """Encaches domain object: ExecutionInfo - as a hash so that it can be updated atomically.
     
     :param info: ExecutionInfo domain object instance to be cached.
 
     :returns: Keypath + domain object instance.
 
     """
-    if info.phase_index and info.step_index:
-        return [
-            "info",
-            info.network,
-            info.run_type,
-            info.run_index_label,
-            f"{info.phase_index_label}.{info.step_index_label}"
-        ], info
-    elif info.phase_index:
-        return [
-            "info",
-            info.network,
-            info.run_type,
-            info.run_index_label,
-            info.phase_index_label,
-            ], info
-    else:
-        return [
-            "info",
-            info.network,
-            info.run_type,
-            info.run_index_label,
-            "-",
-        ], info
+    return _get_keypath_info(info, info.aspect), info
 
 
 @cache_op(StorePartition.ORCHESTRATION, StoreOperation.SET)
@@ -444,59 +407,90 @@ def set_state(state: ExecutionState) -> typing.Tuple[typing.List[str], Execution
     if state.aspect == ExecutionAspect.RUN:
         return [
             "state",
-            state.network,
-            state.run_type,
-            state.run_index_label,
+            *get_run_scope(state.network, state.run_type, state.run_index_label),
             "-"
         ], state 
 
     elif state.aspect == ExecutionAspect.PHASE:
         return [
             "state",
-            state.network,
-            state.run_type,
-            state.run_index_label,
+            *get_run_scope(state.network, state.run_type, state.run_index_label),
             state.phase_index_label,
         ], state 
 
     elif state.aspect == ExecutionAspect.STEP:
         return [
             "state",
-            state.network,
-            state.run_type,
-            state.run_index_label,
+            *get_run_scope(state.network, state.run_type, state.run_index_label),
             f"{state.phase_index_label}.{state.step_index_label}"
         ], state
 
 
-def _get_keypath_deploy_count(ctx: ExecutionContext, aspect: ExecutionAspect) -> typing.List[str]:
-    """Returns keypath used when working with a deploy count.
+def _get_field_deploy_count(ctx: ExecutionContext, aspect: ExecutionAspect) -> str:
+    """Returns field within a run's deploy count hash used when working with an aspect's deploy count.
+    
+    """
+    if aspect == ExecutionAspect.RUN:
+        return "-"
+
+    elif aspect == ExecutionAspect.PHASE:
+        return ctx.phase_index_label
+
+    elif aspect == ExecutionAspect.STEP:
+        return f"{ctx.phase_index_label}.{ctx.step_index_label}"
+
+
+def _get_field_deploy_count_expected(ctx: ExecutionContext) -> str:
+    """Returns field within a run's deploy count hash used when working with a step's expected deploy count.
+    
+    """
+    return f"{ctx.phase_index_label}.{ctx.step_index_label}.expected"
+
+
+def _get_keypath_info(obj: typing.Union[ExecutionContext, ExecutionInfo], aspect: ExecutionAspect) -> typing.List[str]:
+    """Returns keypath used when working with execution information.
     
     """
     if aspect == ExecutionAspect.RUN:
         return [
-            "deploy-count",
-            ctx.network,
-            ctx.run_type,
-            ctx.run_index_label,
-            "-",
+            "info",
+            *get_run_scope(obj.network, obj.run_type, obj.run_index_label),
+            "-"
         ]
 
     elif aspect == ExecutionAspect.PHASE:
         return [
-            "deploy-count",
-            ctx.network,
-            ctx.run_type,
-            ctx.run_index_label,
-            ctx.phase_index_label,
+            "info",
+            *get_run_scope(obj.network, obj.run_type, obj.run_index_label),
+            obj.phase_index_label,
         ]
 
     elif aspect == ExecutionAspect.STEP:
         return [
-            "deploy-count",
-            ctx.network,
-            ctx.run_type,
-            ctx.run_index_label,
-            f"{ctx.phase_index_label}.{ctx.step_index_label}",            
+            "info",
+            *get_run_scope(obj.network, obj.run_type, obj.run_index_label),
+            f"{obj.phase_index_label}.{obj.step_index_label}"
         ]
 
+
+def _get_keypath_run_pattern(collection: str, ctx: ExecutionContext) -> typing.List[str]:
+    """Returns keypath pattern matching a run's key within a collection along with keys nested beneath it.
+    
+    """
+    *scope, scope_end = get_run_scope(ctx.network, ctx.run_type, ctx.run_index_label)
+
+    return [
+        collection,
+        *scope,
+        f"{scope_end}*",
+    ]
+
+
+def _get_keypath_deploy_count(ctx: ExecutionContext) -> typing.List[str]:
+    """Returns keypath used when working with a run's deploy counts - held within a single hash.
+    
+    """
+    return [
+        "deploy-count",
+        *get_run_scope(ctx.network, ctx.run_type, ctx.run_index_label),
+    ]
@@ -5,13 +5,52 @@ from stests.core.cache.enums import StoreOperation
 from stests.core.cache.enums import StorePartition
 from stests.core.cache.ops_infra import get_network
 from stests.core.cache.ops_infra import get_nodes
+from stests.core.cache.utils import aio_variant_of
 from stests.core.cache.utils import cache_op
+from stests.core.cache.utils import get_run_scope
 from stests.core.domain import *
 from stests.core.orchestration import *
 from stests.core.utils import factory
 
 
 
+@cache_op(StorePartition.STATE, StoreOperation.DELETE)
+def delete_index(collection: str, dhash: str) -> typing.List[str]:
+    """Uncaches a pointer from a deploy hash to an item within a collection.
+
+    :param collection: Collection of indexed item, e.g. deploy.
+    :param dhash: Deploy hash.
+
+    :returns: Keypath to be deleted.
+
+    """
+    return _get_index_keypath(collection, dhash)
+
+
+@cache_op(StorePartition.STATE, StoreOperation.DELETE)
+def delete_run_deploy(deploy: Deploy) -> typing.List[str]:
+    """Uncaches domain object: Deploy - its index pointer is uncached via delete_index.
+
+    :param deploy: Deploy domain object instance to be uncached.
+
+    :returns: Keypath to be deleted.
+
+    """
+    return set_run_deploy.keypaths(deploy)[0]
+
+
+@cache_op(StorePartition.STATE, StoreOperation.DELETE)
+def delete_run_transfer(transfer: Transfer) -> typing.List[str]:
+    """Uncaches domain object: Transfer - its index pointer is uncached via delete_index.
+
+    :param transfer: Transfer domain object instance to be uncached.
+
+    :returns: Keypath to be deleted.
+
+    """
+    return set_run_transfer.keypaths(transfer)[0]
+
+
 @cache_op(StorePartition.STATE, StoreOperation.FLUSH)
 def flush_by_run(ctx: ExecutionContext) -> typing.Generator:
     """Flushes previous run information.
@@ -21,18 +60,22 @@ def flush_by_run(ctx: ExecutionContext) -> typing.Generator:
     :returns: A generator of keypaths to be flushed.
     
     """
-    for collection in [
+    yield [
         "account",
+        *get_run_scope(ctx.network, ctx.run_type, ctx.run_index_label),
+        "*"
+    ]
+
+    # Deploys & transfers are flushed along with their deploy hash index pointers.
+    for collection in [
         "deploy",   
         "transfer",
     ]:
         yield [
             collection,
-            ctx.network,
-            ctx.run_type,
-            ctx.run_index_label,
+            *get_run_scope(ctx.network, ctx.run_type, ctx.run_index_label),
             "*"
-        ]
+        ], _get_index_keypath_factory(collection)
 
 
 @cache_op(StorePartition.STATE, StoreOperation.GET)
@@ -46,9 +89,11 @@ def get_account(account_id: AccountIdentifier) -> Account:
     """
     return [
         "account",
-        account_id.run.network.name,
-        account_id.run.type,
-        f"R-{str(account_id.run.index).zfill(3)}",
+        *get_run_scope(
+            account_id.run.network.name,
+            account_id.run.type,
+            f"R-{str(account_id.run.index).zfill(3)}",
+            ),
         f"{str(account_id.index).zfill(6)}"
     ]
 
@@ -70,33 +115,35 @@ def get_account_by_run(ctx: ExecutionContext, index: int) -> Account:
         ))
 
 
-def get_run_deploy(dhash: str) -> Deploy:
-    """Decaches domain object: Deploy.
-    
-    :param dhash: A deploy hash.
-
-    :returns: A run deploy.
+@aio_variant_of(get_account_by_run)
+async def _get_account_by_run_aio(ctx: ExecutionContext, index: int) -> Account:
+    """Asyncio variant of get_account_by_run.
 
-    """    
-    deploys = get_run_deploys(dhash)
+    """
+    return await get_account.aio(factory.create_account_id(
+        index,
+        ctx.network,
+        ctx.run_index,
+        ctx.run_type
+        ))
 
-    return deploys[-1] if deploys else None
 
+@cache_op(StorePartition.STATE, StoreOperation.GET_INDEXED)
+def get_run_deploy(dhash: str) -> Deploy:
+    """Decaches domain object: Deploy.
 
-@cache_op(StorePartition.STATE, StoreOperation.GET)
-def get_run_deploys(dhash: str) -> typing.List[Deploy]:
-    """Decaches collection of domain objects: Deploy.
+    Only deploys cached with a deploy hash index pointer are found, hence runs cached by prior versions must be flushed upon upgrade.
     
     :param dhash: A deploy hash.
 
-    :returns: List of matching deploys.
+    :returns: Keypath of deploy hash index pointer.
 
     """    
-    return [f"deploy*{dhash}*"]
+    return _get_index_keypath("deploy", dhash)
 
 
-@cache_op(StorePartition.STATE, StoreOperation.GET)
-def get_deploys(network_id: NetworkIdentifier, run_type: str, run_index: int = None) -> typing.List[Deploy]:
+@cache_op(StorePartition.STATE, StoreOperation.GET_ITER)
+def get_deploys(network_id: NetworkIdentifier, run_type: str, run_index: int = None) -> typing.Iterator[Deploy]:
     """Decaches domain object: Deploy.
     
     :param ctx: Execution context information.
@@ -109,50 +156,36 @@ def get_deploys(network_id: NetworkIdentifier, run_type: str, run_index: int = N
     if not run_type:
         return [
             "deploy",
-            network_id.name,
+            *get_run_scope(network_id.name),
             "*"
         ]
     elif run_index:
         run_index_label = f"R-{str(run_index).zfill(3)}"
         return [
             "deploy",
-            network_id.name,
-            run_type,
-            run_index_label,
+            *get_run_scope(network_id.name, run_type, run_index_label),
             "*"
         ]
     else:
         return [
             "deploy",
-            network_id.name,
-            run_type,
+            *get_run_scope(network_id.name, run_type),
             "*"
         ]
 
 
+@cache_op(StorePartition.STATE, StoreOperation.GET_INDEXED)
 def get_run_transfer(dhash: str) -> Transfer:
     """Decaches domain object: Transfer.
-    
-    :param dhash: A deploy hash.
-
-    :returns: A run deploy.
-
-    """    
-    transfers = get_run_transfers(dhash)
-
-    return transfers[-1] if transfers else None
 
-
-@cache_op(StorePartition.STATE, StoreOperation.GET)
-def get_run_transfers(dhash: str) -> typing.List[Transfer]:
-    """Decaches collection of domain objects: Transfer.
+    Only transfers cached with a deploy hash index pointer are found, hence runs cached by prior versions must be flushed upon upgrade.
     
     :param dhash: A deploy hash.
 
-    :returns: Matched transfers.
+    :returns: Keypath of deploy hash index pointer.
 
     """    
-    return [f"transfer*{dhash}*"]
+    return _get_index_keypath("transfer", dhash)
 
 
 @cache_op(StorePartition.STATE, StoreOperation.SET)
@@ -166,45 +199,58 @@ def set_run_account(account: Account) -> typing.Tuple[typing.List[str], Account]
     """
     return [
         "account",
-        account.network,
-        account.run_type,
-        f"R-{str(account.run_index).zfill(3)}",
+        *get_run_scope(account.network, account.run_type, f"R-{str(account.run_index).zfill(3)}"),
         str(account.index).zfill(6)
     ], account    
 
 
-@cache_op(StorePartition.STATE, StoreOperation.SET)
-def set_run_deploy(deploy: Deploy) -> typing.Tuple[typing.List[str], Deploy]:
+@cache_op(StorePartition.STATE, StoreOperation.SET_INDEXED)
+def set_run_deploy(deploy: Deploy) -> typing.Tuple[typing.List[str], Deploy, typing.List[str]]:
     """Encaches domain object: Deploy.
     
     :param deploy: Deploy domain object instance to be cached.
 
-    :returns: Keypath + domain object instance.
+    :returns: Keypath + domain object instance + keypath of deploy hash index pointer.
 
     """
     return [
         "deploy",
-        deploy.network,
-        deploy.run_type,
-        f"R-{str(deploy.run_index).zfill(3)}",
+        *get_run_scope(deploy.network, deploy.run_type, f"R-{str(deploy.run_index).zfill(3)}"),
         f"{str(deploy.dispatch_ts.timestamp())}.{deploy.deploy_hash}"
-    ], deploy
+    ], deploy, _get_index_keypath("deploy", deploy.deploy_hash)
 
 
-@cache_op(StorePartition.STATE, StoreOperation.SET)
-def set_run_transfer(transfer: Transfer) -> typing.Tuple[typing.List[str], Transfer]:
+@cache_op(StorePartition.STATE, StoreOperation.SET_INDEXED)
+def set_run_transfer(transfer: Transfer) -> typing.Tuple[typing.List[str], Transfer, typing.List[str]]:
     """Encaches domain object: Transfer.
     
     :param transfer: Transfer domain object instance to be cached.
 
-    :returns: Keypath + domain object instance.
+    :returns: Keypath + domain object instance + keypath of deploy hash index pointer.
 
     """
     return [
         "transfer",
-        transfer.network,
-        transfer.run_type,
-        f"R-{str(transfer.run_index).zfill(3)}",
+        *get_run_scope(transfer.network, transfer.run_type, f"R-{str(transfer.run_index).zfill(3)}"),
         transfer.asset.lower(),
         transfer.deploy_hash
-    ], transfer
+    ], transfer, _get_index_keypath("transfer", transfer.deploy_hash)
+
+
+def _get_index_keypath(collection: str, dhash: str) -> typing.List[str]:
+    """Returns keypath of a pointer from a deploy hash to an item within a collection - not run scoped as looked up by hash alone.
+    
+    """
+    return [
+        f"{collection}-index",
+        dhash
+    ]
+
+
+def _get_index_keypath_factory(collection: str) -> typing.Callable[[str], typing.List[str]]:
+    """Returns function mapping an item key to the keypath of it's deploy hash index pointer.
+
+    Deploy hashes are always the trailing segment of deploy & transfer keys.
+    
+    """
+    return lambda key: _get_index_keypath(collection, key.split(":")[-1].split(".")[-1])
@@ -0,0 +1,157 @@
+import dataclasses
+import heapq
+import time
+import typing
+
+from stests.core.cache import codecs
+from stests.core.cache import stores
+from stests.core.cache import utils
+from stests.core.cache.enums import StorePartition
+from stests.core.utils import env
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Seconds after which a cached finalized block expires - i.e. window within which duplicate block events are detected.
+    MONITORING_BLOCK_TTL = env.get_var('CACHE_RETENTION_MONITORING_BLOCK_TTL', 86400, int)
+
+    # Seconds (since creation) after which a cached finalized block is evicted by the sweeper - 0 = unbounded.
+    MONITORING_BLOCK_MAX_AGE = env.get_var('CACHE_RETENTION_MONITORING_BLOCK_MAX_AGE', 0, int)
+
+    # Maximum number of cached finalized blocks retained by the sweeper (oldest are evicted first) - 0 = unbounded.
+    MONITORING_BLOCK_MAX_COUNT = env.get_var('CACHE_RETENTION_MONITORING_BLOCK_MAX_COUNT', 0, int)
+
+    # Seconds after which a cached finalized deploy expires - i.e. window within which duplicate deploy events are detected.
+    MONITORING_DEPLOY_TTL = env.get_var('CACHE_RETENTION_MONITORING_DEPLOY_TTL', 86400, int)
+
+    # Seconds (since creation) after which a cached finalized deploy is evicted by the sweeper - 0 = unbounded.
+    MONITORING_DEPLOY_MAX_AGE = env.get_var('CACHE_RETENTION_MONITORING_DEPLOY_MAX_AGE', 0, int)
+
+    # Maximum number of cached finalized deploys retained by the sweeper (oldest are evicted first) - 0 = unbounded.
+    MONITORING_DEPLOY_MAX_COUNT = env.get_var('CACHE_RETENTION_MONITORING_DEPLOY_MAX_COUNT', 0, int)
+
+
+@dataclasses.dataclass(frozen=True)
+class RetentionPolicy:
+    """Declares for how long items within a cached collection are retained.
+
+    """
+    # Partition within which collection is cached.
+    partition: StorePartition
+
+    # Collection to which policy applies - i.e. first segment of item keypaths.
+    collection: str
+
+    # Seconds after which an item expires - applied server side at write time - none = never.
+    ttl: typing.Optional[int] = None
+
+    # Seconds (measured from an item's _ts_created) after which an item is evicted by the sweeper - none = never.
+    max_age: typing.Optional[int] = None
+
+    # Maximum number of items retained by the sweeper (oldest are evicted first) - none = unbounded.
+    max_count: typing.Optional[int] = None
+
+    @property
+    def label(self) -> str:
+        return f"{self.partition.name}.{self.collection}"
+
+
+# Set: declared retention policies - collections not declared are retained until flushed.
+POLICIES: typing.Tuple[RetentionPolicy, ...] = (
+    RetentionPolicy(
+        partition=StorePartition.MONITORING,
+        collection="block",
+        ttl=EnvVars.MONITORING_BLOCK_TTL or None,
+        max_age=EnvVars.MONITORING_BLOCK_MAX_AGE or None,
+        max_count=EnvVars.MONITORING_BLOCK_MAX_COUNT or None,
+    ),
+    RetentionPolicy(
+        partition=StorePartition.MONITORING,
+        collection="deploy",
+        ttl=EnvVars.MONITORING_DEPLOY_TTL or None,
+        max_age=EnvVars.MONITORING_DEPLOY_MAX_AGE or None,
+        max_count=EnvVars.MONITORING_DEPLOY_MAX_COUNT or None,
+    ),
+)
+
+# Map: (partition, collection) -> time to live - consulted upon every cache write.
+_TTLS: typing.Dict[typing.Tuple[StorePartition, str], int] = {
+    (i.partition, i.collection): i.ttl for i in POLICIES if i.ttl
+}
+
+
+def get_ttl(partition: StorePartition, keypath: typing.List[typing.Any]) -> typing.Optional[int]:
+    """Returns seconds after which a cached item expires.
+
+    :param partition: Partition within which item is cached.
+    :param keypath: Keypath of cached item.
+
+    :returns: Time to live - none if item does not expire.
+
+    """
+    return _TTLS.get((partition, keypath[0]))
+
+
+def sweep(policy: RetentionPolicy) -> typing.Tuple[int, int]:
+    """Applies a retention policy to a cached collection.
+
+    Items cached prior to a ttl being declared are assigned it, then items older than max age
+    and items in excess of max count are evicted. Items are expected to be cached as encoded domain objects.
+
+    :param policy: Retention policy to be applied.
+
+    :returns: 2 member tuple: count of items assigned a ttl, count of evicted items.
+
+    """
+    search_key = utils._get_key(policy.partition, [policy.collection, "*"])
+    ts_cutoff = time.time() - policy.max_age if policy.max_age else None
+    expired, evicted = 0, 0
+
+    # Min heap of (ts_created, key) retaining the newest items whilst scanning.
+    newest = []
+
+    with stores.get_store(policy.partition) as store:
+        mget = store.mget_nonatomic if stores.is_cluster() else store.mget
+        for keys in utils._iter_keys(store, search_key):
+            if policy.ttl:
+                expired += _set_ttl(store, keys, policy.ttl)
+            if not policy.max_age and not policy.max_count:
+                continue
+
+            # Keys may have been deleted (or expired) between scan & mget.
+            to_evict = []
+            for key, value in zip(keys, mget(keys)):
+                if value is None:
+                    continue
+                ts_created = codecs.decode(value).get("_ts_created") or 0
+                if ts_cutoff and ts_created < ts_cutoff:
+                    to_evict.append(key)
+                elif policy.max_count:
+                    heapq.heappush(newest, (ts_created, key))
+                    if len(newest) > policy.max_count:
+                        to_evict.append(heapq.heappop(newest)[1])
+
+            if to_evict:
+                evicted += utils._unlink(store, to_evict)
+
+    return expired, evicted
+
+
+def _set_ttl(store: typing.Any, keys: typing.List[bytes], ttl: int) -> int:
+    """Assigns a ttl to those keys without one - returns count of keys assigned a ttl.
+
+    """
+    # A ttl of -1 denotes a key without expiry (EXPIRE NX would require redis 7).
+    pipeline = store.pipeline(transaction=False)
+    for key in keys:
+        pipeline.ttl(key)
+    keys = [k for k, v in zip(keys, pipeline.execute()) if v == -1]
+    if not keys:
+        return 0
+
+    pipeline = store.pipeline(transaction=False)
+    for key in keys:
+        pipeline.expire(key, ttl)
+
+    return sum(1 for i in pipeline.execute() if i)
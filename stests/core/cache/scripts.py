@@ -0,0 +1,45 @@
+# Server side (Lua) scripts executed by cache operations.
+
+
+
+# Increments a set of counts held within a hash & returns new counts followed by a (optional) total:
+# KEYS[1] = hash key, ARGV[1] = field holding total, ARGV[2..N] = fields to be incremented.
+INCR_COUNTS = """
+local result = {}
+for i = 2, #ARGV do
+    result[i - 1] = redis.call('HINCRBY', KEYS[1], ARGV[i], 1)
+end
+result[#ARGV] = redis.call('HGET', KEYS[1], ARGV[1])
+return result
+"""
+
+
+# Ends an item held as a hash - deriving duration from start timestamp:
+# KEYS[1] = hash key, ARGV[1] = status, ARGV[2] = end timestamp.
+SET_HASH_END = """
+local ts_start = redis.call('HGET', KEYS[1], 'ts_start')
+if not ts_start then
+    return false
+end
+local tp_duration = string.format('%.6f', tonumber(ARGV[2]) - tonumber(ts_start))
+redis.call('HSET', KEYS[1], 'status', ARGV[1], 'ts_end', ARGV[2], 'tp_duration', tp_duration)
+return tp_duration
+"""
+
+
+# Deletes a lock only if held by lease owner: KEYS[1] = lock key, ARGV[1] = lock value.
+RELEASE_LEASE = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+# Extends a lock's expiry only if held by lease owner: KEYS[1] = lock key, ARGV[1] = lock value, ARGV[2] = ttl (ms).
+RENEW_LEASE = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
@@ -1,3 +1,6 @@
+import importlib
+import typing
+
 from stests.core.cache.enums import StorePartition
 from stests.core.cache.stores import redis
 from stests.core.cache.stores import stub
@@ -12,13 +15,24 @@ class EnvVars:
     TYPE = env.get_var("CACHE_TYPE", "REDIS")
 
 
-# Map: Cache store type -> factory.
+# Map: Cache store type -> factory (or name of factory module imported upon first use).
 FACTORIES = {
     "REDIS": redis,
+    "REDIS_CLUSTER": "stests.core.cache.stores.redis_cluster",
     "STUB": stub
 }
 
 
+def get_key_prefix(partition_type: StorePartition) -> str:
+    """Returns prefix applied to keys so as to namespace a partition within the configured cache store.
+
+    :param partition_type: Type of partition being accessed.
+    :returns: A key prefix.
+
+    """
+    return _get_factory().get_key_prefix(partition_type)
+
+
 def get_store(partition_type: StorePartition = StorePartition.INFRA):
     """Returns a cache store ready to be used as a state persistence & flow control mechanism.
 
@@ -26,9 +40,46 @@ def get_store(partition_type: StorePartition = StorePartition.INFRA):
     :returns: A cache store.
 
     """ 
+    return _get_factory().get_store(partition_type)
+
+
+def get_store_async(partition_type: StorePartition = StorePartition.INFRA):
+    """Returns an asyncio cache store - must be called from within a running event loop.
+
+    :param partition_type: Type of partition to be instantiated.
+    :returns: An asyncio cache store.
+
+    """ 
+    return _get_factory().get_store_async(partition_type)
+
+
+def get_stats() -> typing.Dict[str, typing.Dict[str, int]]:
+    """Returns statistics pertaining to the current process's store connection pools.
+
+    :returns: Map: partition name -> pool statistics.
+
+    """
+    return _get_factory().get_stats()
+
+
+def is_cluster() -> bool:
+    """Returns flag indicating whether the configured cache store shards keys across nodes.
+
+    """
+    return _get_factory().IS_CLUSTER
+
+
+def _get_factory():
+    """Returns factory module mapped to configured cache store type.
+
+    """
     try:
         factory = FACTORIES[EnvVars.TYPE]
     except KeyError:
         raise InvalidEnvironmentVariable("CACHE_TYPE", EnvVars.TYPE, FACTORIES)
 
-    return factory.get_store(partition_type)
+    # Cluster support is only available with recent client versions, hence is imported upon first use.
+    if isinstance(factory, str):
+        factory = FACTORIES[EnvVars.TYPE] = importlib.import_module(factory)
+
+    return factory
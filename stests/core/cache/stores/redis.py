@@ -1,4 +1,11 @@
+import asyncio
+import os
+import threading
+import typing
+import weakref
+
 import redis
+import redis.asyncio
 
 from stests.core.cache.enums import StorePartition
 from stests.core.utils import env
@@ -16,6 +23,21 @@ class EnvVars:
     # Redis port.
     PORT = env.get_var('CACHE_REDIS_PORT', 6379, int)
 
+    # Maximum number of connections held by a partition's connection pool.
+    POOL_SIZE = env.get_var('CACHE_REDIS_POOL_SIZE', 16, int)
+
+    # Seconds to wait for a free pooled connection before raising.
+    POOL_TIMEOUT = env.get_var('CACHE_REDIS_POOL_TIMEOUT', 20, float)
+
+    # Seconds to wait whilst establishing a connection.
+    SOCKET_CONNECT_TIMEOUT = env.get_var('CACHE_REDIS_SOCKET_CONNECT_TIMEOUT', 5, float)
+
+    # Seconds to wait for a command response.
+    SOCKET_TIMEOUT = env.get_var('CACHE_REDIS_SOCKET_TIMEOUT', 30, float)
+
+
+# Flag indicating that keys are sharded across nodes - i.e. multi-key operations must target a single slot.
+IS_CLUSTER = False
 
 # Map: partition type -> cache db index offset.
 PARTITION_OFFSETS = {
@@ -25,6 +47,27 @@ PARTITION_OFFSETS = {
     StorePartition.STATE: 3,
 }
 
+# Map: partition type -> connection pool (scoped to current process).
+_POOLS: typing.Dict[StorePartition, redis.BlockingConnectionPool] = {}
+
+# Map: event loop -> partition type -> asyncio connection pool (scoped to current process).
+_POOLS_ASYNC: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Identifier of process that instantiated the pools - used to detect forks.
+_POOLS_PID: int = None
+
+# Guards pool instantiation across worker threads.
+_POOLS_LOCK = threading.Lock()
+
+
+def get_key_prefix(_: StorePartition) -> str:
+    """Returns prefix applied to keys so as to namespace a partition.
+
+    :returns: A key prefix (empty as partitions are mapped to dbs).
+
+    """
+    return ""
+
 
 def get_store(partition_type: StorePartition) -> redis.Redis:
     """Returns instance of a redis cache store accessor.
@@ -32,14 +75,87 @@ def get_store(partition_type: StorePartition) -> redis.Redis:
     :returns: An instance of a redis cache store accessor.
 
     """
-    # Set cache db index.
-    db = EnvVars.DB
-    db += PARTITION_OFFSETS[partition_type]
+    return redis.Redis(connection_pool=_get_pool(partition_type))
+
+
+def get_store_async(partition_type: StorePartition) -> redis.asyncio.Redis:
+    """Returns instance of an asyncio redis cache store accessor - must be called from within a running event loop.
+
+    :returns: An instance of an asyncio redis cache store accessor.
+
+    """
+    return redis.asyncio.Redis(connection_pool=_get_pool_async(partition_type))
+
+
+def get_stats() -> typing.Dict[str, typing.Dict[str, int]]:
+    """Returns statistics pertaining to the current process's connection pools.
+
+    :returns: Map: partition name -> pool statistics.
+
+    """
+    return {partition.name: {
+        "pid": _POOLS_PID,
+        "db": pool.connection_kwargs["db"],
+        "max_connections": pool.max_connections,
+        "created_connections": len(pool._connections),
+        "in_use_connections": len(pool._connections) - len([i for i in pool.pool.queue if i]),
+    } for partition, pool in _POOLS.items()}
+
+
+def _get_pool(partition_type: StorePartition) -> redis.BlockingConnectionPool:
+    """Returns a connection pool scoped to both the current process & the partition.
+
+    """
+    _reset_pools_after_fork()
 
-    # TODO: 1. cluster connections
-    return redis.Redis(
-        db=db,
-        host=EnvVars.HOST,
-        port=EnvVars.PORT
-        )
+    try:
+        return _POOLS[partition_type]
+    except KeyError:
+        with _POOLS_LOCK:
+            if partition_type not in _POOLS:
+                _POOLS[partition_type] = redis.BlockingConnectionPool(
+                    db=EnvVars.DB + PARTITION_OFFSETS[partition_type],
+                    host=EnvVars.HOST,
+                    port=EnvVars.PORT,
+                    max_connections=EnvVars.POOL_SIZE,
+                    timeout=EnvVars.POOL_TIMEOUT,
+                    socket_connect_timeout=EnvVars.SOCKET_CONNECT_TIMEOUT,
+                    socket_timeout=EnvVars.SOCKET_TIMEOUT,
+                    )
+            return _POOLS[partition_type]
+
+
+def _get_pool_async(partition_type: StorePartition) -> redis.asyncio.BlockingConnectionPool:
+    """Returns an asyncio connection pool scoped to the current process, the running event loop & the partition.
+
+    """
+    _reset_pools_after_fork()
+
+    # Asyncio connections are bound to the event loop within which they were opened.
+    pools = _POOLS_ASYNC.setdefault(asyncio.get_running_loop(), {})
+    try:
+        return pools[partition_type]
+    except KeyError:
+        return pools.setdefault(partition_type, redis.asyncio.BlockingConnectionPool(
+            db=EnvVars.DB + PARTITION_OFFSETS[partition_type],
+            host=EnvVars.HOST,
+            port=EnvVars.PORT,
+            max_connections=EnvVars.POOL_SIZE,
+            timeout=EnvVars.POOL_TIMEOUT,
+            socket_connect_timeout=EnvVars.SOCKET_CONNECT_TIMEOUT,
+            socket_timeout=EnvVars.SOCKET_TIMEOUT,
+            ))
+
+
+def _reset_pools_after_fork():
+    """Resets pools after a fork as sockets must not be shared across processes.
+
+    """
+    global _POOLS_PID
 
+    if _POOLS_PID != os.getpid():
+        with _POOLS_LOCK:
+            if _POOLS_PID != os.getpid():
+                _POOLS.clear()
+                _POOLS_ASYNC.clear()
+                _POOLS_PID = os.getpid()
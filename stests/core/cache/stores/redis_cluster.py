@@ -0,0 +1,173 @@
+import asyncio
+import os
+import threading
+import typing
+import weakref
+
+import redis
+import redis.asyncio.cluster
+from redis.cluster import RedisCluster
+
+from stests.core.cache.enums import StorePartition
+from stests.core.utils import env
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Host of a cluster node from which cluster topology is discovered.
+    HOST = env.get_var('CACHE_REDIS_CLUSTER_HOST', "localhost")
+
+    # Port of a cluster node from which cluster topology is discovered.
+    PORT = env.get_var('CACHE_REDIS_CLUSTER_PORT', 7000, int)
+
+    # Maximum number of connections held by a cluster node's connection pool.
+    POOL_SIZE = env.get_var('CACHE_REDIS_CLUSTER_POOL_SIZE', 16, int)
+
+    # Seconds to wait for a free pooled connection before raising.
+    POOL_TIMEOUT = env.get_var('CACHE_REDIS_CLUSTER_POOL_TIMEOUT', 20, float)
+
+    # Flag indicating whether reads may be served by replicas.
+    READ_FROM_REPLICAS = env.get_var('CACHE_REDIS_CLUSTER_READ_FROM_REPLICAS', 0, int)
+
+    # Seconds to wait whilst establishing a connection.
+    SOCKET_CONNECT_TIMEOUT = env.get_var('CACHE_REDIS_CLUSTER_SOCKET_CONNECT_TIMEOUT', 5, float)
+
+    # Seconds to wait for a command response.
+    SOCKET_TIMEOUT = env.get_var('CACHE_REDIS_CLUSTER_SOCKET_TIMEOUT', 30, float)
+
+
+# Flag indicating that keys are sharded across nodes - i.e. multi-key operations must target a single slot.
+IS_CLUSTER = True
+
+# Map: partition type -> key prefix (cluster mode supports a single db only hence partitions are namespaced).
+PARTITION_PREFIXES = {
+    StorePartition.INFRA: "infra:",
+    StorePartition.MONITORING: "monitoring:",
+    StorePartition.ORCHESTRATION: "orchestration:",
+    StorePartition.STATE: "state:",
+}
+
+
+class ClusterStore(RedisCluster):
+    """A cluster accessor shared by all partitions - exiting a with block does not close it.
+
+    """
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+class ClusterStoreAsync(redis.asyncio.cluster.RedisCluster):
+    """An asyncio cluster accessor shared by all partitions - exiting an async with block does not close it.
+
+    """
+    async def __aenter__(self):
+        return await self.initialize()
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+# Cluster accessor (scoped to current process).
+_STORE: ClusterStore = None
+
+# Map: event loop -> asyncio cluster accessor (scoped to current process).
+_STORES_ASYNC: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Identifier of process that instantiated the accessor - used to detect forks.
+_STORE_PID: int = None
+
+# Guards accessor instantiation across worker threads.
+_STORE_LOCK = threading.Lock()
+
+
+def get_key_prefix(partition_type: StorePartition) -> str:
+    """Returns prefix applied to keys so as to namespace a partition.
+
+    :param partition_type: Type of partition being accessed.
+
+    :returns: A key prefix.
+
+    """
+    return PARTITION_PREFIXES[partition_type]
+
+
+def get_store(_: StorePartition) -> ClusterStore:
+    """Returns instance of a redis cluster cache store accessor.
+
+    :returns: An instance of a redis cluster cache store accessor.
+
+    """
+    global _STORE
+
+    _reset_after_fork()
+    if _STORE is None:
+        with _STORE_LOCK:
+            if _STORE is None:
+                _STORE = ClusterStore(
+                    host=EnvVars.HOST,
+                    port=EnvVars.PORT,
+                    read_from_replicas=bool(EnvVars.READ_FROM_REPLICAS),
+                    connection_pool_class=redis.BlockingConnectionPool,
+                    max_connections=EnvVars.POOL_SIZE,
+                    timeout=EnvVars.POOL_TIMEOUT,
+                    socket_connect_timeout=EnvVars.SOCKET_CONNECT_TIMEOUT,
+                    socket_timeout=EnvVars.SOCKET_TIMEOUT,
+                    )
+
+    return _STORE
+
+
+def get_store_async(_: StorePartition) -> ClusterStoreAsync:
+    """Returns instance of an asyncio redis cluster cache store accessor - must be called from within a running event loop.
+
+    :returns: An instance of an asyncio redis cluster cache store accessor.
+
+    """
+    _reset_after_fork()
+
+    # Asyncio connections are bound to the event loop within which they were opened.
+    loop = asyncio.get_running_loop()
+    try:
+        return _STORES_ASYNC[loop]
+    except KeyError:
+        return _STORES_ASYNC.setdefault(loop, ClusterStoreAsync(
+            host=EnvVars.HOST,
+            port=EnvVars.PORT,
+            read_from_replicas=bool(EnvVars.READ_FROM_REPLICAS),
+            max_connections=EnvVars.POOL_SIZE,
+            socket_connect_timeout=EnvVars.SOCKET_CONNECT_TIMEOUT,
+            socket_timeout=EnvVars.SOCKET_TIMEOUT,
+            ))
+
+
+def get_stats() -> typing.Dict[str, typing.Dict[str, int]]:
+    """Returns statistics pertaining to the current process's connection pools.
+
+    :returns: Map: cluster node name -> pool statistics.
+
+    """
+    if _STORE is None or _STORE_PID != os.getpid():
+        return {}
+
+    return {node.name: {
+        "pid": _STORE_PID,
+        "server_type": node.server_type,
+        "max_connections": pool.max_connections,
+        "created_connections": len(pool._connections),
+        "in_use_connections": len(pool._connections) - len([i for i in pool.pool.queue if i]),
+    } for node, pool in [(i, i.redis_connection.connection_pool) for i in _STORE.get_nodes() if i.redis_connection]}
+
+
+def _reset_after_fork():
+    """Resets accessors after a fork as sockets must not be shared across processes.
+
+    """
+    global _STORE, _STORE_PID
+
+    if _STORE_PID != os.getpid():
+        with _STORE_LOCK:
+            if _STORE_PID != os.getpid():
+                _STORE = None
+                _STORES_ASYNC.clear()
+                _STORE_PID = os.getpid()
@@ -1,11 +1,22 @@
+import typing
+
 import fakeredis
 
 from stests.core.cache.enums import StorePartition
 
 
-# Factory simply instantiates an instance.
-get_store = fakeredis.FakeStrictRedis
 
+# Flag indicating that keys are sharded across nodes - i.e. multi-key operations must target a single slot.
+IS_CLUSTER = False
+
+
+def get_key_prefix(_: StorePartition) -> str:
+    """Returns prefix applied to keys so as to namespace a partition.
+
+    :returns: A key prefix (empty as fake stores are not partitioned).
+
+    """
+    return ""
 
 
 def get_store(_: StorePartition) -> fakeredis.FakeStrictRedis:
@@ -15,3 +26,21 @@ def get_store(_: StorePartition) -> fakeredis.FakeStrictRedis:
 
     """
     return fakeredis.FakeStrictRedis()
+
+
+def get_store_async(_: StorePartition) -> fakeredis.aioredis.FakeRedis:
+    """Returns instance of an asyncio fake redis cache store accessor.
+
+    :returns: An instance of an asyncio fake redis cache store accessor.
+
+    """
+    return fakeredis.aioredis.FakeRedis()
+
+
+def get_stats() -> typing.Dict[str, typing.Dict[str, int]]:
+    """Returns statistics pertaining to the current process's connection pools.
+
+    :returns: Map: partition name -> pool statistics (always empty as fake stores are unpooled).
+
+    """
+    return {}
@@ -1,20 +1,70 @@
-import json
 import typing
+import collections
 import dataclasses
+import fnmatch
 import functools
+import itertools
+import json
+import re
 
 from stests.core.cache.enums import StoreOperation
 from stests.core.cache.enums import StorePartition
+from stests.core.cache import batch
+from stests.core.cache import codecs
+from stests.core.cache import leases
+from stests.core.cache import metrics
+from stests.core.cache import retention
+from stests.core.cache import scripts
 from stests.core.cache import stores
 from stests.core.utils import encoder
 
 
 
+# Set of operations that can be pipelined within a batch.
+BATCHABLE_OPERATIONS = {
+    StoreOperation.DELETE,
+    StoreOperation.GET,
+    StoreOperation.GET_COUNT,
+    StoreOperation.GET_COUNTER,
+    StoreOperation.GET_HASH,
+    StoreOperation.GET_INDEXED,
+    StoreOperation.INCR,
+    StoreOperation.INCR_COUNTS,
+    StoreOperation.LOCK,
+    StoreOperation.SET,
+    StoreOperation.SET_COUNT,
+    StoreOperation.SET_HASH,
+    StoreOperation.SET_HASH_END,
+    StoreOperation.SET_SINGLETON,
+    StoreOperation.SET_INDEXED,
+}
+
+
+class _Operands(typing.NamedTuple):
+    """Store command operands of a cache operation - derived from the value returned by a decorated function.
+
+    """
+    # Key upon which the operation is executed.
+    key: str
+
+    # Encoded item | hash mapping | count to be written, script arguments, or lease over a lock.
+    value: typing.Any = None
+
+    # Seconds after which written items expire - none = never.
+    ttl: typing.Optional[int] = None
+
+    # Hash field(s) to be read or written.
+    fields: typing.Any = None
+
+    # Key of a secondary index pointer to be written.
+    index_key: str = None
+
+
 def cache_op(partition: StorePartition, operation: StoreOperation):
     """Decorator to orthoganally process a cache operation.
 
-    :param on_success: Continuation function upon execution success.
-    :param is_substep: Flag indicating whether decorated function is a sub-step or not.
+    :param partition: Partition against which the operation is executed.
+    :param operation: Type of cache operation being executed.
 
     :returns: Decorated function.
     
@@ -27,68 +77,546 @@ def cache_op(partition: StorePartition, operation: StoreOperation):
             # JIT iniitalise encoder to ensure all types are registered.
             encoder.initialise()
 
-            with stores.get_store(partition) as store:
+            # Iterators manage their own store connection as they outlive this call.
+            if operation == StoreOperation.GET_ITER:
+                keypath = func(*args, **kwargs)
+                return iter_all(partition, _get_key(partition, keypath))
+
+            if operation == StoreOperation.GET_HASH_ITER:
+                keypath, fields = func(*args, **kwargs)
+                return iter_all_hashes(partition, _get_key(partition, keypath), fields)
+
+            returned = func(*args, **kwargs)
+
+            # Flush generators are materialised so as to derive the collection(s) being flushed.
+            if operation == StoreOperation.FLUSH:
+                returned = list(returned)
 
-                if operation == StoreOperation.DELETE:
-                    keypath = func(*args, **kwargs)
-                    key = ":".join([str(i) for i in keypath])
-                    _delete(store, key)
-
-                elif operation == StoreOperation.FLUSH:
-                    for keypaths in func(*args, **kwargs):
-                        key = ":".join([str(i) for i in keypaths])
-                        _flush(store, key)
-
-                elif operation == StoreOperation.GET:
-                    keypath = func(*args, **kwargs)
-                    key = ":".join([str(i) for i in keypath])
-                    if key.find("*") >= 0:
-                        return _get_all(store, key)
-                    else:
-                        return _get(store, key)
-
-                elif operation == StoreOperation.GET_COUNT:
-                    keypath = func(*args, **kwargs)
-                    key = ":".join([str(i) for i in keypath])
-                    return int(store.get(key))
-
-                elif operation == StoreOperation.INCR:
-                    keypath = func(*args, **kwargs)
-                    key = ":".join([str(i) for i in keypath])
-                    store.incrby(key, 1)
-
-                elif operation == StoreOperation.LOCK:
-                    keypath, data = func(*args, **kwargs)
-                    key = ":".join([str(i) for i in keypath])
-                    data = dataclasses.asdict(data)
-                    return key, _setnx(store, key, data)
-
-                elif operation == StoreOperation.SET:
-                    keypath, data = func(*args, **kwargs)
-                    key = ":".join([str(i) for i in keypath])
-                    _set(store, key, data)
-                    return key
-
-                elif operation == StoreOperation.SET_SINGLETON:
-                    keypath, data = func(*args, **kwargs)
-                    key = ":".join([str(i) for i in keypath])
-                    was_cached = _setnx(store, key, data)
-                    return key, was_cached
-
-                else:
-                    raise NotImplementedError("Cache operation is unsupported")
+            with metrics.measure(partition, operation, _get_collection(operation, returned)):
+
+                # Pipeline operation if within the scope of a batch.
+                active_batch = batch.get_active()
+                if active_batch is not None and operation in BATCHABLE_OPERATIONS:
+                    return _enqueue(active_batch, partition, operation, returned)
+
+                with stores.get_store(partition) as store:
+                    return _execute(store, partition, operation, returned)
+
+        # Asyncio variant, e.g. await cache.state.get_account.aio(account_id).
+        wrapper.aio = _get_wrapper_async(partition, operation, func)
+
+        # Keypaths declared by the operation - returned without being executed, e.g. cache.state.flush_by_run.keypaths(ctx).
+        wrapper.keypaths = func
 
         return wrapper
 
     return decorator
 
 
-def _decode_item(as_json: str) -> typing.Any:
+def aio_variant_of(func: typing.Callable) -> typing.Callable:
+    """Decorator to register a coroutine function as the asyncio variant of a composite cache function.
+
+    :param func: Synchronous cache function whose .aio attribute is to be set.
+
+    :returns: Decorator.
+
+    """
+    def decorator(afunc):
+        func.aio = afunc
+        return afunc
+
+    return decorator
+
+
+def get_run_scope(network: str, run_type: str = None, run_index_label: str = None) -> typing.List[str]:
+    """Returns keypath segments scoping a key to a run.
+
+    Segments are wrapped within a hash tag, i.e. {network:run_type:run_index}, hence a run's keys share a cluster slot
+    (so multi-key & scripted operations upon them are supported) whilst keys of different runs are spread across shards.
+    If the run is partially specified then the tag is left open so that the segments prefix a search pattern.
+
+    :param network: Name of network being tested.
+    :param run_type: Type of run being executed.
+    :param run_index_label: Label of run being executed.
+
+    :returns: Keypath segments.
+
+    """
+    if run_type is None:
+        return [f"{{{network}"]
+    if run_index_label is None:
+        return [f"{{{network}", run_type]
+
+    return [f"{{{network}", run_type, f"{run_index_label}}}"]
+
+
+def flush(
+    partition: StorePartition,
+    items: typing.Iterable[typing.Any],
+    on_progress: typing.Callable[[int], None] = None,
+    ) -> int:
+    """Flushes keys matching a set of keypath patterns within a single scan of a partition.
+
+    :param partition: Partition to be flushed.
+    :param items: Keypath patterns to be flushed - each optionally paired with a function returning keypath of an item's secondary index pointer.
+    :param on_progress: Callback invoked with running count of flushed keys as each batch of keys is unlinked.
+
+    :returns: Count of flushed keys.
+
+    """
+    with stores.get_store(partition) as store:
+        return _flush(store, partition, items, on_progress)
+
+
+def flush_partition(partition: StorePartition, on_progress: typing.Callable[[int], None] = None) -> int:
+    """Flushes all keys within a partition.
+
+    :param partition: Partition to be flushed.
+    :param on_progress: Callback invoked with running count of flushed keys.
+
+    :returns: Count of flushed keys.
+
+    """
+    # Cluster partitions share a single keyspace, hence are flushed by prefix.
+    if stores.is_cluster():
+        return flush(partition, [["*"]], on_progress)
+
+    with stores.get_store(partition) as store:
+        count = store.dbsize()
+        store.flushdb(asynchronous=True)
+    if on_progress:
+        on_progress(count)
+
+    return count
+
+
+def iter_all(partition: StorePartition, search_key: str) -> typing.Iterator[typing.Any]:
+    """Yields cached items matching a search key.
+
+    The scan cursor is followed to completion, values are pulled in bounded chunks & decoded lazily,
+    hence memory usage is independent of the number of matched items.
+
+    :param partition: Partition to be searched.
+    :param search_key: Key pattern to be matched.
+
+    :returns: Generator of decoded domain objects.
+
+    """
+    with stores.get_store(partition) as store:
+        yield from metrics.measure_iter(
+            partition,
+            StoreOperation.GET_ITER,
+            _get_collection_of_key(partition, search_key),
+            _iter_all(store, search_key),
+            )
+
+
+def iter_all_hashes(partition: StorePartition, search_key: str, fields: typing.List[str] = None) -> typing.Iterator[typing.Any]:
+    """Yields cached items held as hashes matching a search key.
+
+    :param partition: Partition to be searched.
+    :param search_key: Key pattern to be matched.
+    :param fields: Fields to be pulled - others are set to none - if unspecified then all fields are pulled.
+
+    :returns: Generator of decoded domain objects.
+
+    """
+    with stores.get_store(partition) as store:
+        yield from metrics.measure_iter(
+            partition,
+            StoreOperation.GET_HASH_ITER,
+            _get_collection_of_key(partition, search_key),
+            _iter_all_hashes(store, search_key, fields),
+            )
+
+
+def iter_keys(partition: StorePartition, items: typing.Iterable[typing.Any]) -> typing.Iterator[typing.List[bytes]]:
+    """Yields chunks of keys matching a set of keypath patterns - all patterns are matched within a single scan of a partition.
+
+    :param partition: Partition to be searched.
+    :param items: Keypath patterns to be matched - as declared by a flush operation, e.g. cache.state.flush_by_run.keypaths(ctx).
+
+    :returns: Generator of matched key chunks.
+
+    """
+    search_key, matchers = _get_flush_matchers(partition, items)
+    with stores.get_store(partition) as store:
+        for keys in _iter_keys(store, search_key):
+            # A single pattern is the scanned pattern, hence needs no client side filtering.
+            if len(matchers) > 1:
+                keys = [i for i in keys if any(fnmatch.fnmatchcase(i.decode("utf-8"), j) for j, _ in matchers)]
+            if keys:
+                yield keys
+
+
+async def aiter_all(partition: StorePartition, search_key: str) -> typing.AsyncIterator[typing.Any]:
+    """Yields (asynchronously) cached items matching a search key.
+
+    :param partition: Partition to be searched.
+    :param search_key: Key pattern to be matched.
+
+    :returns: Async generator of decoded domain objects.
+
+    """
+    async with stores.get_store_async(partition) as store:
+        async for obj in metrics.measure_aiter(
+            partition,
+            StoreOperation.GET_ITER,
+            _get_collection_of_key(partition, search_key),
+            _iter_all_async(store, search_key),
+            ):
+            yield obj
+
+
+async def aiter_all_hashes(partition: StorePartition, search_key: str, fields: typing.List[str] = None) -> typing.AsyncIterator[typing.Any]:
+    """Yields (asynchronously) cached items held as hashes matching a search key.
+
+    :param partition: Partition to be searched.
+    :param search_key: Key pattern to be matched.
+    :param fields: Fields to be pulled - others are set to none - if unspecified then all fields are pulled.
+
+    :returns: Async generator of decoded domain objects.
+
+    """
+    async with stores.get_store_async(partition) as store:
+        async for obj in metrics.measure_aiter(
+            partition,
+            StoreOperation.GET_HASH_ITER,
+            _get_collection_of_key(partition, search_key),
+            _iter_all_hashes_async(store, search_key, fields),
+            ):
+            yield obj
+
+
+def _get_wrapper_async(partition: StorePartition, operation: StoreOperation, func: typing.Callable) -> typing.Callable:
+    """Returns asyncio variant of a cache operation - never batched as concurrency is obtained by gathering calls.
+
+    """
+    # Iterators manage their own store connection as they outlive this call.
+    if operation == StoreOperation.GET_ITER:
+        @functools.wraps(func)
+        def wrapper_iter(*args, **kwargs):
+            encoder.initialise()
+            keypath = func(*args, **kwargs)
+            return aiter_all(partition, _get_key(partition, keypath))
+
+        return wrapper_iter
+
+    if operation == StoreOperation.GET_HASH_ITER:
+        @functools.wraps(func)
+        def wrapper_iter_hashes(*args, **kwargs):
+            encoder.initialise()
+            keypath, fields = func(*args, **kwargs)
+            return aiter_all_hashes(partition, _get_key(partition, keypath), fields)
+
+        return wrapper_iter_hashes
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        encoder.initialise()
+        returned = func(*args, **kwargs)
+        if operation == StoreOperation.FLUSH:
+            returned = list(returned)
+        with metrics.measure(partition, operation, _get_collection(operation, returned)):
+            async with stores.get_store_async(partition) as store:
+                return await _execute_async(store, partition, operation, returned)
+
+    return wrapper
+
+
+def _execute(store: typing.Callable, partition: StorePartition, operation: StoreOperation, returned: typing.Any) -> typing.Any:
+    """Executes a cache operation against a store.
+
+    """
+    if operation == StoreOperation.FLUSH:
+        return _flush(store, partition, returned)
+
+    operands = _get_operands(partition, operation, returned)
+    key = operands.key
+
+    if operation == StoreOperation.DELETE:
+        store.delete(key)
+
+    elif operation == StoreOperation.GET:
+        if key.find("*") >= 0:
+            return _get_all(store, key)
+        else:
+            return _get(store, key)
+
+    elif operation == StoreOperation.GET_HASH:
+        return _get_hash(store, key, operands.fields)
+
+    elif operation == StoreOperation.GET_INDEXED:
+        return _get_indexed(store, key)
+
+    elif operation == StoreOperation.GET_COUNT:
+        return _decode_count(store.hget(key, operands.fields))
+
+    elif operation == StoreOperation.GET_COUNTER:
+        return _decode_count(store.get(key))
+
+    elif operation == StoreOperation.INCR:
+        return store.incrby(key, 1)
+
+    elif operation == StoreOperation.INCR_COUNTS:
+        return _decode_counts(_queue_script(store, scripts.INCR_COUNTS, key, operands.value))
+
+    elif operation == StoreOperation.LOCK:
+        return operands.value, bool(_queue_set_lease(store, operands.value))
+
+    elif operation == StoreOperation.SET:
+        store.set(key, operands.value, ex=operands.ttl)
+        return key
+
+    elif operation == StoreOperation.SET_COUNT:
+        store.hset(key, operands.fields, operands.value)
+        return key
+
+    elif operation == StoreOperation.SET_HASH:
+        _queue_set_hash(store.pipeline(transaction=False), operands).execute()
+        return key
+
+    elif operation == StoreOperation.SET_HASH_END:
+        return _decode_float_or_none(_queue_script(store, scripts.SET_HASH_END, key, operands.value))
+
+    elif operation == StoreOperation.SET_SINGLETON:
+        return key, bool(store.set(key, operands.value, nx=True, ex=operands.ttl))
+
+    elif operation == StoreOperation.SET_INDEXED:
+        _queue_set_indexed(store.pipeline(transaction=False), operands).execute()
+        return key
+
+
+async def _execute_async(store: typing.Any, partition: StorePartition, operation: StoreOperation, returned: typing.Any) -> typing.Any:
+    """Executes a cache operation against an asyncio store - asyncio variant of _execute.
+
+    """
+    if operation == StoreOperation.FLUSH:
+        return await _flush_async(store, partition, returned)
+
+    operands = _get_operands(partition, operation, returned)
+    key = operands.key
+
+    if operation == StoreOperation.DELETE:
+        await store.delete(key)
+
+    elif operation == StoreOperation.GET:
+        if key.find("*") >= 0:
+            return [i async for i in _iter_all_async(store, key)]
+        else:
+            return _decode_item_or_none(await store.get(key))
+
+    elif operation == StoreOperation.GET_HASH:
+        return _decode_hash(await _queue_get_hash(store, key, operands.fields), operands.fields)
+
+    elif operation == StoreOperation.GET_INDEXED:
+        key = await store.get(key)
+        return None if key is None else _decode_item_or_none(await store.get(key))
+
+    elif operation == StoreOperation.GET_COUNT:
+        return _decode_count(await store.hget(key, operands.fields))
+
+    elif operation == StoreOperation.GET_COUNTER:
+        return _decode_count(await store.get(key))
+
+    elif operation == StoreOperation.INCR:
+        return await store.incrby(key, 1)
+
+    elif operation == StoreOperation.INCR_COUNTS:
+        return _decode_counts(await _queue_script(store, scripts.INCR_COUNTS, key, operands.value))
+
+    elif operation == StoreOperation.LOCK:
+        return operands.value, bool(await _queue_set_lease(store, operands.value))
+
+    elif operation == StoreOperation.SET:
+        await store.set(key, operands.value, ex=operands.ttl)
+        return key
+
+    elif operation == StoreOperation.SET_COUNT:
+        await store.hset(key, operands.fields, operands.value)
+        return key
+
+    elif operation == StoreOperation.SET_HASH:
+        await _queue_set_hash(store.pipeline(transaction=False), operands).execute()
+        return key
+
+    elif operation == StoreOperation.SET_HASH_END:
+        return _decode_float_or_none(await _queue_script(store, scripts.SET_HASH_END, key, operands.value))
+
+    elif operation == StoreOperation.SET_SINGLETON:
+        return key, bool(await store.set(key, operands.value, nx=True, ex=operands.ttl))
+
+    elif operation == StoreOperation.SET_INDEXED:
+        await _queue_set_indexed(store.pipeline(transaction=False), operands).execute()
+        return key
+
+
+def _enqueue(active_batch: batch.CacheBatch, partition: StorePartition, operation: StoreOperation, returned: typing.Any) -> typing.Any:
+    """Queues a cache operation within a batch, results are resolved when the batch is executed.
+
+    """
+    operands = _get_operands(partition, operation, returned)
+    key = operands.key
+
+    if operation == StoreOperation.DELETE:
+        active_batch.enqueue(partition, lambda pipeline: pipeline.delete(key))
+
+    elif operation == StoreOperation.GET:
+        # Wildcard reads scan the keyspace, hence cannot be pipelined & so execute immediately.
+        if key.find("*") >= 0:
+            with stores.get_store(partition) as store:
+                return _get_all(store, key)
+        return active_batch.enqueue(partition, lambda pipeline: pipeline.get(key), _decode_item_or_none)
+
+    elif operation == StoreOperation.GET_HASH:
+        return active_batch.enqueue(
+            partition,
+            lambda pipeline: _queue_get_hash(pipeline, key, operands.fields),
+            lambda raw: _decode_hash(raw, operands.fields)
+            )
+
+    elif operation == StoreOperation.GET_INDEXED:
+        # Items are pulled via their pointers within a subsequent pipeline of the same batch.
+        return active_batch.enqueue(
+            partition,
+            lambda pipeline: pipeline.get(key),
+            lambda item_key: _enqueue_get_by_pointer(active_batch, partition, item_key)
+            )
+
+    elif operation == StoreOperation.GET_COUNT:
+        return active_batch.enqueue(partition, lambda pipeline: pipeline.hget(key, operands.fields), _decode_count)
+
+    elif operation == StoreOperation.GET_COUNTER:
+        return active_batch.enqueue(partition, lambda pipeline: pipeline.get(key), _decode_count)
+
+    elif operation == StoreOperation.INCR:
+        return active_batch.enqueue(partition, lambda pipeline: pipeline.incrby(key, 1))
+
+    elif operation == StoreOperation.INCR_COUNTS:
+        return active_batch.enqueue(
+            partition,
+            lambda pipeline: _queue_script(pipeline, scripts.INCR_COUNTS, key, operands.value),
+            _decode_counts
+            )
+
+    elif operation == StoreOperation.LOCK:
+        return operands.value, active_batch.enqueue(partition, lambda pipeline: _queue_set_lease(pipeline, operands.value), bool)
+
+    elif operation == StoreOperation.SET:
+        active_batch.enqueue(partition, lambda pipeline: pipeline.set(key, operands.value, ex=operands.ttl))
+        return key
+
+    elif operation == StoreOperation.SET_COUNT:
+        active_batch.enqueue(partition, lambda pipeline: pipeline.hset(key, operands.fields, operands.value))
+        return key
+
+    elif operation == StoreOperation.SET_HASH:
+        active_batch.enqueue(partition, lambda pipeline: pipeline.hset(key, mapping=operands.value))
+        if operands.ttl:
+            active_batch.enqueue(partition, lambda pipeline: pipeline.expire(key, operands.ttl))
+        return key
+
+    elif operation == StoreOperation.SET_HASH_END:
+        return active_batch.enqueue(
+            partition,
+            lambda pipeline: _queue_script(pipeline, scripts.SET_HASH_END, key, operands.value),
+            _decode_float_or_none
+            )
+
+    elif operation == StoreOperation.SET_SINGLETON:
+        return key, active_batch.enqueue(partition, lambda pipeline: pipeline.set(key, operands.value, nx=True, ex=operands.ttl), bool)
+
+    elif operation == StoreOperation.SET_INDEXED:
+        active_batch.enqueue(partition, lambda pipeline: pipeline.set(key, operands.value, ex=operands.ttl))
+        active_batch.enqueue(partition, lambda pipeline: pipeline.set(operands.index_key, key, ex=operands.ttl))
+        return key
+
+
+def _enqueue_get_by_pointer(active_batch: batch.CacheBatch, partition: StorePartition, key: typing.Optional[bytes]) -> typing.Any:
+    """Queues a redis.get command within a batch - pulling an item via a previously resolved pointer (if any).
+
+    """
+    if key is not None:
+        return active_batch.enqueue(partition, lambda pipeline: pipeline.get(key), _decode_item_or_none)
+
+
+def _decode_count(value: typing.Optional[bytes]) -> int:
+    """Returns a decoded count - zero if the count was not cached.
+
+    """
+    return int(value or 0)
+
+
+def _decode_counts(values: typing.List[typing.Optional[typing.Union[int, bytes]]]) -> typing.Tuple[typing.Optional[int], ...]:
+    """Returns decoded counts returned by the INCR_COUNTS script - trailing total is none if not cached.
+
+    """
+    return tuple(None if i is None else int(i) for i in values)
+
+
+def _decode_float_or_none(value: typing.Optional[bytes]) -> typing.Optional[float]:
+    """Returns a decoded float or none if not returned.
+
+    """
+    if value is not None:
+        return float(value)
+
+
+def _decode_hash(raw: typing.Union[typing.Dict[bytes, bytes], typing.List[bytes]], fields: typing.List[str] = None) -> typing.Any:
+    """Returns a decoded domain object held as a hash of individually JSON encoded fields - none if not cached.
+
+    """
+    if fields:
+        obj = {k: json.loads(v) for k, v in zip(["_type_key"] + fields, raw) if v is not None}
+    else:
+        obj = {k.decode("utf-8"): json.loads(v) for k, v in raw.items()}
+    if "_type_key" not in obj:
+        return None
+    metrics.on_decoded(sum(len(i) for i in raw if i is not None) if fields else sum(len(k) + len(v) for k, v in raw.items()))
+
+    # Fields not pulled are set to none.
+    for field in dataclasses.fields(encoder.DCLASS_MAP[obj["_type_key"]]):
+        obj.setdefault(field.name, None)
+
+    return encoder.decode(obj)
+
+
+def _decode_item(value: bytes) -> typing.Any:
     """Returns a decoded encached domain object(s).
 
     """
-    return encoder.decode(json.loads(as_json))
-    
+    metrics.on_decoded(len(value))
+
+    return encoder.decode(codecs.decode(value))
+
+
+def _decode_item_or_none(value: typing.Optional[bytes]) -> typing.Any:
+    """Returns a decoded encached domain object(s) or none if the item was not cached.
+
+    """
+    if value is not None:
+        return _decode_item(value)
+
+
+def _encode_hash(data: typing.Any) -> typing.Dict[str, str]:
+    """Returns a domain object encoded as a hash of individually JSON encoded fields.
+
+    """
+    mapping = {k: json.dumps(v) for k, v in encoder.encode(data).items()}
+    metrics.on_encoded(sum(len(k) + len(v) for k, v in mapping.items()))
+
+    return mapping
+
+
+def _encode_item(data: typing.Any) -> bytes:
+    """Returns a domain object encoded in readiness for caching.
+
+    """
+    value = codecs.encode(encoder.encode(data))
+    metrics.on_encoded(len(value))
+
+    return value
+
 
 def _delete(store: typing.Callable, key: str):
     """Wraps redis.delete command.
@@ -97,58 +625,409 @@ def _delete(store: typing.Callable, key: str):
     store.delete(key)
 
 
-def _flush(store: typing.Callable, ns_keys: str):
-    """Flushes data from cache.
+def _flush(
+    store: typing.Callable,
+    partition: StorePartition,
+    items: typing.Iterable[typing.Any],
+    on_progress: typing.Callable[[int], None] = None,
+    ) -> int:
+    """Flushes data from cache - memory is reclaimed in the background server side (i.e. UNLINK).
+
+    All patterns are matched within a single scan of the partition, each scanned chunk is unlinked in a single round trip.
+
+    :param store: Cache store.
+    :param partition: Partition being flushed.
+    :param items: Keypath patterns to be flushed - each optionally paired with a function returning keypath of an item's secondary index pointer.
+    :param on_progress: Callback invoked with running count of flushed keys.
+
+    :returns: Count of flushed keys.
 
     """
-    CHUNK_SIZE = 1000
-    cursor = '0'
-    while cursor != 0:
-        cursor, keys = store.scan(cursor=cursor, match=ns_keys, count=CHUNK_SIZE)
+    search_key, matchers = _get_flush_matchers(partition, items)
+    count = 0
+    for keys in _iter_keys(store, search_key):
+        keys = _get_keys_to_flush(partition, matchers, keys)
         if keys:
-            store.delete(*keys)
+            count += _unlink(store, keys)
+            if on_progress:
+                on_progress(count)
+
+    return count
+
+
+async def _flush_async(store: typing.Any, partition: StorePartition, items: typing.Iterable[typing.Any]) -> int:
+    """Flushes data from cache - asyncio variant of _flush.
+
+    """
+    search_key, matchers = _get_flush_matchers(partition, items)
+    count = 0
+    async for keys in _iter_keys_async(store, search_key):
+        keys = _get_keys_to_flush(partition, matchers, keys)
+        if keys:
+            count += await _unlink_async(store, keys)
+
+    return count
 
 
 def _get(store: typing.Callable, key: str) -> typing.Any:
     """Wraps redis.get command.
     
     """
-    obj = store.get(key)
-    if obj is not None:
-        return _decode_item(obj)
+    return _decode_item_or_none(store.get(key))
 
 
 def _get_all(store: typing.Callable, search_key: str) -> typing.List[typing.Any]:
     """Wraps redis.mget command.
     
     """
-    CHUNK_SIZE = 5000
-    _, keys = store.scan(match=search_key, count=CHUNK_SIZE)
-
-    return [_decode_item(i) for i in store.mget(keys)] if keys else []
+    return list(_iter_all(store, search_key))
 
 
 def _get_count(store: typing.Callable, search_key: str) -> int:
-    """Wraps redis.mget command.
+    """Wraps redis.scan command.
     
     """
-    CHUNK_SIZE = 5000
-    _, keys = store.scan(match=search_key, count=CHUNK_SIZE)
+    return sum(len(i) for i in _iter_keys(store, search_key))
+
+
+def _get_args_set_hash_end(status: str, ts_end: float) -> typing.List[str]:
+    """Returns arguments passed to SET_HASH_END script - JSON encoded as per hash fields.
+
+    """
+    return [json.dumps(status), json.dumps(ts_end)]
+
+
+def _get_keys_by_slot(store: typing.Any, keys: typing.List[typing.Union[bytes, str]]) -> typing.Iterable[typing.List]:
+    """Returns keys grouped by cluster slot.
+
+    """
+    slots = collections.defaultdict(list)
+    for key in keys:
+        slots[store.keyslot(key)].append(key)
 
-    return len(keys)
+    return slots.values()
 
 
-def _set(store: typing.Callable, key: str, data: typing.Any) -> str:
-    """Wraps redis.set command.
+def _get_lease(partition: StorePartition, key: str, data: typing.Any) -> leases.Lease:
+    """Returns a lease over a lock - lock value embeds a token unique to the lease owner.
     
     """
-    store.set(key, json.dumps(encoder.encode(data), indent=4))
+    value = _encode_item({**dataclasses.asdict(data), "lease_token": leases.create_token()})
+
+    return leases.Lease(partition, key, value, leases.get_ttl(data))
+
+
+def _get_collection(operation: StoreOperation, returned: typing.Any) -> str:
+    """Returns collection upon which a cache operation is executed - i.e. first segment of the keypath(s) it returned.
+
+    """
+    if operation == StoreOperation.FLUSH:
+        collections = {str((i[0] if isinstance(i, tuple) else i)[0]) for i in returned}
+        return collections.pop() if len(collections) == 1 else metrics.ANY_COLLECTION
+
+    keypath = returned[0] if isinstance(returned, tuple) else returned
+
+    return str(keypath[0])
+
+
+def _get_collection_of_key(partition: StorePartition, key: str) -> str:
+    """Returns collection to which a cache key (or key pattern) belongs.
+
+    """
+    return key[len(stores.get_key_prefix(partition)):].split(":")[0]
+
+
+def _get_flush_matchers(
+    partition: StorePartition,
+    items: typing.Iterable[typing.Any],
+    ) -> typing.Tuple[str, typing.List[typing.Tuple[str, typing.Optional[typing.Callable]]]]:
+    """Returns key pattern scanned when flushing a set of keypath patterns along with the patterns themselves.
+
+    The scanned pattern matches the longest literal substring common to all patterns, e.g. a run's hash tag,
+    scanned keys are subsequently filtered client side.
+
+    """
+    matchers = [
+        (_get_key(partition, i[0]), i[1]) if isinstance(i, tuple) else (_get_key(partition, i), None)
+        for i in items
+        ]
+    if len(matchers) == 1:
+        return matchers[0][0], matchers
+
+    # Literal segments of each pattern (sans partition prefix) - i.e. those between wildcards.
+    prefix = stores.get_key_prefix(partition)
+    segments = [[j for j in re.split(r"[*?\[]", i[len(prefix):]) if j] for i, _ in matchers]
+
+    # Longest substring of a literal segment of the first pattern found within a literal segment of every other pattern.
+    common = ""
+    for segment in segments[0]:
+        for start in range(len(segment)):
+            for end in range(len(segment), start + len(common), -1):
+                candidate = segment[start:end]
+                if all(any(candidate in j for j in i) for i in segments[1:]):
+                    common = candidate
+                    break
+
+    return f"{prefix}*{common}*" if common else f"{prefix}*", matchers
+
+
+def _get_operands(partition: StorePartition, operation: StoreOperation, returned: typing.Any) -> _Operands:
+    """Returns store command operands of a cache operation - shared by direct, asyncio & batched execution.
+
+    """
+    if operation in (
+        StoreOperation.DELETE,
+        StoreOperation.GET,
+        StoreOperation.GET_COUNTER,
+        StoreOperation.GET_INDEXED,
+        StoreOperation.INCR,
+        ):
+        return _Operands(_get_key(partition, returned))
+
+    elif operation in (StoreOperation.GET_COUNT, StoreOperation.GET_HASH):
+        keypath, fields = returned
+        return _Operands(_get_key(partition, keypath), fields=fields)
+
+    elif operation == StoreOperation.INCR_COUNTS:
+        keypath, fields, total_field = returned
+        return _Operands(_get_key(partition, keypath), [total_field] + fields)
+
+    elif operation == StoreOperation.LOCK:
+        keypath, data = returned
+        lease = _get_lease(partition, _get_key(partition, keypath), data)
+        return _Operands(lease.key, lease)
+
+    elif operation in (StoreOperation.SET, StoreOperation.SET_SINGLETON):
+        keypath, data = returned
+        return _Operands(_get_key(partition, keypath), _encode_item(data), retention.get_ttl(partition, keypath))
+
+    elif operation == StoreOperation.SET_COUNT:
+        keypath, field, count = returned
+        return _Operands(_get_key(partition, keypath), count, fields=field)
 
-    return key
+    elif operation == StoreOperation.SET_HASH:
+        keypath, data = returned
+        return _Operands(_get_key(partition, keypath), _encode_hash(data), retention.get_ttl(partition, keypath))
 
+    elif operation == StoreOperation.SET_HASH_END:
+        keypath, status, ts_end = returned
+        return _Operands(_get_key(partition, keypath), _get_args_set_hash_end(status, ts_end))
 
-def _setnx(store: typing.Callable, key: str, data: typing.Any) -> typing.Tuple[str, bool]:
-    """Wraps redis.setnx command.
+    elif operation == StoreOperation.SET_INDEXED:
+        keypath, data, index_keypath = returned
+        return _Operands(
+            _get_key(partition, keypath),
+            _encode_item(data),
+            retention.get_ttl(partition, keypath),
+            index_key=_get_key(partition, index_keypath),
+            )
+
+    raise NotImplementedError("Cache operation is unsupported")
+
+
+def _get_hash(store: typing.Callable, key: str, fields: typing.List[str] = None) -> typing.Any:
+    """Wraps redis.hgetall | redis.hmget commands.
+    
+    """
+    return _decode_hash(_queue_get_hash(store, key, fields), fields)
+
+
+def _get_indexed(store: typing.Callable, index_key: str) -> typing.Any:
+    """Wraps redis.get command - resolving item key via a pointer.
+
+    An item's key is unknown until its pointer is read, hence cannot be declared to a script - so is resolved in two round trips.
+    
+    """
+    key = store.get(index_key)
+
+    return None if key is None else _get(store, key)
+
+
+def _get_key(partition: StorePartition, keypath: typing.List[typing.Any]) -> str:
+    """Returns a cache key derived from a keypath - prefixed if partitions are namespaced within a single keyspace.
+    
+    """
+    return stores.get_key_prefix(partition) + ":".join([str(i) for i in keypath])
+
+
+def _get_keys_to_flush(
+    partition: StorePartition,
+    matchers: typing.List[typing.Tuple[str, typing.Optional[typing.Callable]]],
+    keys: typing.List[bytes],
+    ) -> typing.List[typing.Union[bytes, str]]:
+    """Returns scanned keys matching a flush pattern along with their secondary index pointers (if any).
+
+    """
+    flushed = []
+    for key in keys:
+        key_str = key.decode("utf-8")
+        for pattern, get_index_keypath in matchers:
+            # A single pattern is the scanned pattern, hence needs no client side filtering.
+            if len(matchers) == 1 or fnmatch.fnmatchcase(key_str, pattern):
+                flushed.append(key)
+                if get_index_keypath:
+                    flushed.append(_get_key(partition, get_index_keypath(key_str)))
+                break
+
+    return flushed
+
+
+def _iter_all(store: typing.Callable, search_key: str) -> typing.Iterator[typing.Any]:
+    """Wraps redis.mget command - applied to chunks of scanned keys.
+    
+    """
+    # Scanned keys span cluster slots, hence cluster stores split mget by slot.
+    mget = store.mget_nonatomic if stores.is_cluster() else store.mget
+    for keys in _iter_keys(store, search_key):
+        for obj in mget(keys):
+            # Keys may have been deleted between scan & mget.
+            if obj is not None:
+                yield _decode_item(obj)
+
+
+async def _iter_all_async(store: typing.Any, search_key: str) -> typing.AsyncIterator[typing.Any]:
+    """Wraps redis.mget command - applied to chunks of scanned keys - asyncio variant of _iter_all.
+    
+    """
+    mget = store.mget_nonatomic if stores.is_cluster() else store.mget
+    async for keys in _iter_keys_async(store, search_key):
+        for obj in await mget(keys):
+            # Keys may have been deleted between scan & mget.
+            if obj is not None:
+                yield _decode_item(obj)
+
+
+def _iter_all_hashes(store: typing.Callable, search_key: str, fields: typing.List[str] = None) -> typing.Iterator[typing.Any]:
+    """Wraps redis.hgetall | redis.hmget commands - applied to chunks of scanned keys.
+    
+    """
+    for keys in _iter_keys(store, search_key):
+        pipeline = store.pipeline(transaction=False)
+        for key in keys:
+            _queue_get_hash(pipeline, key, fields)
+        for raw in pipeline.execute():
+            # Keys may have been deleted between scan & pull.
+            obj = _decode_hash(raw, fields)
+            if obj is not None:
+                yield obj
+
+
+async def _iter_all_hashes_async(store: typing.Any, search_key: str, fields: typing.List[str] = None) -> typing.AsyncIterator[typing.Any]:
+    """Wraps redis.hgetall | redis.hmget commands - applied to chunks of scanned keys - asyncio variant of _iter_all_hashes.
+    
+    """
+    async for keys in _iter_keys_async(store, search_key):
+        pipeline = store.pipeline(transaction=False)
+        for key in keys:
+            _queue_get_hash(pipeline, key, fields)
+        for raw in await pipeline.execute():
+            # Keys may have been deleted between scan & pull.
+            obj = _decode_hash(raw, fields)
+            if obj is not None:
+                yield obj
+
+
+def _iter_keys(store: typing.Callable, search_key: str) -> typing.Iterator[typing.List[str]]:
+    """Wraps redis.scan command - yields chunks of matched keys until cursor(s) are exhausted.
+
+    Cluster stores scan each primary node in turn.
+    
+    """
+    CHUNK_SIZE = 1000
+    matched = store.scan_iter(match=search_key, count=CHUNK_SIZE)
+    while True:
+        keys = list(itertools.islice(matched, CHUNK_SIZE))
+        if not keys:
+            return
+        metrics.on_scanned(len(keys))
+        yield keys
+
+
+async def _iter_keys_async(store: typing.Any, search_key: str) -> typing.AsyncIterator[typing.List[bytes]]:
+    """Wraps redis.scan command - yields chunks of matched keys until cursor(s) are exhausted - asyncio variant of _iter_keys.
+    
+    """
+    CHUNK_SIZE = 1000
+    keys = []
+    async for key in store.scan_iter(match=search_key, count=CHUNK_SIZE):
+        keys.append(key)
+        if len(keys) == CHUNK_SIZE:
+            metrics.on_scanned(len(keys))
+            yield keys
+            keys = []
+    if keys:
+        metrics.on_scanned(len(keys))
+        yield keys
+
+
+def _queue_get_hash(store: typing.Callable, key: str, fields: typing.List[str] = None) -> typing.Any:
+    """Issues either a redis.hgetall or a redis.hmget command (upon a store or pipeline).
+    
+    """
+    if fields:
+        return store.hmget(key, ["_type_key"] + fields)
+
+    return store.hgetall(key)
+
+
+def _queue_script(store: typing.Callable, script: str, key: str, args: typing.List[str] = None) -> typing.Any:
+    """Issues a redis.evalsha command (upon a store or pipeline) - scripts operate upon a single key.
+
+    """
+    return store.register_script(script)(keys=[key], args=args or [], client=store)
+
+
+def _queue_set_hash(pipeline: typing.Any, operands: _Operands) -> typing.Any:
+    """Issues a redis.hset command upon a pipeline - expiring the item (in the same round trip) if a ttl is specified.
+
+    """
+    pipeline.hset(operands.key, mapping=operands.value)
+    if operands.ttl:
+        pipeline.expire(operands.key, operands.ttl)
+
+    return pipeline
+
+
+def _queue_set_indexed(pipeline: typing.Any, operands: _Operands) -> typing.Any:
+    """Issues redis.set commands upon a pipeline - setting an item & a secondary index pointer to it - both expire if a ttl is specified.
+
+    """
+    pipeline.set(operands.key, operands.value, ex=operands.ttl)
+    pipeline.set(operands.index_key, operands.key, ex=operands.ttl)
+
+    return pipeline
+
+
+def _queue_set_lease(store: typing.Callable, lease: leases.Lease) -> typing.Any:
+    """Issues a redis.set command (upon a store or pipeline) - setting a lock with an expiry only if not already set.
+
+    """
+    return store.set(lease.key, lease.value, nx=True, px=lease.ttl * 1000)
+
+
+def _unlink(store: typing.Callable, keys: typing.List[typing.Union[bytes, str]]) -> int:
+    """Wraps redis.unlink command - keys spanning cluster slots are unlinked per slot within a single pipeline.
+    
+    """
+    if not stores.is_cluster():
+        return store.unlink(*keys)
+
+    pipeline = store.pipeline(transaction=False)
+    for slot_keys in _get_keys_by_slot(store, keys):
+        pipeline.unlink(*slot_keys)
+
+    return sum(pipeline.execute())
+
+
+async def _unlink_async(store: typing.Any, keys: typing.List[typing.Union[bytes, str]]) -> int:
+    """Wraps redis.unlink command - asyncio variant of _unlink.
     
     """
-    return bool(store.setnx(key, json.dumps(encoder.encode(data), indent=4)))
+    if not stores.is_cluster():
+        return await store.unlink(*keys)
+
+    pipeline = store.pipeline(transaction=False)
+    for slot_keys in _get_keys_by_slot(store, keys):
+        pipeline.unlink(*slot_keys)
+
+    return sum(await pipeline.execute())
@@ -1,8 +1,15 @@
 from stests.core.clx.deploy import do_deploy_client_contract
 from stests.core.clx.deploy import do_refund
+from stests.core.clx.deploy import do_refunds
 from stests.core.clx.deploy import do_transfer
+from stests.core.clx.deploy import do_transfers
 from stests.core.clx.query import get_balance
+from stests.core.clx.query import get_balances
 from stests.core.clx.query import get_block
+from stests.core.clx.query import get_block_with_deploys
 from stests.core.clx.query import get_deploys
+from stests.core.clx.query import get_last_block_hash
 from stests.core.clx.stream import stream_events
 from stests.core.clx.utils import get_client
+from stests.core.clx.pool import get_stats as get_client_pool_stats
+from stests.core.clx.router import get_stats as get_router_stats
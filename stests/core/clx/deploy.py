@@ -1,8 +1,13 @@
+import concurrent.futures
+import os
+import threading
 import typing
 
+import casperlabs_client
 from casperlabs_client.abi import ABI
 
 from stests.core.clx import defaults
+from stests.core.clx import router
 from stests.core.clx import utils
 from stests.core.clx.query import get_balance
 from stests.core.domain import Account
@@ -12,12 +17,33 @@ from stests.core.domain import Network
 from stests.core.domain import Transfer
 from stests.core.domain import Deploy
 from stests.core.domain import DeployType
+from stests.core.domain import Node
 from stests.core.orchestration import ExecutionContext
+from stests.core.utils import env
 from stests.core.utils import factory
 from stests.core.utils import logger
 
 
 
+# Environment variables required by this module.
+class EnvVars:
+    # Number of processes across which batched deploys are signed (0 = sign in calling thread).
+    SIGNING_PROCESSES = env.get_var('CLX_SIGNING_PROCESSES', 0, int)
+
+    # Minimum batch size for which signing is delegated to process pool.
+    SIGNING_PROCESSES_THRESHOLD = env.get_var('CLX_SIGNING_PROCESSES_THRESHOLD', 64, int)
+
+
+# Signing process pool (scoped to current process).
+_SIGNERS: concurrent.futures.ProcessPoolExecutor = None
+
+# Identifier of process that instantiated the signing pool - used to detect forks.
+_SIGNERS_PID: int = None
+
+# Guards signing pool instantiation across worker threads.
+_SIGNERS_LOCK = threading.Lock()
+
+
 @utils.clx_op
 def do_refund(
     ctx: ExecutionContext,
@@ -47,6 +73,37 @@ def do_refund(
     return (node, dhash, amount)
 
 
+@utils.clx_op
+def do_refunds(
+    ctx: ExecutionContext,
+    refunds: typing.List[typing.Tuple[Account, Account]],
+    contract: ClientContract = None,
+    on_dispatched: typing.Callable[[Node, typing.Tuple[Account, Account, int, str]], None] = None,
+    on_signed: typing.Callable[[Node, typing.List[typing.Tuple[Account, Account, int, str]]], None] = None,
+    ) -> typing.Tuple[Node, typing.List[typing.Tuple[Account, Account, int, str]]]:
+    """Executes a batch of refunds - each refunding counter party 1's entire balance less fee.
+
+    :param ctx: Execution context information.
+    :param refunds: Counter parties to be refunded.
+    :param contract: The transfer contract to call (if any).
+    :param on_dispatched: Callback invoked with (node, (cp1, cp2, amount, deploy hash)) as each deploy is dispatched.
+    :param on_signed: Callback invoked with (node, set of (cp1, cp2, amount, deploy hash)) once deploys are signed & prior to dispatch.
+
+    :returns: Node to which deploys were dispatched plus set of (cp1, cp2, amount, deploy hash).
+
+    """
+    # Set amounts - skipping counter parties with insufficient funds.
+    transfers = []
+    for cp1, cp2 in refunds:
+        amount = get_balance(ctx, cp1) - defaults.CLX_TX_FEE
+        if amount <= 0:
+            logger.log_warning("Counter party 1 does not have enough CLX to pay refund transaction fee.")
+        else:
+            transfers.append((cp1, cp2, amount))
+
+    return do_transfers(ctx, transfers, contract, on_dispatched, on_signed)
+
+
 @utils.clx_op
 def do_transfer(
     ctx: ExecutionContext,
@@ -73,39 +130,84 @@ def do_transfer(
     # Set client.
     node, client  = utils.get_client(ctx)
 
-    # Transfer using called contract - does not dispatch wasm.
-    if contract:
-        session_args = ABI.args([
-            ABI.account("address", cp2.public_key),
-            ABI.big_int("amount", amount)
-            ])
-        dhash = client.deploy(
-            session_hash=bytes.fromhex(contract.chash),
-            session_args=session_args,
-            from_addr=cp1.public_key,
-            private_key=cp1.private_key_as_pem_filepath,
-            # TODO: allow these to be passed in via standard arguments
-            payment_amount=defaults.CLX_TX_FEE,
-            gas_price=defaults.CLX_TX_GAS_PRICE
-        )
+    # Dispatch - recording latency for node routing.
+    with router.dispatch(node):
+        # Transfer using called contract - does not dispatch wasm.
+        if contract:
+            session_args = ABI.args([
+                ABI.account("address", cp2.public_key),
+                ABI.big_int("amount", amount)
+                ])
+            dhash = client.deploy(
+                session_hash=bytes.fromhex(contract.chash),
+                session_args=session_args,
+                from_addr=cp1.public_key,
+                private_key=cp1.private_key_as_pem_filepath,
+                # TODO: allow these to be passed in via standard arguments
+                payment_amount=defaults.CLX_TX_FEE,
+                gas_price=defaults.CLX_TX_GAS_PRICE
+            )
 
-    # Transfer using stored contract - dispatches wasm.
-    else:
-        dhash = client.transfer(
-            amount=amount,
-            from_addr=cp1.public_key,
-            private_key=cp1.private_key_as_pem_filepath,
-            target_account_hex=cp2.public_key,
-            # TODO: allow these to be passed in via standard arguments
-            payment_amount=defaults.CLX_TX_FEE,
-            gas_price=defaults.CLX_TX_GAS_PRICE
-        )
+        # Transfer using stored contract - dispatches wasm.
+        else:
+            dhash = client.transfer(
+                amount=amount,
+                from_addr=cp1.public_key,
+                private_key=cp1.private_key_as_pem_filepath,
+                target_account_hex=cp2.public_key,
+                # TODO: allow these to be passed in via standard arguments
+                payment_amount=defaults.CLX_TX_FEE,
+                gas_price=defaults.CLX_TX_GAS_PRICE
+            )
 
     logger.log(f"PYCLX :: transfer :: {dhash} :: {amount} CLX :: {cp1.public_key[:8]} -> {cp2.public_key[:8]}")
 
     return (node, dhash)
 
 
+@utils.clx_op
+def do_transfers(
+    ctx: ExecutionContext,
+    transfers: typing.List[typing.Tuple[Account, Account, int]],
+    contract: ClientContract = None,
+    on_dispatched: typing.Callable[[Node, typing.Tuple[Account, Account, int, str]], None] = None,
+    on_signed: typing.Callable[[Node, typing.List[typing.Tuple[Account, Account, int, str]]], None] = None,
+    ) -> typing.Tuple[Node, typing.List[typing.Tuple[Account, Account, int, str]]]:
+    """Executes a batch of transfers - deploys are built & signed locally then dispatched in turn over the node's pooled channel.
+
+    :param ctx: Execution context information.
+    :param transfers: Set of (counter party 1, counter party 2, amount) to be transferred.
+    :param contract: The transfer contract to call (if any).
+    :param on_dispatched: Callback invoked with (node, (cp1, cp2, amount, deploy hash)) as each deploy is dispatched - thus callers learn of deploys dispatched prior to an error.
+    :param on_signed: Callback invoked with (node, set of (cp1, cp2, amount, deploy hash)) once deploys are signed & prior to dispatch - thus callers can record deploys before they can be finalized.
+
+    :returns: Node to which deploys were dispatched plus set of (cp1, cp2, amount, deploy hash).
+
+    """
+    # Set client.
+    node, client = utils.get_client(ctx)
+
+    # Build & sign.
+    deploys = [_make_transfer_deploy(client, cp1, cp2, amount, contract) for cp1, cp2, amount in transfers]
+    deploys = _sign_deploys(client, deploys, [cp1 for cp1, _, _ in transfers])
+    signed = [(cp1, cp2, amount, deploy.deploy_hash.hex()) for (cp1, cp2, amount), deploy in zip(transfers, deploys)]
+    if on_signed:
+        on_signed(node, signed)
+
+    # Dispatch.
+    dispatched = []
+    for info, deploy in zip(signed, deploys):
+        with router.dispatch(node):
+            client.send_deploy(deploy)
+        cp1, cp2, amount, dhash = info
+        logger.log(f"PYCLX :: transfer :: {dhash} :: {amount} CLX :: {cp1.public_key[:8]} -> {cp2.public_key[:8]}")
+        dispatched.append(info)
+        if on_dispatched:
+            on_dispatched(node, info)
+
+    return (node, dispatched)
+
+
 @utils.clx_op
 def do_deploy_client_contract(network: Network, contract_type: ClientContractType, contract_name: str) -> str:
     """Deploys a client side smart contract to chain for future reference.
@@ -146,3 +248,66 @@ def do_deploy_client_contract(network: Network, contract_type: ClientContractTyp
     logger.log(f"PYCLX :: deploy-contract :: {contract_type.value} :: contract-hash={chash}")
     
     return chash
+
+
+def _get_signers() -> concurrent.futures.ProcessPoolExecutor:
+    """Returns signing process pool - instantiated upon first use.
+
+    """
+    global _SIGNERS
+    global _SIGNERS_PID
+
+    with _SIGNERS_LOCK:
+        if _SIGNERS is None or _SIGNERS_PID != os.getpid():
+            _SIGNERS = concurrent.futures.ProcessPoolExecutor(max_workers=EnvVars.SIGNING_PROCESSES)
+            _SIGNERS_PID = os.getpid()
+
+    return _SIGNERS
+
+
+def _make_transfer_deploy(client, cp1: Account, cp2: Account, amount: int, contract: ClientContract = None):
+    """Returns an unsigned transfer deploy.
+
+    """
+    # Transfer using called contract - does not dispatch wasm.
+    if contract:
+        return client.make_deploy(
+            session_hash=bytes.fromhex(contract.chash),
+            session_args=ABI.args([
+                ABI.account("address", cp2.public_key),
+                ABI.big_int("amount", amount)
+                ]),
+            from_addr=cp1.public_key,
+            payment_amount=defaults.CLX_TX_FEE,
+            gas_price=defaults.CLX_TX_GAS_PRICE
+        )
+
+    # Transfer using bundled contract - dispatches wasm - as per client.transfer.
+    return client.make_deploy(
+        session=casperlabs_client.bundled_contract("transfer_to_account.wasm"),
+        session_args=ABI.args([
+            ABI.account("account", bytes.fromhex(cp2.public_key)),
+            ABI.long_value("amount", amount)
+            ]),
+        from_addr=cp1.public_key,
+        payment_amount=defaults.CLX_TX_FEE,
+        gas_price=defaults.CLX_TX_GAS_PRICE
+    )
+
+
+def _sign_deploy(deploy, public_key: str, private_key_pem_filepath: str):
+    """Returns a signed deploy - executed within signing processes.
+
+    """
+    return casperlabs_client.CasperLabsClient().sign_deploy(deploy, public_key, private_key_pem_filepath)
+
+
+def _sign_deploys(client, deploys: typing.List, signatories: typing.List[Account]) -> typing.List:
+    """Returns set of signed deploys - signing is delegated to a process pool when batches are large.
+
+    """
+    args = [(deploy, i.public_key, i.private_key_as_pem_filepath) for deploy, i in zip(deploys, signatories)]
+    if args and EnvVars.SIGNING_PROCESSES > 0 and len(args) >= EnvVars.SIGNING_PROCESSES_THRESHOLD:
+        return list(_get_signers().map(_sign_deploy, *zip(*args)))
+
+    return [client.sign_deploy(*i) for i in args]
@@ -0,0 +1,216 @@
+import os
+import threading
+import time
+import typing
+
+import casperlabs_client
+import grpc
+from casperlabs_client import casper_pb2_grpc
+
+from stests.core.domain import Node
+from stests.core.utils import env
+from stests.core.utils import logger
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Seconds after which an unused client is evicted from pool.
+    IDLE_TIMEOUT = env.get_var('CLX_CLIENT_POOL_IDLE_TIMEOUT', 300, float)
+
+    # Seconds after which a client is recycled irrespective of usage (0 = never).
+    MAX_AGE = env.get_var('CLX_CLIENT_POOL_MAX_AGE', 0, float)
+
+
+# Set: gRPC status codes indicative of a broken channel.
+_CONNECTION_ERROR_CODES = {
+    "DEADLINE_EXCEEDED",
+    "INTERNAL",
+    "UNAVAILABLE",
+    "UNKNOWN",
+}
+
+
+class ChannelService():
+    """A gRPC service bound to a persistent channel - the client's own services open a channel per call.
+
+    """
+    def __init__(self, channel: grpc.Channel, stub_type: typing.Callable):
+        """Constructor.
+
+        :param channel: Channel over which calls will be made.
+        :param stub_type: Type of gRPC service stub bound to channel.
+
+        """
+        self._stub = stub_type(channel)
+
+    def __getattr__(self, name: str) -> typing.Callable:
+        # Client suffixes streaming calls, hence strip suffix & retry as per client.
+        if name.endswith("_stream"):
+            return casperlabs_client.retry_stream(getattr(self._stub, name[:-len("_stream")]))
+        return casperlabs_client.retry_unary(getattr(self._stub, name))
+
+
+class PooledClientEntry():
+    """A client held within the pool along with associated usage metrics.
+
+    """
+    def __init__(self, host: str, port: int):
+        """Constructor.
+
+        :param host: Host of node to which client connects.
+        :param port: Port of node to which client connects.
+
+        """
+        self.channel = grpc.insecure_channel(f"{host}:{port}")
+        self.client = casperlabs_client.CasperLabsClient(host=host, port=port)
+        self.client.casperService = ChannelService(self.channel, casper_pb2_grpc.CasperServiceStub)
+        self.host = host
+        self.port = port
+        self.is_healthy = True
+        self.reuse_count = 0
+        self.ts_created = time.monotonic()
+        self.ts_last_used = self.ts_created
+
+    @property
+    def age(self) -> float:
+        """Seconds elapsed since client was instantiated."""
+        return time.monotonic() - self.ts_created
+
+    @property
+    def idle(self) -> float:
+        """Seconds elapsed since client was last acquired."""
+        return time.monotonic() - self.ts_last_used
+
+    @property
+    def is_expired(self) -> bool:
+        """Flag indicating whether client is to be evicted."""
+        return not self.is_healthy or \
+               self.idle > EnvVars.IDLE_TIMEOUT or \
+               (EnvVars.MAX_AGE > 0 and self.age > EnvVars.MAX_AGE)
+
+
+class PooledClient():
+    """Proxy over a pooled client - flags client as unhealthy upon connection errors so that it is reconnected.
+
+    """
+    def __init__(self, entry: PooledClientEntry):
+        """Constructor.
+
+        :param entry: Pool entry to which calls will be delegated.
+
+        """
+        self._entry = entry
+
+    def __getattr__(self, name: str) -> typing.Any:
+        attr = getattr(self._entry.client, name)
+        if not callable(attr):
+            return attr
+
+        def wrapper(*args, **kwargs):
+            try:
+                return attr(*args, **kwargs)
+            except Exception as err:
+                if _is_connection_error(err):
+                    logger.log_warning(f"PYCLX :: client connection error :: {self._entry.host}:{self._entry.port} -> will reconnect")
+                    self._entry.is_healthy = False
+                raise err
+
+        return wrapper
+
+
+# Map: (host, port) -> pooled client (scoped to current process).
+_POOL: typing.Dict[typing.Tuple[str, int], PooledClientEntry] = {}
+
+# Identifier of process that instantiated the pool - used to detect forks.
+_POOL_PID: int = None
+
+# Guards pool across worker threads.
+_POOL_LOCK = threading.Lock()
+
+# Number of clients evicted from pool (scoped to current process).
+_EVICTION_COUNT = 0
+
+
+def get_client(node: Node) -> PooledClient:
+    """Returns a pooled client connected to a node.
+
+    :param node: Node to which client will connect.
+
+    :returns: A pooled client ready for use.
+
+    """
+    global _POOL_PID
+
+    key = (node.host, node.port)
+    with _POOL_LOCK:
+        # Channels must not be shared across processes, hence reset pool after a fork.
+        if _POOL_PID != os.getpid():
+            _POOL.clear()
+            _POOL_PID = os.getpid()
+
+        _evict_expired()
+
+        try:
+            entry = _POOL[key]
+        except KeyError:
+            logger.log(f"PYCLX :: connecting to node :: {node.network}:N-{str(node.index).zfill(4)} :: {node.host}:{node.port}")
+            entry = _POOL[key] = PooledClientEntry(node.host, node.port)
+        else:
+            entry.reuse_count += 1
+        entry.ts_last_used = time.monotonic()
+
+    return PooledClient(entry)
+
+
+def get_stats() -> typing.Dict[str, typing.Any]:
+    """Returns statistics pertaining to the current process's client pool.
+
+    :returns: Pool statistics plus map: host:port -> client statistics.
+
+    """
+    with _POOL_LOCK:
+        return {
+            "pid": _POOL_PID,
+            "eviction_count": _EVICTION_COUNT,
+            "clients": {f"{entry.host}:{entry.port}": {
+                "age": round(entry.age, 3),
+                "idle": round(entry.idle, 3),
+                "is_healthy": entry.is_healthy,
+                "reuse_count": entry.reuse_count,
+            } for entry in _POOL.values()},
+        }
+
+
+def _evict_expired():
+    """Evicts unhealthy, idle & aged clients - assumes pool lock is held.
+
+    Channels are not closed here as in-flight calls (e.g. event streams) may still hold them,
+    rather they are closed upon garbage collection once released.
+
+    """
+    global _EVICTION_COUNT
+
+    for key in [k for k, v in _POOL.items() if v.is_expired]:
+        del _POOL[key]
+        _EVICTION_COUNT += 1
+
+
+def _is_connection_error(err: Exception) -> bool:
+    """Returns flag indicating whether an error implies that a client's channel is broken.
+
+    """
+    if isinstance(err, (ConnectionError, TimeoutError)):
+        return True
+
+    # Client wraps gRPC errors, e.g. status = "StatusCode.UNAVAILABLE".
+    if isinstance(err, casperlabs_client.InternalError):
+        return err.status.split(".")[-1] in _CONNECTION_ERROR_CODES
+
+    # grpc.RpcError exposes a status code.
+    try:
+        code = err.code()
+    except Exception:
+        return False
+    else:
+        return getattr(code, "name", None) in _CONNECTION_ERROR_CODES
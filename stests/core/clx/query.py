@@ -22,17 +22,25 @@ def get_balance(ctx: ExecutionContext, account: Account) -> int:
 
     """
     _, client = get_client(ctx)
-    try:
-        balance = client.balance(
-            address=account.public_key,
-            block_hash=get_last_block_hash(client)
-            )
-    except Exception as err:
-        if "Failed to find base key at path" in err.details:
-            return 0
-        raise err
-    else:
-        return balance
+
+    return _get_balance(client, account, get_last_block_hash(client))
+
+
+@clx_op
+def get_balances(ctx: ExecutionContext, accounts: typing.List[Account]) -> typing.List[int]:
+    """Returns a set of chain account balances - as at the same block.
+
+    :param ctx: Execution context information.
+    :param accounts: Accounts whose balances will be queried.
+
+    :returns: Account balances.
+
+    """
+    # Node is resolved & client acquired once for all queries - saving a cache round trip & client acquisition per query.
+    _, client = get_client(ctx)
+    block_hash = get_last_block_hash(client)
+
+    return [_get_balance(client, i, block_hash) for i in accounts]
 
 
 @clx_op
@@ -46,20 +54,24 @@ def get_block(network_id: NetworkIdentifier, block_hash: str) -> Block:
 
     """
     _, client = get_client(network_id)
-    info = client.showBlock(block_hash_base16=block_hash, full_view=False)
 
-    return factory.create_block(
-        network_id=network_id,
-        block_hash=block_hash,
-        deploy_cost_total=info.status.stats.deploy_cost_total,
-        deploy_count=info.summary.header.deploy_count, 
-        deploy_gas_price_avg=info.status.stats.deploy_gas_price_avg,
-        j_rank=info.summary.header.j_rank,
-        m_rank=info.summary.header.main_rank,
-        size_bytes=info.status.stats.block_size_bytes,
-        timestamp=datetime.fromtimestamp(info.summary.header.timestamp / 1000.0),
-        validator_id=info.summary.header.validator_public_key.hex()
-        )
+    return _get_block(client, network_id, block_hash)
+
+
+@clx_op
+def get_block_with_deploys(network_id: NetworkIdentifier, block_hash: str) -> typing.Tuple[Block, typing.List[str]]:
+    """Queries network for information pertaining to a specific block & it's set of deploys.
+
+    :param network_id: A network identifier.
+    :param block_hash: Hash of a block.
+
+    :returns: 2 member tuple: block information, hashes of block deploys.
+
+    """
+    # Node is resolved & client acquired once for both queries - saving a cache round trip & client acquisition.
+    _, client = get_client(network_id)
+
+    return _get_block(client, network_id, block_hash), _get_deploys(client, block_hash)
 
 
 @clx_op
@@ -74,7 +86,7 @@ def get_deploys(network_id: NetworkIdentifier, block_hash: str) -> typing.List[s
     """
     _, client = get_client(network_id)
 
-    return (i.deploy.deploy_hash.hex() for i in client.showDeploys(block_hash_base16=block_hash, full_view=False))
+    return _get_deploys(client, block_hash)
 
 
 @clx_op
@@ -85,3 +97,45 @@ def get_last_block_hash(client) -> str:
     last_block_info = next(client.showBlocks(1))
 
     return last_block_info.summary.block_hash.hex()
+
+
+def _get_balance(client, account: Account, block_hash: str) -> int:
+    """Returns a chain account balance as at a block.
+
+    """
+    try:
+        return client.balance(
+            address=account.public_key,
+            block_hash=block_hash
+            )
+    except Exception as err:
+        if "Failed to find base key at path" in err.details:
+            return 0
+        raise err
+
+
+def _get_block(client, network_id: NetworkIdentifier, block_hash: str) -> Block:
+    """Queries network for information pertaining to a specific block.
+
+    """
+    info = client.showBlock(block_hash_base16=block_hash, full_view=False)
+
+    return factory.create_block(
+        network_id=network_id,
+        block_hash=block_hash,
+        deploy_cost_total=info.status.stats.deploy_cost_total,
+        deploy_count=info.summary.header.deploy_count, 
+        deploy_gas_price_avg=info.status.stats.deploy_gas_price_avg,
+        j_rank=info.summary.header.j_rank,
+        m_rank=info.summary.header.main_rank,
+        size_bytes=info.status.stats.block_size_bytes,
+        timestamp=datetime.fromtimestamp(info.summary.header.timestamp / 1000.0),
+        validator_id=info.summary.header.validator_public_key.hex()
+        )
+
+
+def _get_deploys(client, block_hash: str) -> typing.List[str]:
+    """Queries network for set of deploys associated with a specific block.
+
+    """
+    return [i.deploy.deploy_hash.hex() for i in client.showDeploys(block_hash_base16=block_hash, full_view=False)]
@@ -0,0 +1,241 @@
+import contextlib
+import itertools
+import random
+import threading
+import time
+import typing
+
+from stests.core import cache
+from stests.core.domain import NetworkIdentifier
+from stests.core.domain import Node
+from stests.core.domain import NodeStatus
+from stests.core.utils import env
+from stests.core.utils.exceptions import InvalidEnvironmentVariable
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Node selection strategy: EWMA | LEAST_OUTSTANDING | RANDOM | ROUND_ROBIN | WEIGHTED.
+    STRATEGY = env.get_var('CLX_ROUTER_STRATEGY', "EWMA")
+
+    # Smoothing factor applied to latency moving averages.
+    EWMA_ALPHA = env.get_var('CLX_ROUTER_EWMA_ALPHA', 0.3, float)
+
+    # Seconds between checks as to whether a network's nodeset has changed.
+    NODESET_CHECK_INTERVAL = env.get_var('CLX_ROUTER_NODESET_CHECK_INTERVAL', 1.0, float)
+
+
+class NodeStats():
+    """Dispatch statistics pertaining to a node (scoped to current process).
+
+    """
+    def __init__(self):
+        """Constructor.
+
+        """
+        self.dispatch_count = 0
+        self.error_count = 0
+        self.latency_ewma: float = None
+        self.outstanding = 0
+
+    def on_dispatched(self, latency: float, is_error: bool):
+        """Updates statistics upon completion of a dispatch.
+
+        """
+        self.outstanding -= 1
+        self.dispatch_count += 1
+        if is_error:
+            self.error_count += 1
+        elif self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma += EnvVars.EWMA_ALPHA * (latency - self.latency_ewma)
+
+
+class NodesetSnapshot():
+    """Operational nodes of a network as at a certain nodeset version.
+
+    """
+    def __init__(self, nodes: typing.List[Node], version: int):
+        """Constructor.
+
+        """
+        # Healthy nodes are preferred over distressed nodes.
+        self.nodes = [i for i in nodes if i.status == NodeStatus.HEALTHY] or nodes
+        self.nodes_by_index = {i.index: i for i in nodes}
+        self.round_robin = itertools.cycle(self.nodes)
+        self.ts_checked = time.monotonic()
+        self.version = version
+
+
+# Map: (network, node index) -> dispatch statistics.
+_STATS: typing.Dict[typing.Tuple[str, int], NodeStats] = {}
+
+# Map: network -> nodeset snapshot.
+_SNAPSHOTS: typing.Dict[str, NodesetSnapshot] = {}
+
+# Guards router state across worker threads.
+_LOCK = threading.Lock()
+
+
+@contextlib.contextmanager
+def dispatch(node: Node):
+    """Context manager within which a deploy is dispatched to a node - records outstanding count & latency.
+
+    :param node: Node to which a deploy is being dispatched.
+
+    """
+    with _LOCK:
+        stats = _get_stats(node)
+        stats.outstanding += 1
+
+    ts_start = time.monotonic()
+    is_error = False
+    try:
+        yield
+    except Exception:
+        is_error = True
+        raise
+    finally:
+        with _LOCK:
+            stats.on_dispatched(time.monotonic() - ts_start, is_error)
+
+
+def get_node(network_id: NetworkIdentifier, node_index: int = None) -> Node:
+    """Returns a network node to which work can be dispatched.
+
+    :param network_id: A network identifier.
+    :param node_index: Index of a specific node - if not operational then strategy applies.
+
+    :returns: A registered operational node.
+
+    """
+    snapshot = _get_snapshot(network_id)
+    if not snapshot.nodes:
+        raise ValueError(f"Network {network_id.name} has no registered operational nodes.")
+
+    if node_index and node_index in snapshot.nodes_by_index:
+        return snapshot.nodes_by_index[node_index]
+
+    try:
+        strategy = STRATEGIES[EnvVars.STRATEGY.upper()]
+    except KeyError:
+        raise InvalidEnvironmentVariable("CLX_ROUTER_STRATEGY", EnvVars.STRATEGY, sorted(STRATEGIES))
+
+    with _LOCK:
+        return strategy(snapshot)
+
+
+def get_stats() -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+    """Returns dispatch statistics pertaining to the current process.
+
+    :returns: Map: node label -> dispatch statistics.
+
+    """
+    with _LOCK:
+        return {f"{network}:{index}": {
+            "dispatch_count": stats.dispatch_count,
+            "error_count": stats.error_count,
+            "latency_ewma": stats.latency_ewma,
+            "outstanding": stats.outstanding,
+        } for (network, index), stats in _STATS.items()}
+
+
+def _get_snapshot(network_id: NetworkIdentifier) -> NodesetSnapshot:
+    """Returns a network's nodeset snapshot - refreshed if nodeset has since changed.
+
+    """
+    snapshot = _SNAPSHOTS.get(network_id.name)
+    if snapshot is not None and time.monotonic() - snapshot.ts_checked < EnvVars.NODESET_CHECK_INTERVAL:
+        return snapshot
+
+    version = cache.infra.get_nodeset_version(network_id)
+    if snapshot is not None and snapshot.version == version:
+        snapshot.ts_checked = time.monotonic()
+        return snapshot
+
+    snapshot = NodesetSnapshot(cache.infra.get_nodes_operational(network_id), version)
+    with _LOCK:
+        _SNAPSHOTS[network_id.name] = snapshot
+
+    return snapshot
+
+
+def _get_stats(node: Node) -> NodeStats:
+    """Returns a node's dispatch statistics - assumes lock is held.
+
+    """
+    try:
+        return _STATS[(node.network, node.index)]
+    except KeyError:
+        return _STATS.setdefault((node.network, node.index), NodeStats())
+
+
+def _get_latency(snapshot: NodesetSnapshot) -> typing.Callable[[Node], float]:
+    """Returns function to derive a node's latency estimate - unmeasured nodes assume the best so as to be sampled.
+
+    """
+    measured = [_get_stats(i).latency_ewma for i in snapshot.nodes if _get_stats(i).latency_ewma is not None]
+    default = min(measured) if measured else 1.0
+
+    return lambda node: _get_stats(node).latency_ewma or default
+
+
+def _select_by_ewma(snapshot: NodesetSnapshot) -> Node:
+    """Strategy: lowest latency estimate weighted by outstanding dispatches.
+
+    """
+    latency = _get_latency(snapshot)
+
+    return _select_min(snapshot.nodes, lambda i: latency(i) * (_get_stats(i).outstanding + 1))
+
+
+def _select_by_least_outstanding(snapshot: NodesetSnapshot) -> Node:
+    """Strategy: fewest outstanding dispatches.
+
+    """
+    return _select_min(snapshot.nodes, lambda i: _get_stats(i).outstanding)
+
+
+def _select_by_random(snapshot: NodesetSnapshot) -> Node:
+    """Strategy: random.
+
+    """
+    return random.choice(snapshot.nodes)
+
+
+def _select_by_round_robin(snapshot: NodesetSnapshot) -> Node:
+    """Strategy: round robin.
+
+    """
+    return next(snapshot.round_robin)
+
+
+def _select_by_weight(snapshot: NodesetSnapshot) -> Node:
+    """Strategy: random weighted by inverse latency estimate.
+
+    """
+    latency = _get_latency(snapshot)
+
+    return random.choices(snapshot.nodes, weights=[1.0 / max(latency(i), 1e-6) for i in snapshot.nodes])[0]
+
+
+def _select_min(nodes: typing.List[Node], score: typing.Callable[[Node], float]) -> Node:
+    """Returns node with minimum score - ties are broken randomly.
+
+    """
+    scores = [(score(i), i) for i in nodes]
+    best = min(i for i, _ in scores)
+
+    return random.choice([i for s, i in scores if s == best])
+
+
+# Map: strategy name -> node selection function.
+STRATEGIES = {
+    "EWMA": _select_by_ewma,
+    "LEAST_OUTSTANDING": _select_by_least_outstanding,
+    "RANDOM": _select_by_random,
+    "ROUND_ROBIN": _select_by_round_robin,
+    "WEIGHTED": _select_by_weight,
+}
@@ -4,6 +4,8 @@ import typing
 import casperlabs_client
 
 from stests.core import cache
+from stests.core.clx import pool
+from stests.core.clx import router
 from stests.core.domain import Account
 from stests.core.domain import ClientContractType
 from stests.core.domain import Network
@@ -11,12 +13,13 @@ from stests.core.domain import NetworkIdentifier
 from stests.core.domain import Node
 from stests.core.domain import NodeIdentifier
 from stests.core.orchestration import ExecutionContext
+from stests.core.utils import factory
 from stests.core.utils import logger
 
 
 
-def get_client(src: typing.Union[Node, NodeIdentifier, Network, NetworkIdentifier, ExecutionContext]) -> typing.Tuple[Node, casperlabs_client.CasperLabsClient]:
-    """Factory method to return a configured clabs client and the node with which it is associated.
+def get_client(src: typing.Union[Node, NodeIdentifier, Network, NetworkIdentifier, ExecutionContext]) -> typing.Tuple[Node, pool.PooledClient]:
+    """Factory method to return a pooled clabs client and the node with which it is associated.
 
     :param src: The source from which a network node will be derived.
 
@@ -29,24 +32,18 @@ def get_client(src: typing.Union[Node, NodeIdentifier, Network, NetworkIdentifie
     elif isinstance(src, NodeIdentifier):
         node = cache.infra.get_node(src)
     elif isinstance(src, Network):
-        node = cache.infra.get_node_by_network_id(src)
+        node = router.get_node(factory.create_network_id(src.name))
     elif isinstance(src, NetworkIdentifier):
-        node = cache.infra.get_node_by_network_id(src)
+        node = router.get_node(src)
     elif isinstance(src, ExecutionContext):
-        node = cache.infra.get_node_by_run_context(src)
+        node = router.get_node(factory.create_network_id(src.network), src.node_index)
     else:
         raise ValueError("Cannot derive node from input source.")
 
     if not node:
         raise ValueError("Network nodeset is empty, therefore cannot dispatch a deploy.")
 
-    logger.log(f"PYCLX :: connecting to node :: {node.network}:N-{str(node.index).zfill(4)} :: {node.host}:{node.port}")
-
-    # TODO: get node id / client ssl cert.
-    return node, casperlabs_client.CasperLabsClient(
-        host=node.host,
-        port=node.port,
-    )
+    return node, pool.get_client(node)
 
 
 def get_client_contract_path(contract_type=ClientContractType) -> pathlib.Path:
@@ -61,7 +58,7 @@ def get_client_contract_path(contract_type=ClientContractType) -> pathlib.Path:
 
 
 def get_client_contract_hash(
-    client: casperlabs_client.CasperLabsClient,
+    client: pool.PooledClient,
     account: Account,
     bhash: str,
     contract_name: str
@@ -96,8 +93,10 @@ def clx_op(func: typing.Callable) -> typing.Callable:
         # Pre log.
         messages = {
             "get_block": lambda args: f"bhash={args[-1]}",
+            "get_block_with_deploys": lambda args: f"bhash={args[-1]}",
             "get_deploys": lambda args: f"bhash={args[-1]}",
             "get_balance": lambda args: f"pbk={args[-1].public_key}",
+            "get_balances": lambda args: f"count={len(args[-1])}",
         }
         try:
             message = messages[func.__name__]
@@ -17,6 +17,7 @@ DCLASS_SET = {
     Deploy,
     Network,
     Node,
+    NodeHealth,
     Transfer,
 }
 
@@ -4,8 +4,8 @@ from datetime import datetime
 
 from stests.core.domain.enums import AccountStatus
 from stests.core.domain.enums import AccountType
-from stests.core.domain.key_pair import PrivateKey
 from stests.core.domain.network import NetworkIdentifier
+from stests.core.utils import keystore
 from stests.core.utils.dataclasses import get_timestamp_field
 
 
@@ -50,7 +50,7 @@ class Account:
 
     @property
     def private_key_as_pem_filepath(self):
-        return PrivateKey(self.private_key).as_pem_filepath
+        return keystore.get_pvk_pem_filepath(self.private_key, self.public_key, self.network, self.run_type, self.run_index)
 
 
 @dataclasses.dataclass
@@ -55,6 +55,49 @@ class Node:
         return f"{self.network}:{self.index}"
 
 
+@dataclasses.dataclass
+class NodeHealth:
+    """Health statistics derived from periodically probing a node.
+    
+    """
+    # Number of consecutive failed probes.
+    consecutive_errors: int
+
+    # Total number of failed probes.
+    error_count: int
+
+    # Moving average of probe failure rate (0..1).
+    error_rate: float
+
+    # Numerical index to distinguish between nodes, e.g. node-01, node-02 ...etc.
+    index: int
+
+    # Moving average of probe latency (in seconds).
+    latency_ewma: typing.Optional[float]
+
+    # Latency of most recent successful probe (in seconds).
+    latency_last: typing.Optional[float]
+
+    # Network with which node is associated.
+    network: str
+
+    # Total number of probes.
+    probe_count: int
+
+    # Node status derived from probe statistics.
+    status: NodeStatus
+
+    # Timestamp: most recent probe.
+    ts_probed: typing.Optional[datetime]
+
+    # Type key of associated object used in serialisation scenarios.
+    _type_key: typing.Optional[str] = None
+
+    @property
+    def label(self):
+        return f"{self.network}:{self.index}"
+
+
 @dataclasses.dataclass
 class NodeIdentifier:
     """Information required to disambiguate between nodes.
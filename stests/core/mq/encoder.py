@@ -1,33 +1,65 @@
+import collections
+import dataclasses
 import inspect
+import threading
 import typing
 
+from stests.core.orchestration import ExecutionContext
+from stests.core.orchestration import ExecutionContextReference
 from stests.core.utils import encoder as _encoder
+from stests.core.utils import env
+from stests.core.utils import factory
+from stests.core.utils import logger
 
 
 
+# Environment variables required by this module.
+class EnvVars:
+    # Flag indicating whether execution contexts are dispatched by reference (1) or by value (0).
+    CONTEXT_BY_REFERENCE = env.get_var('BROKER_CONTEXT_BY_REFERENCE', 0, int)
+
+    # Maximum number of run contexts held by a worker's context cache.
+    CONTEXT_CACHE_SIZE = env.get_var('BROKER_CONTEXT_CACHE_SIZE', 64, int)
+
+
 # Represents contents of a Message object as a dict.
 MessageData = typing.Dict[str, typing.Any]
 
+# Set: actors whose messages always carry a full context as they (re)cache the run context.
+ACTORS_REQUIRING_CONTEXT = {
+    "do_run",
+}
+
+# Map: (network, run type, run index) -> run context (scoped to worker process).
+_CONTEXTS: typing.OrderedDict[typing.Tuple[str, str, int], ExecutionContext] = collections.OrderedDict()
+
+# Guards worker context cache across worker threads.
+_CONTEXTS_LOCK = threading.Lock()
+
 
 def encode(data: MessageData) -> bytes:
     """Encodes input data in readiness for dispatch over wire.
 
     :param data: Message data to be dispatched over wire.
     :returns: Bytestream for dispatch.
-    
+
     """
+    if EnvVars.CONTEXT_BY_REFERENCE and data.get("actor_name") not in ACTORS_REQUIRING_CONTEXT:
+        data = _map_args(data, ExecutionContext, factory.create_run_context_reference)
+
     return _encoder.as_json(data)
 
 
 def decode(data: bytes) -> MessageData:
     """Decodes data dispatched over wire.
-    
+
     :param data: Bytestream to be decoded.
     :returns: Message data for further processing.
 
     """
-    return _encoder.from_json(data.decode("utf-8"))
+    data = _encoder.from_json(data.decode("utf-8"))
 
+    return _map_args(data, ExecutionContextReference, _get_context)
 
 
 def initialise():
@@ -35,3 +67,61 @@ def initialise():
 
     """
     _encoder.initialise()
+
+
+def _get_context(ref: ExecutionContextReference) -> ExecutionContext:
+    """Returns an execution context resolved from a reference - via worker cache falling back to cache store then run archive.
+
+    """
+    key = (ref.network, ref.run_type, ref.run_index)
+    with _CONTEXTS_LOCK:
+        ctx = _CONTEXTS.get(key)
+        if ctx is not None:
+            _CONTEXTS.move_to_end(key)
+
+    # Reload if uncached or if run index has since been reused.
+    if ctx is None or not _is_version_match(ctx, ref):
+        from stests.core import cache
+        ctx = cache.orchestration.get_context(ref.network, ref.run_index, ref.run_type)
+        # Runs archived upon completion are evicted from cache whilst messages may still be in flight.
+        if ctx is None:
+            ctx = cache.archive.get_context(ref.network, ref.run_index, ref.run_type)
+        if ctx is None:
+            raise ValueError(f"Execution context referenced by message is neither cached nor archived: {key}")
+        if not _is_version_match(ctx, ref):
+            logger.log_warning(f"CORE :: execution context version mismatch: {key}")
+        with _CONTEXTS_LOCK:
+            _CONTEXTS[key] = ctx
+            while len(_CONTEXTS) > EnvVars.CONTEXT_CACHE_SIZE:
+                _CONTEXTS.popitem(last=False)
+
+    # Return a copy as actors mutate the contexts they receive.
+    return dataclasses.replace(
+        ctx,
+        phase_index=ref.phase_index,
+        status=ref.status,
+        step_index=ref.step_index,
+        step_label=ref.step_label,
+        )
+
+
+def _is_version_match(ctx: ExecutionContext, ref: ExecutionContextReference) -> bool:
+    """Returns flag indicating whether a context is the version referenced - allowing for timestamp rounding.
+
+    """
+    return abs(ctx._ts_created.timestamp() - ref.version) < 1e-3
+
+
+def _map_args(data: MessageData, typeof: typing.Type, mapper: typing.Callable) -> MessageData:
+    """Returns message data with actor arguments of a certain type mapped.
+
+    """
+    args = data.get("args") or ()
+    kwargs = data.get("kwargs") or {}
+    if not any(isinstance(i, typeof) for i in tuple(args) + tuple(kwargs.values())):
+        return data
+
+    return {**data,
+        "args": type(args)(mapper(i) if isinstance(i, typeof) else i for i in args),
+        "kwargs": {k: mapper(v) if isinstance(v, typeof) else v for k, v in kwargs.items()},
+    }
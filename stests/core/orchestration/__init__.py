@@ -10,10 +10,12 @@ from stests.core.orchestration.state_history import *
 # Set of supported classes.
 DCLASS_SET = {
     ExecutionContext,
+    ExecutionContextReference,
     ExecutionInfo,
     ExecutionState,
     RunIdentifier,
 
+    BlockLock,
     PhaseLock,
     RunLock,
     StepLock,
@@ -84,3 +84,36 @@ class ExecutionContext:
     @property
     def next_step_index_label(self):
         return f"S-{str(self.next_step_index).zfill(2)}"
+
+
+@dataclasses.dataclass
+class ExecutionContextReference:
+    """Execution context information - reference to a cached run context plus current run position.
+    
+    """
+    # Associated network.
+    network: str
+
+    # Index to disambiguate a phase within the context of a run.
+    phase_index: int
+
+    # Numerical index to distinguish between multiple runs.
+    run_index: int
+
+    # Type of run, e.g. WG-100 ...etc.
+    run_type: str
+
+    # Current status.
+    status: ExecutionStatus
+
+    # Index to disambiguate a step within the context of a phase.
+    step_index: int
+
+    # Label to disambiguate a step within the context of a phase.
+    step_label: typing.Optional[str]
+
+    # Creation timestamp of referenced context - disambiguates runs that reuse a run index.
+    version: float
+
+    # Type key of associated object used in serialisation scenarios.
+    _type_key: typing.Optional[str] = None
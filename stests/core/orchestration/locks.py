@@ -1,4 +1,5 @@
 import dataclasses
+import typing
 
 
 
@@ -47,6 +48,21 @@ class StepLock(PhaseLock):
         return f"S-{str(self.step_index).zfill(2)}"
 
 
+@dataclasses.dataclass
+class BlockLock:
+    """Execution lock information - finalized block processing.
+    
+    """
+    # Associated network.
+    network: str
+
+    # Hash of finalized block.
+    block_hash: str
+
+    # Type key of associated object used in serialisation scenarios.
+    _type_key: typing.Optional[str] = None
+
+
 @dataclasses.dataclass
 class StreamLock:
     """Execution lock information - stream.
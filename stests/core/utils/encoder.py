@@ -25,6 +25,12 @@ DCLASS_MAP = dict()
 # Set: supported dataclass types.  
 DCLASS_SET = set()
 
+# Map: dataclass type -> compiled encoding function.
+DCLASS_ENCODERS = dict()
+
+# Map: dataclass typekey -> compiled decoding function.
+DCLASS_DECODERS = dict()
+
 # Set: primitive data types.
 PRIMITIVES = (type(None), int, str, float, bool)
 
@@ -86,32 +92,7 @@ def _decode_dclass(obj):
     """Decodes a registered data class instance.
     
     """
-    # Set data class type.
-    dcls = DCLASS_MAP[obj['_type_key']]
-
-    # Convert fields:
-    for field in dataclasses.fields(dcls):
-        if field.name not in obj:
-            continue
-
-        field_value = obj[field.name]
-        if isinstance(field_value, type(None)):
-            continue 
-
-        field_type = _get_field_type(field)
-        if field_type is datetime.datetime:
-            obj[field.name] = datetime.datetime.fromtimestamp(field_value)
-
-        elif field.type in ENUM_TYPE_SET:
-            obj[field.name] = field.type[obj[field.name]]
-    
-        elif field_type in DCLASS_SET:
-            obj[field.name] = _decode_dclass(obj[field.name])
-
-        else:
-            obj[field.name] = decode(obj[field.name])
-
-    return dcls(**obj)
+    return DCLASS_DECODERS[obj['_type_key']](obj)
 
 
 def _get_field_type(field):
@@ -146,8 +127,8 @@ def encode(data: typing.Any) -> typing.Any:
     if isinstance(data, list):
         return list(map(encode, data))
 
-    if type(data) in DCLASS_SET:
-        return _encode_dclass(data, dataclasses.asdict(data))
+    if type(data) in DCLASS_ENCODERS:
+        return DCLASS_ENCODERS[type(data)](data)
 
     if type(data) in ENUM_TYPE_SET:
         return data.name
@@ -157,26 +138,6 @@ def encode(data: typing.Any) -> typing.Any:
     return data
 
 
-def _encode_dclass(data, obj):
-    """Encodes a data class that has been previously registered with the encoder.
-    
-    """
-    # Inject typekey for subsequent roundtrip.
-    obj['_type_key'] = f"{data.__module__}.{data.__class__.__name__}"
-
-    # Set fields to be encoded.
-    fields = [i for i in dir(data) if i in obj and not i.startswith('_')]
-
-    # Recurse through properties that are also registered data classes.
-    fields_dcls = [i for i in fields if type(getattr(data, i)) in DCLASS_SET]
-    for field in fields_dcls:
-        _encode_dclass(getattr(data, field), obj[field])
-
-    # TODO: handle lists of dclasses
-
-    return encode(obj)
-
-
 def register_type(cls):
     """Workflows need to extend the typeset so as to ensure that arguments are decoded/encoded correctly.
     
@@ -191,6 +152,109 @@ def register_type(cls):
     else:
         DCLASS_MAP[f"{cls.__module__}.{cls.__name__}"] = cls
         DCLASS_SET = DCLASS_SET | { cls, }
+        if dataclasses.is_dataclass(cls):
+            DCLASS_ENCODERS[cls] = _compile_encoder(cls)
+            DCLASS_DECODERS[f"{cls.__module__}.{cls.__name__}"] = _compile_decoder(cls)
+
+
+def _compile_decoder(dcls):
+    """Returns a decoding function specialised to a data class's field types.
+    
+    """
+    # Primitive fields are passed through as is, hence only set decoders for remaining fields.
+    field_decoders = []
+    for field in dataclasses.fields(dcls):
+        field_decoder = _get_field_decoder(field)
+        if field_decoder is not None:
+            field_decoders.append((field.name, field_decoder))
+
+    def decode_dclass(obj):
+        for name, field_decoder in field_decoders:
+            field_value = obj.get(name)
+            if field_value is not None:
+                obj[name] = field_decoder(field_value)
+
+        return dcls(**obj)
+
+    return decode_dclass
+
+
+def _compile_encoder(dcls):
+    """Returns an encoding function specialised to a data class's field types.
+    
+    """
+    type_key = f"{dcls.__module__}.{dcls.__name__}"
+    field_encoders = [(i.name, _get_field_encoder(i)) for i in dataclasses.fields(dcls)]
+
+    def encode_dclass(data):
+        obj = dict()
+        for name, field_encoder in field_encoders:
+            field_value = getattr(data, name)
+            obj[name] = field_value if field_value is None else field_encoder(field_value)
+
+        # Inject typekey for subsequent roundtrip.
+        obj['_type_key'] = type_key
+
+        return obj
+
+    return encode_dclass
+
+
+def _get_field_decoder(field):
+    """Returns a function to decode a data class field value - None if value is to be passed through.
+    
+    """
+    field_type = _get_field_type(field)
+    if field_type in PRIMITIVES:
+        return None
+
+    if field_type is datetime.datetime:
+        return datetime.datetime.fromtimestamp
+
+    if inspect.isclass(field_type) and issubclass(field_type, enum.Enum):
+        return lambda name: field_type[name]
+
+    # Nested data classes, collections & untyped fields are decoded generically.
+    return decode
+
+
+def _get_field_encoder(field):
+    """Returns a function to encode a data class field value.
+    
+    """
+    field_type = _get_field_type(field)
+    if field_type in PRIMITIVES:
+        return _encode_primitive
+
+    if field_type is datetime.datetime:
+        return _encode_datetime
+
+    if inspect.isclass(field_type) and issubclass(field_type, enum.Enum):
+        return _encode_enum
+
+    # Nested data classes, collections & untyped fields are encoded generically.
+    return encode
+
+
+def _encode_datetime(value):
+    """Encodes a datetime field value.
+    
+    """
+    return value.timestamp() if isinstance(value, datetime.datetime) else encode(value)
+
+
+def _encode_enum(value):
+    """Encodes an enum field value.
+    
+    """
+    return value.name if isinstance(value, enum.Enum) else encode(value)
+
+
+def _encode_primitive(value):
+    """Encodes a primitive field value.
+    
+    """
+    return value if type(value) in PRIMITIVES else encode(value)
 
 
 def _initialise():
@@ -43,3 +43,17 @@ class InvalidEnvironmentVariable(LibraryException):
                 expected = " | ".join(list(expected.keys()))
             err = f"{err}.  Expected {expected}"
         super(InvalidEnvironmentVariable, self).__init__(err)
+
+
+class ArchiveVerificationError(LibraryException):
+    """Raised when a freshly written archive cannot be read back in full.
+    
+    """
+    pass
+
+
+class LeaseLostError(LibraryException):
+    """Raised when a long-lived lock holder detects that its lease over the lock has been lost.
+    
+    """
+    pass
@@ -225,6 +225,24 @@ def create_node(
     )
 
 
+def create_node_health(node: Node) -> NodeHealth:
+    """Returns a domain object instance: NodeHealth.
+    
+    """
+    return NodeHealth(
+        consecutive_errors=0,
+        error_count=0,
+        error_rate=0.0,
+        index=node.index,
+        latency_ewma=None,
+        latency_last=None,
+        network=node.network,
+        probe_count=0,
+        status=node.status,
+        ts_probed=None,
+    )
+
+
 def create_node_id(
     network_id: NetworkIdentifier,
     index: int
@@ -265,6 +283,22 @@ def create_run_info(
     )
 
 
+def create_run_context_reference(ctx: ExecutionContext) -> ExecutionContextReference:
+    """Returns a domain object instance: ExecutionContextReference.
+    
+    """
+    return ExecutionContextReference(
+        network=ctx.network,
+        phase_index=ctx.phase_index,
+        run_index=ctx.run_index,
+        run_type=ctx.run_type,
+        status=ctx.status,
+        step_index=ctx.step_index,
+        step_label=ctx.step_label,
+        version=ctx._ts_created.timestamp(),
+    )
+
+
 def create_run_id(
     network_id: NetworkIdentifier,
     run_index: int,
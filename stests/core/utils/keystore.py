@@ -0,0 +1,122 @@
+import os
+import pathlib
+import shutil
+import tempfile
+import time
+import typing
+
+from stests.core.utils import crypto
+from stests.core.utils import env
+
+
+
+def _get_default_directory() -> str:
+    """Returns default keystore directory - memory backed file system if available.
+
+    """
+    root = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+    return os.path.join(root, "stests-keys")
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Directory within which account private key PEM files are written.
+    DIRECTORY = env.get_var('KEYSTORE_DIRECTORY', _get_default_directory())
+
+    # Seconds after which unmodified run directories are swept (0 = never).
+    MAX_AGE = env.get_var('KEYSTORE_MAX_AGE', 86400, int)
+
+
+def get_pvk_pem_filepath(
+    private_key: str,
+    public_key: str,
+    network: typing.Optional[str] = None,
+    run_type: typing.Optional[str] = None,
+    run_index: typing.Optional[int] = None,
+    ) -> str:
+    """Returns path to an account's private key PEM file - writing it upon first request only.
+
+    :param private_key: Hexadecimal representation of account private key.
+    :param public_key: Hexadecimal representation of account public key.
+    :param network: Name of network with which account is associated.
+    :param run_type: Type of generator run with which account is associated.
+    :param run_index: Index of generator run with which account is associated.
+
+    :returns: Path to PEM file.
+
+    """
+    directory = _get_directory(network, run_type, run_index)
+    fpath = directory / f"{public_key}.pem"
+    if not fpath.exists():
+        # Runs are flushed upon a single host only, hence each host sweeps stale runs as it encounters a new one.
+        if run_index and EnvVars.MAX_AGE > 0 and not directory.exists():
+            sweep(EnvVars.MAX_AGE)
+        _write(fpath, crypto.get_pvk_pem_from_bytes(bytes.fromhex(private_key)))
+
+    return str(fpath)
+
+
+def flush_by_run(network: str, run_type: str, run_index: int):
+    """Deletes PEM files pertaining to a generator run.
+
+    :param network: Name of network with which run is associated.
+    :param run_type: Type of generator run.
+    :param run_index: Index of generator run.
+
+    """
+    shutil.rmtree(_get_directory(network, run_type, run_index), ignore_errors=True)
+
+
+def flush():
+    """Deletes all PEM files - files are rewritten upon next request.
+
+    """
+    shutil.rmtree(EnvVars.DIRECTORY, ignore_errors=True)
+
+
+def sweep(max_age: float) -> int:
+    """Deletes run directories not modified within a period - i.e. runs flushed upon another host.
+
+    :param max_age: Seconds after which an unmodified run directory is deleted.
+
+    :returns: Count of deleted run directories.
+
+    """
+    count = 0
+    ts_cutoff = time.time() - max_age
+    for path in pathlib.Path(EnvVars.DIRECTORY).glob("*/*/R-*"):
+        try:
+            if path.stat().st_mtime < ts_cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+                count += 1
+        except FileNotFoundError:
+            pass
+
+    return count
+
+
+def _get_directory(network: str, run_type: str, run_index: int) -> pathlib.Path:
+    """Returns directory within which PEM files are held - run accounts are scoped by run, other accounts by network.
+
+    """
+    path = pathlib.Path(EnvVars.DIRECTORY) / (network or "global")
+    if run_type and run_index:
+        path = path / run_type / f"R-{str(run_index).zfill(3)}"
+
+    return path
+
+
+def _write(fpath: pathlib.Path, pem: bytes):
+    """Writes a PEM file atomically so that concurrent readers never observe a partial file.
+
+    """
+    fpath.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    fd, tmp_path = tempfile.mkstemp(dir=fpath.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fstream:
+            fstream.write(pem)
+        os.replace(tmp_path, fpath)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
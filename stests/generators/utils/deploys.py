@@ -1,11 +1,16 @@
+import typing
+
 import dramatiq
 
 from stests.core import cache
 from stests.core import clx
 from stests.core.domain import ClientContractType
+from stests.core.domain import Deploy
 from stests.core.domain import DeployType
+from stests.core.domain import Transfer
 from stests.core.orchestration import ExecutionContext
 from stests.core.utils import factory
+from stests.core.utils import logger
 from stests.generators.wg_100 import constants
 
 
@@ -24,19 +29,8 @@ def do_fund_account(ctx: ExecutionContext, cp1_index: int, cp2_index: int, amoun
     :param amount: Amount to be transferred.
     
     """
-    # Set counterparties.
-    if cp1_index == constants.ACC_NETWORK_FAUCET:
-        network = cache.orchestration.get_run_network(ctx)
-        if not network.faucet:
-            raise ValueError("Network faucet account does not exist.")
-        cp1 = network.faucet
-    else:
-        cp1 = cache.state.get_account_by_run(ctx, cp1_index)
-    cp2 = cache.state.get_account_by_run(ctx, cp2_index)
-    
-    # Set client contract.
-    contract = None if not ctx.use_stored_contracts else \
-               cache.infra.get_client_contract(ctx, ClientContractType.TRANSFER_U512_STORED)
+    # Set counterparties & client contract.
+    cp1, cp2, contract = _get_counterparties(ctx, cp1_index, cp2_index)
 
     # Transfer CLX from cp1 -> cp2.    
     (node, dhash) = clx.do_transfer(ctx, cp1, cp2, amount, contract)
@@ -59,8 +53,32 @@ def do_fund_account(ctx: ExecutionContext, cp1_index: int, cp2_index: int, amoun
         )
 
     # Update cache.
-    cache.state.set_run_deploy(deploy)
-    cache.state.set_run_transfer(transfer)
+    with cache.batch():
+        cache.state.set_run_deploy(deploy)
+        cache.state.set_run_transfer(transfer)
+
+
+@dramatiq.actor(queue_name=_QUEUE)
+def do_fund_accounts(ctx: ExecutionContext, cp1_index: int, cp2_indexes: typing.List[int], amount: int):
+    """Funds a batch of accounts by transfering CLX from a single counterparty.
+
+    :param ctx: Execution context information.
+    :param cp1_index: Run specific account index of counter-party one.
+    :param cp2_indexes: Run specific account indexes of counter-parties to be funded.
+    :param amount: Amount to be transferred to each counter-party.
+    
+    """
+    # Set counterparties & client contract.
+    accounts, contract = _get_accounts(ctx, [cp1_index] + list(cp2_indexes))
+
+    # Transfer CLX from cp1 -> cp2s.
+    transfers = [(accounts[cp1_index], accounts[i], amount) for i in cp2_indexes]
+    dispatched, completed = _dispatch(ctx, clx.do_transfers, transfers, contract, DeployType.TRANSFER)
+
+    # Upon partial dispatch retry undispatched transfers only - a full retry would double fund.
+    if not completed:
+        funded = {cp2.public_key for _, cp2, _, _ in dispatched}
+        do_fund_accounts.send(ctx, cp1_index, [i for i in cp2_indexes if accounts[i].public_key not in funded], amount)
 
 
 @dramatiq.actor(queue_name=_QUEUE)
@@ -72,19 +90,8 @@ def do_refund(ctx: ExecutionContext, cp1_index: int, cp2_index: int):
     :param cp2_index: Run specific account index of counter-party two.
     
     """
-    # Set counterparties.
-    cp1 = cache.state.get_account_by_run(ctx, cp1_index)
-    if cp2_index == constants.ACC_NETWORK_FAUCET:
-        network = cache.orchestration.get_run_network(ctx)
-        if not network.faucet:
-            raise ValueError("Network faucet account does not exist.")
-        cp2 = network.faucet
-    else:
-        cp2 = cache.state.get_account_by_run(ctx, cp2_index)
-
-    # Set client contract.
-    contract = None if not ctx.use_stored_contracts else \
-               cache.infra.get_client_contract(ctx, ClientContractType.TRANSFER_U512_STORED)
+    # Set counterparties & client contract.
+    cp1, cp2, contract = _get_counterparties(ctx, cp1_index, cp2_index)
 
     # Refund CLX from cp1 -> cp2.
     (node, dhash, amount) = clx.do_refund(ctx, cp1, cp2, contract=contract)
@@ -107,5 +114,153 @@ def do_refund(ctx: ExecutionContext, cp1_index: int, cp2_index: int):
         )
 
     # Update cache.
-    cache.state.set_run_deploy(deploy)
-    cache.state.set_run_transfer(transfer)
+    with cache.batch():
+        cache.state.set_run_deploy(deploy)
+        cache.state.set_run_transfer(transfer)
+
+
+@dramatiq.actor(queue_name=_QUEUE)
+def do_refunds(ctx: ExecutionContext, cp1_indexes: typing.List[int], cp2_index: int):
+    """Performs a batch of refunds to a single counterparty.
+
+    :param ctx: Execution context information.
+    :param cp1_indexes: Run specific account indexes of counter-parties to be refunded.
+    :param cp2_index: Run specific account index of counter-party two.
+    
+    """
+    # Set counterparties & client contract.
+    accounts, contract = _get_accounts(ctx, list(cp1_indexes) + [cp2_index])
+
+    # Refund CLX from cp1s -> cp2.
+    refunds = [(accounts[i], accounts[cp2_index]) for i in cp1_indexes]
+    dispatched, completed = _dispatch(ctx, clx.do_refunds, refunds, contract, DeployType.REFUND)
+
+    # Upon partial dispatch retry undispatched refunds only.
+    if not completed:
+        refunded = {cp1.public_key for cp1, _, _, _ in dispatched}
+        do_refunds.send(ctx, [i for i in cp1_indexes if accounts[i].public_key not in refunded], cp2_index)
+
+
+def _dispatch(ctx: ExecutionContext, dispatcher: typing.Callable, items: typing.List, contract, deploy_type: DeployType):
+    """Dispatches a batch of deploys - deploys are encached once signed (i.e. before they can be finalized) & uncached if not dispatched.
+
+    :param ctx: Execution context information.
+    :param dispatcher: Batch dispatch function, e.g. clx.do_transfers.
+    :param items: Set of items to be dispatched.
+    :param contract: The transfer contract to call (if any).
+    :param deploy_type: Type of dispatched deploys.
+
+    :returns: 2 member tuple: set of dispatched (cp1, cp2, amount, deploy hash), flag indicating whether all items were dispatched.
+
+    """
+    signed, dispatched = {}, []
+    def on_signed(node, infos):
+        signed.update(_set_deploys(ctx, node, infos, deploy_type))
+
+    def on_dispatched(_, info):
+        dispatched.append(info)
+
+    # Errors prior to any dispatch are retried as normal.
+    try:
+        dispatcher(ctx, items, contract, on_dispatched, on_signed)
+    except Exception as err:
+        # Uncache signed deploys that were not dispatched.
+        sent = {dhash for _, _, _, dhash in dispatched}
+        _delete_deploys([v for k, v in signed.items() if k not in sent])
+        if not dispatched:
+            raise
+        logger.log_warning(f"{deploy_type.name} :: {len(dispatched)} of {len(items)} deploys dispatched prior to error :: {err}")
+        completed = False
+    else:
+        completed = True
+
+    return dispatched, completed
+
+
+def _delete_deploys(items: typing.List[typing.Tuple[Deploy, Transfer]]):
+    """Uncaches a batch of undispatched deploys & associated transfers.
+
+    :param items: Set of (deploy, transfer) as encached by _set_deploys.
+
+    """
+    with cache.batch():
+        for deploy, transfer in items:
+            cache.state.delete_run_deploy(deploy)
+            cache.state.delete_run_transfer(transfer)
+            cache.state.delete_index("deploy", deploy.deploy_hash)
+            cache.state.delete_index("transfer", deploy.deploy_hash)
+
+
+def _get_accounts(ctx: ExecutionContext, indexes: typing.List[int]):
+    """Returns accounts plus client contract - decached as a single batch.
+
+    :param ctx: Execution context information.
+    :param indexes: Run specific account indexes.
+
+    """
+    # Pull.
+    with cache.batch():
+        network = None if constants.ACC_NETWORK_FAUCET not in indexes else \
+                  cache.orchestration.get_run_network(ctx)
+        accounts = {i: cache.state.get_account_by_run(ctx, i) for i in indexes
+                    if i != constants.ACC_NETWORK_FAUCET}
+        contract = None if not ctx.use_stored_contracts else \
+                   cache.infra.get_client_contract(ctx, ClientContractType.TRANSFER_U512_STORED)
+
+    # Set accounts - the network faucet is held upon the network itself.
+    accounts = {k: v.value for k, v in accounts.items()}
+    if network is not None:
+        if not network.value.faucet:
+            raise ValueError("Network faucet account does not exist.")
+        accounts[constants.ACC_NETWORK_FAUCET] = network.value.faucet
+
+    return accounts, contract and contract.value
+
+
+def _get_counterparties(ctx: ExecutionContext, cp1_index: int, cp2_index: int):
+    """Returns counter-parties plus client contract - decached as a single batch.
+
+    :param ctx: Execution context information.
+    :param cp1_index: Run specific account index of counter-party one.
+    :param cp2_index: Run specific account index of counter-party two.
+
+    """
+    accounts, contract = _get_accounts(ctx, [cp1_index, cp2_index])
+
+    return accounts[cp1_index], accounts[cp2_index], contract
+
+
+def _set_deploys(ctx: ExecutionContext, node, items: typing.List, deploy_type: DeployType) -> typing.Dict[str, typing.Tuple[Deploy, Transfer]]:
+    """Encaches a batch of deploys & associated transfers.
+
+    :param ctx: Execution context information.
+    :param node: Node to which deploys are dispatched.
+    :param items: Set of (cp1, cp2, amount, deploy hash).
+    :param deploy_type: Type of deploys.
+
+    :returns: Map: deploy hash -> (deploy, transfer).
+
+    """
+    encached = {}
+    with cache.batch():
+        for cp1, cp2, amount, dhash in items:
+            deploy = factory.create_deploy_for_run(
+                ctx=ctx, 
+                node=node, 
+                deploy_hash=dhash, 
+                typeof=deploy_type
+                )
+            transfer = factory.create_transfer(
+                ctx=ctx,
+                amount=amount,
+                asset="CLX",
+                cp1=cp1,
+                cp2=cp2,
+                deploy_hash=dhash,
+                is_refundable=True
+                )
+            cache.state.set_run_deploy(deploy)
+            cache.state.set_run_transfer(transfer)
+            encached[dhash] = (deploy, transfer)
+
+    return encached
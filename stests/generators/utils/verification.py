@@ -1,3 +1,5 @@
+import typing
+
 from stests.core import cache
 from stests.core import clx
 from stests.core.domain import DeployStatus
@@ -51,3 +53,14 @@ def verify_account_balance(ctx: ExecutionContext, account_index: int, expected:
     account = cache.state.get_account_by_run(ctx, account_index)
     assert account
     assert clx.get_balance(ctx, account) == expected
+
+
+def verify_account_balances(ctx: ExecutionContext, account_indexes: typing.Iterable[int], expected: int):
+    """Verifies that a set of account balances are as per expectation - in a single batched pass.
+    
+    """
+    with cache.batch():
+        accounts = [cache.state.get_account_by_run(ctx, i) for i in account_indexes]
+    accounts = [i.value for i in accounts]
+    assert all(accounts)
+    assert all(i == expected for i in clx.get_balances(ctx, accounts))
@@ -25,13 +25,23 @@ def execute(ctx: ExecutionContext):
         )
 
 
+def get_expected_deploy_count(ctx: ExecutionContext) -> int:
+    """Step expected deploy count.
+    
+    :param ctx: Execution context information.
+
+    """
+    return 1
+
+
 def verify(ctx: ExecutionContext):
     """Step verifier.
     
     :param ctx: Execution context information.
 
     """
-    utils.verify_deploy_count(ctx, 1)  
+    utils.verify_deploy_count(ctx, get_expected_deploy_count(ctx))
+    utils.verify_account_balance(ctx, constants.ACC_RUN_FAUCET, ctx.args.faucet_initial_clx_balance)
     
 
 def verify_deploy(ctx: ExecutionContext, dhash: str):
@@ -42,5 +52,4 @@ def verify_deploy(ctx: ExecutionContext, dhash: str):
 
     """
     utils.verify_deploy(ctx, dhash)
-    transfer = utils.verify_transfer(ctx, dhash)
-    utils.verify_account_balance(ctx, transfer.cp2_index, ctx.args.faucet_initial_clx_balance)
+    utils.verify_transfer(ctx, dhash)
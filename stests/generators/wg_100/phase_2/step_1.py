@@ -25,23 +25,33 @@ def execute(ctx: ExecutionContext) -> typing.Callable:
             constants.ACC_RUN_CONTRACT,
             constants.ACC_RUN_FAUCET
         )
-        for acc_index in range(constants.ACC_RUN_USERS, ctx.args.user_accounts + constants.ACC_RUN_USERS):
-            yield utils.do_refund.message(
+        acc_indexes = list(range(constants.ACC_RUN_USERS, ctx.args.user_accounts + constants.ACC_RUN_USERS))
+        for i in range(0, len(acc_indexes), constants.DEPLOY_BATCH_SIZE):
+            yield utils.do_refunds.message(
                 ctx,
-                acc_index,
+                acc_indexes[i:i + constants.DEPLOY_BATCH_SIZE],
                 constants.ACC_RUN_FAUCET
             )
 
     return get_messages
 
 
+def get_expected_deploy_count(ctx: ExecutionContext) -> int:
+    """Step expected deploy count.
+    
+    :param ctx: Execution context information.
+
+    """
+    return 1 + ctx.args.user_accounts
+
+
 def verify(ctx: ExecutionContext):
     """Step verifier.
     
     :param ctx: Execution context information.
 
     """
-    utils.verify_deploy_count(ctx, 1 + ctx.args.user_accounts) 
+    utils.verify_deploy_count(ctx, get_expected_deploy_count(ctx))
 
 
 def verify_deploy(ctx: ExecutionContext, dhash: str):
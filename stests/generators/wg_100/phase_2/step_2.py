@@ -24,13 +24,22 @@ def execute(ctx: ExecutionContext):
     )
 
 
+def get_expected_deploy_count(ctx: ExecutionContext) -> int:
+    """Step expected deploy count.
+    
+    :param ctx: Execution context information.
+
+    """
+    return 1
+
+
 def verify(ctx: ExecutionContext):
     """Step verifier.
     
     :param ctx: Execution context information.
 
     """
-    utils.verify_deploy_count(ctx, 1)
+    utils.verify_deploy_count(ctx, get_expected_deploy_count(ctx))
 
 
 def verify_deploy(ctx: ExecutionContext, dhash: str):
@@ -24,6 +24,9 @@ USER_ACCOUNTS = 5
 # Default user's CLX balance = 1m.
 USER_INITIAL_CLX_BALANCE = int(1e8)
 
+# Number of deploys dispatched per batched funding/refund message.
+DEPLOY_BATCH_SIZE = 100
+
 # --------------------------------------------------------------------
 # ACCOUNT OFFSETS
 # --------------------------------------------------------------------
@@ -20,24 +20,39 @@ def execute(ctx: ExecutionContext) -> typing.Callable:
 
     """
     def get_messages():
-        for acc_index in range(constants.ACC_RUN_USERS, ctx.args.user_accounts + constants.ACC_RUN_USERS):
-            yield utils.do_fund_account.message(
+        acc_indexes = list(range(constants.ACC_RUN_USERS, ctx.args.user_accounts + constants.ACC_RUN_USERS))
+        for i in range(0, len(acc_indexes), constants.DEPLOY_BATCH_SIZE):
+            yield utils.do_fund_accounts.message(
                 ctx,
                 constants.ACC_RUN_FAUCET,
-                acc_index,
+                acc_indexes[i:i + constants.DEPLOY_BATCH_SIZE],
                 ctx.args.user_initial_clx_balance
             )
 
     return get_messages
 
 
+def get_expected_deploy_count(ctx: ExecutionContext) -> int:
+    """Step expected deploy count.
+    
+    :param ctx: Execution context information.
+
+    """
+    return ctx.args.user_accounts
+
+
 def verify(ctx: ExecutionContext):
     """Step verifier.
     
     :param ctx: Execution context information.
 
     """
-    utils.verify_deploy_count(ctx, ctx.args.user_accounts)    
+    utils.verify_deploy_count(ctx, get_expected_deploy_count(ctx))
+    utils.verify_account_balances(
+        ctx,
+        range(constants.ACC_RUN_USERS, ctx.args.user_accounts + constants.ACC_RUN_USERS),
+        ctx.args.user_initial_clx_balance
+        )
 
 
 def verify_deploy(ctx: ExecutionContext, dhash: str):
@@ -48,5 +63,4 @@ def verify_deploy(ctx: ExecutionContext, dhash: str):
 
     """
     utils.verify_deploy(ctx, dhash)
-    transfer = utils.verify_transfer(ctx, dhash)
-    utils.verify_account_balance(ctx, transfer.cp2_index, ctx.args.user_initial_clx_balance)
+    utils.verify_transfer(ctx, dhash)
@@ -5,6 +5,8 @@ mq.initialise()
 # Import actors: monitoring.
 import stests.monitoring.events
 import stests.monitoring.manager
+import stests.monitoring.probe
+import stests.monitoring.sweeper
 
 # Import actors: generators.
 import stests.generators.wg_100.meta
@@ -1,11 +1,15 @@
+import typing
+
 import dramatiq
 
 from stests.core import cache
 from stests.core import clx
 from stests.core.utils import factory
+from stests.core.domain import Deploy
 from stests.core.domain import DeployStatus
 from stests.core.domain import NetworkIdentifier
 from stests.core.domain import NodeIdentifier
+from stests.core.orchestration import BlockLock
 from stests.core.utils import logger
 from stests.orchestration.actors import on_step_deploy_finalized
 
@@ -22,9 +26,20 @@ def on_finalized_block(node_id: NodeIdentifier, bhash: str):
     :param bhash: Hash of finalized block.
 
     """
-    # Query block info & set block status accordingly.
-    block = clx.get_block(node_id.network, bhash)
-    block.update_on_finalization()
+    # Claim block - skip duplicates streamed from other nodes prior to querying chain.
+    lock = BlockLock(network=node_id.network.name, block_hash=bhash)
+    lease, acquired = cache.monitoring.set_block_lock(lock)
+    if not acquired:
+        cache.monitoring.increment_block_duplicate_count(lock.network)
+        return
+
+    # Query block info & deploys & set block status accordingly - releasing claim upon error so that retries are processed.
+    try:
+        block, dhashes = clx.get_block_with_deploys(node_id.network, bhash)
+        block.update_on_finalization()
+    except Exception:
+        lease.release()
+        raise
 
     # Encache - skip duplicates.    
     _, encached = cache.monitoring.set_block(block)  
@@ -34,8 +49,72 @@ def on_finalized_block(node_id: NodeIdentifier, bhash: str):
     logger.log(f"processing finalized block: {bhash}")
 
     # Enqueue finalized deploys.
-    for dhash in clx.get_deploys(node_id.network, bhash):  
-        on_finalized_deploy.send(node_id.network, bhash, dhash, block.timestamp)
+    if dhashes:
+        on_finalized_block_deploys.send(node_id.network, bhash, dhashes, block.timestamp)
+
+
+@dramatiq.actor(queue_name=_QUEUE)
+def on_finalized_block_deploys(network_id: NetworkIdentifier, bhash: str, dhashes: typing.List[str], finalization_ts: float):   
+    """Event: raised whenever a block is finalized - processes all of the block's deploys.
+    
+    :param network_id: Identifier of network upon which a block has been finalized.
+    :param bhash: Hash of finalized block.
+    :param dhashes: Hashes of finalized deploys.
+    :param finalization_ts: Moment in time when finalization occurred.
+
+    """
+    # Encache network deploys & pull run deploys/transfers - 1 round trip per partition.
+    with cache.batch():
+        pulled = []
+        for dhash in dhashes:
+            deploy = factory.create_deploy(network_id, bhash, dhash, DeployStatus.FINALIZED)
+            _, encached = cache.monitoring.set_deploy(deploy)
+            pulled.append((deploy, encached, cache.state.get_run_deploy(dhash), cache.state.get_run_transfer(dhash)))
+
+    # Set run deploys - skip duplicates & deploys not dispatched by a run.
+    finalized = [(i.deploy_hash, i, deploy.value, transfer.value) for i, encached, deploy, transfer in pulled if encached.value and deploy.value]
+    if not finalized:
+        return
+
+    logger.log(f"processing finalized deploys: {bhash} :: {len(finalized)}")
+
+    # Process deploys - releasing claims of those not yet signalled upon error so that retries process them.
+    unsignalled = {dhash: network_deploy for dhash, network_deploy, _, _ in finalized}
+    try:
+        _process_finalized_deploys(bhash, finalization_ts, finalized, unsignalled)
+    except Exception:
+        with cache.batch():
+            for network_deploy in unsignalled.values():
+                cache.monitoring.delete_deploy(network_deploy)
+        raise
+
+
+def _process_finalized_deploys(bhash: str, finalization_ts: float, finalized: typing.List[tuple], unsignalled: typing.Dict[str, Deploy]):
+    """Updates run deploys & transfers & signals orchestrator - signalled deploys are removed from unsignalled.
+
+    """
+    # Pull run contexts.
+    with cache.batch():
+        contexts = {}
+        for _, _, deploy, _ in finalized:
+            key = (deploy.network, deploy.run_index, deploy.run_type)
+            if key not in contexts:
+                contexts[key] = cache.orchestration.get_context(*key)
+    contexts = {k: v.value for k, v in contexts.items()}
+
+    # Update deploys & transfers - deploy counts are incremented by orchestrator.
+    with cache.batch():
+        for _, _, deploy, transfer in finalized:
+            deploy.update_on_finalization(bhash, finalization_ts)
+            cache.state.set_run_deploy(deploy)
+            if transfer:
+                transfer.update_on_completion()
+                cache.state.set_run_transfer(transfer)
+
+    # Signal to orchestrator.
+    for dhash, _, deploy, _ in finalized:
+        on_step_deploy_finalized.send(contexts[(deploy.network, deploy.run_index, deploy.run_type)], dhash)
+        del unsignalled[dhash]
 
 
 @dramatiq.actor(queue_name=_QUEUE)
@@ -49,15 +128,27 @@ def on_finalized_deploy(network_id: NetworkIdentifier, bhash: str, dhash: str, f
 
     """
     # Set network deploy.
-    deploy = factory.create_deploy(network_id, bhash, dhash, DeployStatus.FINALIZED)
+    network_deploy = factory.create_deploy(network_id, bhash, dhash, DeployStatus.FINALIZED)
 
     # Encache - skip duplicates.
-    _, encached = cache.monitoring.set_deploy(deploy)
+    _, encached = cache.monitoring.set_deploy(network_deploy)
     if not encached:
         return
 
     logger.log(f"processing finalized deploy: {bhash} :: {dhash}")
 
+    # Process deploy - releasing claim upon error so that retries process it.
+    try:
+        _process_finalized_deploy(bhash, dhash, finalization_ts)
+    except Exception:
+        cache.monitoring.delete_deploy(network_deploy)
+        raise
+
+
+def _process_finalized_deploy(bhash: str, dhash: str, finalization_ts: float):
+    """Updates a run deploy & transfer & signals orchestrator.
+
+    """
     # Pull run deploy - escape if none found.
     deploy = cache.state.get_run_deploy(dhash)
     if not deploy:
@@ -67,9 +158,8 @@ def on_finalized_deploy(network_id: NetworkIdentifier, bhash: str, dhash: str, f
     deploy.update_on_finalization(bhash, finalization_ts)
     cache.state.set_run_deploy(deploy)
 
-    # Increment deploy counts.
+    # Pull run context - deploy counts are incremented by orchestrator.
     ctx = cache.orchestration.get_context(deploy.network, deploy.run_index, deploy.run_type)
-    cache.orchestration.increment_deploy_counts(ctx)
 
     # Update transfers.
     transfer = cache.state.get_run_transfer(dhash)
@@ -4,12 +4,17 @@ from dramatiq.middleware import Shutdown
 
 from stests.core import cache
 from stests.core import clx
+from stests.core.cache import leases
 from stests.core.utils import factory
 from stests.core.utils import logger
+from stests.core.utils.exceptions import LeaseLostError
 from stests.core.domain import NetworkIdentifier
 from stests.core.domain import NodeIdentifier
+from stests.core.domain import NodeStatus
 from stests.core.orchestration import StreamLock
 from stests.monitoring.events import on_finalized_block
+from stests.monitoring.probe import do_probe_nodes
+from stests.monitoring.sweeper import do_sweep_cache
 
 
 
@@ -29,11 +34,34 @@ def do_start_monitoring():
     # Reset all stream locks.
     cache.monitoring.flush_stream_locks()
 
+    # Start monitoring loops - superseding previously started loops.
+    epoch = cache.monitoring.increment_monitoring_epoch()
+    do_probe_nodes.send(epoch)
+    do_monitor_networks.send(epoch)
+    do_sweep_cache.send(epoch)
+
+
+@dramatiq.actor(queue_name=_QUEUE)
+def do_monitor_networks(epoch: int):
+    """Launches monitoring of each registered network & then requeues itself.
+
+    Streams whose consumer has died are relaunched once their stream lock lease expires.
+
+    :param epoch: Monitoring epoch - loop ends once superseded by a subsequent start of monitoring.
+
+    """
+    # Escape if superseded.
+    if cache.monitoring.get_monitoring_epoch() != epoch:
+        return
+
     # Monitor each network.
     for network in cache.infra.get_networks():
         network_id = factory.create_network_id(network.name)
         do_monitor_network.send(network_id)
 
+    # Requeue.
+    do_monitor_networks.send_with_options(args=(epoch, ), delay=leases.EnvVars.TTL_STREAM * 1000)
+
 
 @dramatiq.actor(queue_name=_QUEUE)
 def do_monitor_network(network_id: NetworkIdentifier):
@@ -42,7 +70,9 @@ def do_monitor_network(network_id: NetworkIdentifier):
     :network_id: Identifier of network to be monitored.
 
     """
-    for node in cache.infra.get_nodes_operational(network_id):
+    # Healthy nodes are streamed from in preference to distressed nodes.
+    nodeset = cache.infra.get_nodes_operational(network_id)
+    for node in sorted(nodeset, key=lambda i: i.status != NodeStatus.HEALTHY):
         node_id = factory.create_node_id(network_id, node.index)
         do_monitor_node.send(node_id)
 
@@ -62,7 +92,7 @@ def do_monitor_node(node_id: NodeIdentifier):
             node_index=node_id.index,
             lock_index=i + 1
             )
-        _, locked = cache.monitoring.set_stream_lock(lock)
+        lease, locked = cache.monitoring.set_stream_lock(lock)
         if locked:
             break
 
@@ -70,13 +100,15 @@ def do_monitor_node(node_id: NodeIdentifier):
     if not locked:
         return
 
-    # Callback,
+    # Callback - streaming stops once the stream lock lease is lost as another consumer may since have acquired it.
     def _on_block_finalized(_, bhash):
+        lease.verify()
         on_finalized_block.send(node_id, bhash)
 
-    # Stream events and re-queue when actor timeout occurs.
+    # Stream events - renewing stream lock lease whilst streaming - and re-queue when actor timeout occurs.
     try:
-        clx.stream_events(node_id, on_block_finalized=_on_block_finalized)
+        with lease.renewal():
+            clx.stream_events(node_id, on_block_finalized=_on_block_finalized)
 
     # Actor timeout - by default this occurs every 600 seconds.
     except TimeLimitExceeded:
@@ -86,6 +118,11 @@ def do_monitor_node(node_id: NodeIdentifier):
     except Shutdown:
         pass
 
+    # Stream lock lease lost, e.g. cache unavailable for longer than lease duration.
+    except LeaseLostError as err:
+        logger.log_warning(f"CHAIN :: stream stopped :: {err}")
+        do_monitor_network.send(node_id.network)
+
     # CLX exception, e.g. node down, comms channel issue ...etc.
     except Exception as err:
         logger.log_warning(f"CHAIN :: stream event error :: {err}")
@@ -93,4 +130,4 @@ def do_monitor_node(node_id: NodeIdentifier):
 
     # Release lock.
     finally:
-        cache.monitoring.delete_stream_lock(lock)
+        lease.release()
@@ -0,0 +1,142 @@
+import time
+from datetime import datetime
+
+import dramatiq
+
+from stests.core import cache
+from stests.core import clx
+from stests.core.domain import Node
+from stests.core.domain import NodeHealth
+from stests.core.domain import NodeIdentifier
+from stests.core.domain import NodeStatus
+from stests.core.utils import env
+from stests.core.utils import factory
+from stests.core.utils import logger
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Seconds between successive probes of a node.
+    INTERVAL = env.get_var('MONITORING_PROBE_INTERVAL', 10, float)
+
+    # Smoothing factor applied to probe latency & error rate moving averages.
+    EWMA_ALPHA = env.get_var('MONITORING_PROBE_EWMA_ALPHA', 0.3, float)
+
+    # Moving average error rate above which a node is deemed distressed.
+    DISTRESSED_ERROR_RATE = env.get_var('MONITORING_PROBE_DISTRESSED_ERROR_RATE', 0.2, float)
+
+    # Moving average latency (in seconds) above which a node is deemed distressed.
+    DISTRESSED_LATENCY = env.get_var('MONITORING_PROBE_DISTRESSED_LATENCY', 2.0, float)
+
+    # Number of consecutive probe failures after which a node is deemed down.
+    DOWN_ERRORS = env.get_var('MONITORING_PROBE_DOWN_ERRORS', 3, int)
+
+
+# Queue to which messages will be dispatched.
+_QUEUE = "monitoring"
+
+# Set: node states managed by probing - other states are set by operators.
+_PROBED_STATES = {
+    NodeStatus.DISTRESSED,
+    NodeStatus.DOWN,
+    NodeStatus.HEALTHY,
+}
+
+
+@dramatiq.actor(queue_name=_QUEUE)
+def do_probe_nodes(epoch: int):
+    """Probes each registered node & then requeues itself.
+
+    :param epoch: Monitoring epoch - loop ends once superseded by a subsequent start of monitoring.
+
+    """
+    # Escape if superseded.
+    if cache.monitoring.get_monitoring_epoch() != epoch:
+        return
+
+    # Probe each node.
+    for network in cache.infra.get_networks():
+        network_id = factory.create_network_id(network.name)
+        for node in cache.infra.get_nodes(network_id):
+            if node.status in _PROBED_STATES:
+                do_probe_node.send(factory.create_node_id(network_id, node.index))
+
+    # Requeue.
+    do_probe_nodes.send_with_options(args=(epoch, ), delay=int(EnvVars.INTERVAL * 1000))
+
+
+@dramatiq.actor(queue_name=_QUEUE)
+def do_probe_node(node_id: NodeIdentifier):
+    """Probes a node by querying it's last block & updates node health/status accordingly.
+
+    :param node_id: Identifier of node to be probed.
+
+    """
+    # Pull node & health.
+    with cache.batch():
+        node = cache.infra.get_node(node_id)
+        health = cache.infra.get_node_health(node_id)
+    node, health = node.value, health.value
+    if node is None or node.status not in _PROBED_STATES:
+        return
+    health = health or factory.create_node_health(node)
+
+    # Probe.
+    try:
+        latency = _probe(node)
+    except Exception as err:
+        logger.log_warning(f"MONIT :: node probe failed :: {node.label} :: {err}")
+        latency = None
+
+    # Update health.
+    _update_health(health, latency)
+
+    # Update cache - node status only changes upon transition so as to minimise nodeset refreshes.
+    cache.infra.set_node_health(health)
+    if node.status != health.status:
+        logger.log(f"MONIT :: node status change :: {node.label} :: {node.status.name} -> {health.status.name}")
+        node.status = health.status
+        cache.infra.set_node(node)
+
+
+def _probe(node: Node) -> float:
+    """Returns latency (in seconds) of querying a node's last block.
+
+    """
+    _, client = clx.get_client(node)
+    ts_start = time.monotonic()
+    clx.get_last_block_hash(client)
+
+    return time.monotonic() - ts_start
+
+
+def _update_health(health: NodeHealth, latency: float):
+    """Updates health statistics following a probe.
+
+    :param health: Node health statistics.
+    :param latency: Probe latency - none if probe failed.
+
+    """
+    alpha = EnvVars.EWMA_ALPHA
+
+    health.probe_count += 1
+    health.ts_probed = datetime.now()
+    health.error_rate += alpha * ((0.0 if latency is not None else 1.0) - health.error_rate)
+    if latency is None:
+        health.consecutive_errors += 1
+        health.error_count += 1
+    else:
+        health.consecutive_errors = 0
+        health.latency_last = latency
+        health.latency_ewma = latency if health.latency_ewma is None else \
+                              health.latency_ewma + alpha * (latency - health.latency_ewma)
+
+    if health.consecutive_errors >= EnvVars.DOWN_ERRORS:
+        health.status = NodeStatus.DOWN
+    elif health.consecutive_errors > 0 or \
+         health.error_rate > EnvVars.DISTRESSED_ERROR_RATE or \
+         (health.latency_ewma or 0) > EnvVars.DISTRESSED_LATENCY:
+        health.status = NodeStatus.DISTRESSED
+    else:
+        health.status = NodeStatus.HEALTHY
@@ -0,0 +1,42 @@
+import dramatiq
+
+from stests.core import cache
+from stests.core.cache import retention
+from stests.core.utils import env
+from stests.core.utils import logger
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Seconds between successive sweeps of cached collections subject to a retention policy.
+    INTERVAL = env.get_var('MONITORING_SWEEP_INTERVAL', 300, float)
+
+
+# Queue to which messages will be dispatched.
+_QUEUE = "monitoring"
+
+
+@dramatiq.actor(queue_name=_QUEUE)
+def do_sweep_cache(epoch: int):
+    """Applies each declared cache retention policy & then requeues itself.
+
+    :param epoch: Monitoring epoch - loop ends once superseded by a subsequent start of monitoring.
+
+    """
+    # Escape if superseded.
+    if cache.monitoring.get_monitoring_epoch() != epoch:
+        return
+
+    # Sweep each collection.
+    for policy in retention.POLICIES:
+        try:
+            expired, evicted = retention.sweep(policy)
+        except Exception as err:
+            logger.log_warning(f"MONIT :: cache sweep failed :: {policy.label} :: {err}")
+        else:
+            if expired or evicted:
+                logger.log(f"MONIT :: cache swept :: {policy.label} :: {expired} keys assigned ttl :: {evicted} keys evicted")
+
+    # Requeue.
+    do_sweep_cache.send_with_options(args=(epoch, ), delay=int(EnvVars.INTERVAL * 1000))
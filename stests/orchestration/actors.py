@@ -1,4 +1,5 @@
 import inspect
+import random
 from datetime import datetime
 
 import dramatiq
@@ -7,6 +8,7 @@ from stests.core import cache
 from stests.core.orchestration import ExecutionAspect
 from stests.core.orchestration import ExecutionStatus
 from stests.core.orchestration import ExecutionContext
+from stests.core.utils import env
 from stests.core.utils import logger
 
 from stests.orchestration.model import Workflow
@@ -16,6 +18,12 @@ from stests.orchestration import predicates
 
 
 
+# Environment variables required by this module.
+class EnvVars:
+    # Proportion (0 -> 1) of finalized deploys individually verified.
+    DEPLOY_VERIFICATION_SAMPLE_RATE = env.get_var('ORCHESTRATION_DEPLOY_VERIFICATION_SAMPLE_RATE', 1.0, float)
+
+
 # Queue to which messages will be dispatched.
 _QUEUE = "orchestration"
 
@@ -78,11 +86,28 @@ def on_run_end(ctx: ExecutionContext):
     # Inform.
     logger.log(f"WFLOW :: {ctx.run_type} :: {ctx.run_index_label} -> ends")
 
+    # Archive so that run information no longer occupies cache memory.
+    if cache.archive.EnvVars.ON_RUN_END:
+        do_archive_run.send(ctx)
+
     # Loop.
     if ctx.loop_count != 0:
         do_run_loop(ctx)
 
 
+@dramatiq.actor(queue_name=_QUEUE)
+def do_archive_run(ctx: ExecutionContext):
+    """Archives a completed workflow's cached information to file & evicts it from cache.
+    
+    :param ctx: Execution context information.
+    
+    """
+    fpath, count = cache.archive.archive_run(ctx)
+
+    # Inform.
+    logger.log(f"WFLOW :: {ctx.run_type} :: {ctx.run_index_label} -> archived :: {count} keys -> {fpath}")
+
+
 def do_run_loop(ctx):
     """Requeues execution if loop conditions are matched.
     
@@ -231,9 +256,12 @@ def do_step(ctx: ExecutionContext):
     step_state = factory.create_state(ExecutionAspect.STEP, ctx, ExecutionStatus.IN_PROGRESS)
 
     # Update cache.
-    cache.orchestration.set_context(ctx)
-    cache.orchestration.set_info(step_info)
-    cache.orchestration.set_state(step_state)
+    with cache.batch():
+        cache.orchestration.set_context(ctx)
+        cache.orchestration.set_info(step_info)
+        cache.orchestration.set_state(step_state)
+        if step.has_expected_deploy_count:
+            cache.orchestration.set_expected_deploy_count(ctx, step.get_expected_deploy_count())
 
     # Inform.
     logger.log(f"WFLOW :: {ctx.run_type} :: {ctx.run_index_label} :: {ctx.phase_index_label} :: {ctx.step_index_label} :: {step.label} -> starts")
@@ -325,7 +353,7 @@ def do_step_error(ctx: ExecutionContext, err: str):
     cache.orchestration.update_step_info(ctx, ExecutionStatus.ERROR)
 
     # Inform.
-    logger.log(f"WFLOW :: {ctx.run_type} :: {ctx.run_index_label} :: {ctx.phase_index_label} :: {ctx.step_index_label} :: {step.label} -> unhandled error")
+    logger.log(f"WFLOW :: {ctx.run_type} :: {ctx.run_index_label} :: {ctx.phase_index_label} :: {ctx.step_index_label} :: {ctx.step_label} -> unhandled error")
     logger.log_error(err)
 
 
@@ -341,27 +369,47 @@ def on_step_deploy_finalized(ctx: ExecutionContext, dhash: str):
     step = Workflow.get_phase_step(ctx, ctx.phase_index, ctx.step_index)
     if step is None:
         logger.log_warning(f"WFLOW :: {ctx.run_type} :: {ctx.run_index_label} :: {ctx.phase_index_label} :: {ctx.step_index_label} -> invalid step")
+        return
 
-    # Verify step deploy:
+    # Verify step deploy - sampled as step verification covers the step's deploys as a whole.
     if not step.has_verifer_for_deploy:
         logger.log_warning(f"WFLOW :: {ctx.run_type} :: {ctx.run_index_label} :: {ctx.phase_index_label} :: {ctx.step_index_label} -> deploy verifier undefined")
         return       
-    else:
+    elif random.random() < EnvVars.DEPLOY_VERIFICATION_SAMPLE_RATE:
         try:
             step.verify_deploy(dhash)
         except AssertionError as err:
             logger.log_warning(f"WFLOW :: {ctx.run_type} :: {ctx.run_index_label} :: {ctx.phase_index_label} :: {ctx.step_index_label} -> deploy verification failed")
-            return       
+            do_step_error.send(ctx, "deploy verification failed")
+            return
 
-    # Verify step:
-    if not step.has_verifer:
-        logger.log_warning(f"WFLOW :: {ctx.run_type} :: {ctx.run_index_label} :: {ctx.phase_index_label} :: {ctx.step_index_label} -> step verifier undefined")
-    else:
-        try:
+    # Increment deploy counts - escape until all of the step's deploys have been finalized.
+    _, _, deploy_count, deploy_count_expected = cache.orchestration.increment_deploy_counts(ctx)
+    if deploy_count_expected is not None and deploy_count < deploy_count_expected:
+        return
+
+    # Claim step end - redelivered & surplus deploys are thereby ignored.
+    lease, acquired = cache.orchestration.lock_step_end(factory.create_step_lock(ctx, ctx.step_index))
+    if not acquired:
+        return
+
+    # Verify step - releasing claim upon error so that retries are processed.
+    try:
+        if not step.has_verifer:
+            logger.log_warning(f"WFLOW :: {ctx.run_type} :: {ctx.run_index_label} :: {ctx.phase_index_label} :: {ctx.step_index_label} -> step verifier undefined")
+        else:
             step.verify()
-        except AssertionError as err:
-            logger.log_warning(f"WFLOW :: {ctx.run_type} :: {ctx.run_index_label} :: {ctx.phase_index_label} :: {ctx.step_index_label} -> step verification failed")
-            return       
 
-    # Step verification succeeded therefore signal step end.
-    do_step_end.send(ctx)
+        # Step verification succeeded therefore signal step end.
+        do_step_end.send(ctx)
+    except AssertionError as err:
+        logger.log_warning(f"WFLOW :: {ctx.run_type} :: {ctx.run_index_label} :: {ctx.phase_index_label} :: {ctx.step_index_label} -> step verification failed")
+        # Steps declaring their deploy count are verified once only, therefore a failure is terminal - others are reverified upon next finalized deploy.
+        if deploy_count_expected is not None:
+            do_step_error.send(ctx, "step verification failed")
+        else:
+            lease.release()
+        return
+    except Exception:
+        lease.release()
+        raise
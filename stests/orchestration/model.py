@@ -1,3 +1,4 @@
+import dataclasses
 import typing
 
 from stests.core.orchestration import ExecutionContext
@@ -6,25 +7,97 @@ from stests.generators.meta import GENERATOR_MAP as MODULES
 
 
 
+@dataclasses.dataclass(frozen=True)
+class WorkflowStepPlan:
+    """Immutable structure of a step within a phase of a broader workflow.
+
+    """
+    # Step description.
+    description: str
+
+    # Flag indicating whether step declares the count of deploys it dispatches.
+    has_expected_deploy_count: bool
+
+    # Flag indicating whether step declares a verifier.
+    has_verifer: bool
+
+    # Flag indicating whether step declares a deploy verifier.
+    has_verifer_for_deploy: bool
+
+    # Index within the set of phase steps.
+    index: int
+
+    # Is this effectively an asynchronous step - i.e. relies upon chain events to complete.
+    is_async: bool
+
+    # Flag indicating whether this is the last step within the phase.
+    is_last: bool
+
+    # Step label.
+    label: str
+
+    # Python module in which the step is declared.
+    module: typing.Any
+
+
+@dataclasses.dataclass(frozen=True)
+class WorkflowPhasePlan:
+    """Immutable structure of a phase within a broader workflow.
+
+    """
+    # Index within the set of phases.
+    index: int
+
+    # Flag indicating whether this is the last phase within the workflow.
+    is_last: bool
+
+    # Python module in which the phase is declared.
+    module: typing.Any
+
+    # Associated steps.
+    steps: typing.Tuple[WorkflowStepPlan, ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class WorkflowPlan:
+    """Immutable structure of a workflow - compiled & validated once per workflow type.
+
+    """
+    # Workflow description.
+    description: str
+
+    # Reason for which workflow is invalid - none if valid.
+    error: typing.Optional[str]
+
+    # Python module in which the workflow is declared.
+    module: typing.Any
+
+    # Associated phases.
+    phases: typing.Tuple[WorkflowPhasePlan, ...]
+
+    # Workflow type.
+    typeof: str
+
+    @property
+    def is_valid(self) -> bool:
+        return self.error is None
+
+
 class WorkflowStep():
     """A step with a phase of a broader workflow.
     
     """
-    def __init__(self, ctx: ExecutionContext, index: int, module):
+    __slots__ = ("ctx", "plan", "error", "result")
+
+    def __init__(self, plan: WorkflowStepPlan, ctx: ExecutionContext):
         """Constructor.
         
         """
         # Workflow execution context information.
         self.ctx: ExecutionContext = ctx
 
-        # Index within the set of phase steps.
-        self.index: int = index
-
-        # Flag indicating whether this is the last step within the phase.
-        self.is_last: bool = False
-
-        # Python module in which the step is declared.
-        self.module = module
+        # Immutable step structure.
+        self.plan: WorkflowStepPlan = plan
 
         # Execution error.
         self.error: typing.Union[str, Exception] = None
@@ -34,34 +107,40 @@ class WorkflowStep():
 
     @property
     def description(self) -> str:
-        return self.module.DESCRIPTION
+        return self.plan.description
+
+    @property
+    def has_expected_deploy_count(self) -> bool:
+        return self.plan.has_expected_deploy_count
 
     @property
     def has_verifer(self) -> bool:
-        try:
-            self.module.verify
-        except AttributeError:
-            return False
-        else:
-            return True
+        return self.plan.has_verifer
 
     @property
     def has_verifer_for_deploy(self) -> bool:
-        try:
-            self.module.verify_deploy
-        except AttributeError:
-            return False
-        else:
-            return True
+        return self.plan.has_verifer_for_deploy
+
+    @property
+    def index(self) -> int:
+        return self.plan.index
+
+    @property
+    def is_last(self) -> bool:
+        return self.plan.is_last
 
     @property
     def label(self) -> str:
-        return self.module.LABEL
+        return self.plan.label
     
     @property
     def is_async(self) -> bool:     
         """Is this effectively an asynchronous step - i.e. relies upon chain events to complete."""   
-        return hasattr(self.module, "verify_deploy")   
+        return self.plan.is_async
+
+    @property
+    def module(self):
+        return self.plan.module
 
 
     def execute(self):
@@ -69,101 +148,127 @@ class WorkflowStep():
         
         """
         try:
-            self.result = self.module.execute(self.ctx)
+            self.result = self.plan.module.execute(self.ctx)
         except Exception as err:
             self.error = err
 
 
+    def get_expected_deploy_count(self) -> int:
+        """Returns count of deploys dispatched by step - step is verified & ended once that many deploys are finalized.
+
+        """
+        return self.plan.module.get_expected_deploy_count(self.ctx)
+
+
     def verify(self):
         """Performs step verification.
         
         """
-        self.module.verify(self.ctx)
+        self.plan.module.verify(self.ctx)
 
 
     def verify_deploy(self, dhash: str):
         """Performs step deploy verification.
         
         """
-        self.module.verify_deploy(self.ctx, dhash)
+        self.plan.module.verify_deploy(self.ctx, dhash)
 
 
 class WorkflowPhase():
     """A phase within a broader workflow.
     
     """
-    def __init__(self, ctx: ExecutionContext, index: int, module):
+    __slots__ = ("ctx", "plan")
+
+    def __init__(self, plan: WorkflowPhasePlan, ctx: ExecutionContext):
         """Constructor.
         
         """
         # Workflow execution context information.
         self.ctx: ExecutionContext = ctx
 
-        # Index within the set of phases.
-        self.index: int = index
+        # Immutable phase structure.
+        self.plan: WorkflowPhasePlan = plan
+
+    @property
+    def index(self) -> int:
+        return self.plan.index
 
-        # Flag indicating whether this is the last phase within the workflow.
-        self.is_last: bool = False
+    @property
+    def is_last(self) -> bool:
+        return self.plan.is_last
 
-        # Python module in which the phase is declared.
-        self.module = module
+    @property
+    def module(self):
+        return self.plan.module
 
-        # Associated steps.
-        self.steps = [WorkflowStep(ctx, i, s) for i, s in enumerate(module.STEPS)]
-        if self.steps:
-            self.steps[-1].is_last = True
+    @property
+    def steps(self) -> typing.List[WorkflowStep]:
+        return [WorkflowStep(i, self.ctx) for i in self.plan.steps]
 
 
-    def get_step(self, step_index: int) -> WorkflowStep:
+    def get_step(self, step_index: int) -> typing.Optional[WorkflowStep]:
         """Returns a step within managed collection.
         
         """
-        return self.steps[step_index - 1]
+        plan = _get_item(self.plan.steps, step_index)
+
+        return None if plan is None else WorkflowStep(plan, self.ctx)
 
 
 class Workflow():
     """A workflow executed in order to test a scenario.
     
     """
-    def __init__(self, ctx: ExecutionContext, module):
+    __slots__ = ("ctx", "plan")
+
+    def __init__(self, plan: WorkflowPlan, ctx: ExecutionContext):
         """Constructor.
         
         """
         # Workflow execution context information.
         self.ctx: ExecutionContext = ctx
 
-        # Python module in which the workflow is declared.
-        self.module = module
+        # Immutable workflow structure.
+        self.plan: WorkflowPlan = plan
 
-        # Associated phases.
-        self.phases = [WorkflowPhase(ctx, i, p) for i, p in enumerate(module.PHASES)]
-        if self.phases:
-            self.phases[-1].is_last = True
+    @property
+    def description(self):
+        return self.plan.description
 
+    @property
+    def module(self):
+        return self.plan.module
 
     @property
-    def description(self):
-        return self.module.DESCRIPTION
+    def phases(self) -> typing.List[WorkflowPhase]:
+        return [WorkflowPhase(i, self.ctx) for i in self.plan.phases]
 
     @property
     def typeof(self):
-        return self.module.TYPE
+        return self.plan.typeof
 
     
-    def get_phase(self, phase_index: int) -> WorkflowPhase:
+    def get_phase(self, phase_index: int) -> typing.Optional[WorkflowPhase]:
         """Returns a phase within managed collection.
         
         """
-        return self.phases[phase_index - 1]
+        plan = _get_item(self.plan.phases, phase_index)
 
+        return None if plan is None else WorkflowPhase(plan, self.ctx)
 
-    def get_step(self, phase_index: int, step_index: int) -> WorkflowStep:
+
+    def get_step(self, phase_index: int, step_index: int) -> typing.Optional[WorkflowStep]:
         """Returns a step within managed collection.
         
         """
-        phase = self.get_phase(phase_index) 
+        phase = _get_item(self.plan.phases, phase_index)
+        if phase is None:
+            return None
+
+        plan = _get_item(phase.steps, step_index)
 
-        return phase.get_step(step_index)
+        return None if plan is None else WorkflowStep(plan, self.ctx)
 
 
     @staticmethod
@@ -175,12 +280,7 @@ class Workflow():
         :returns: Workflow wrapper instance.
 
         """
-        try:
-            MODULES[ctx.run_type]
-        except KeyError:
-            raise ValueError(f"Unsupported workflow type: {ctx.run_type}")
-        else:
-            return Workflow(ctx, MODULES[ctx.run_type])
+        return Workflow(get_plan(ctx.run_type), ctx)
 
 
     @staticmethod
@@ -193,11 +293,13 @@ class Workflow():
 
         """
         try:
-            wflow = Workflow.create(ctx)
-        except:
+            plan = get_plan(ctx.run_type)
+        except ValueError:
             return None
-        else:
-            return wflow.get_phase(phase_index)
+
+        plan = _get_item(plan.phases, phase_index)
+
+        return None if plan is None else WorkflowPhase(plan, ctx)
 
 
     @staticmethod
@@ -210,8 +312,91 @@ class Workflow():
 
         """
         try:
-            wflow = Workflow.create(ctx)
-        except:
+            plan = get_plan(ctx.run_type)
+        except ValueError:
             return None
-        else:
-            return wflow.get_step(phase_index, step_index)
+
+        plan = _get_item(plan.phases, phase_index)
+        if plan is None:
+            return None
+
+        plan = _get_item(plan.steps, step_index)
+
+        return None if plan is None else WorkflowStep(plan, ctx)
+
+
+def get_plan(run_type: str) -> WorkflowPlan:
+    """Returns compiled structure of a workflow.
+
+    :param run_type: Type of workflow.
+
+    :returns: Immutable workflow structure.
+
+    """
+    try:
+        return PLANS[run_type]
+    except KeyError:
+        raise ValueError(f"Unsupported workflow type: {run_type}")
+
+
+def _compile_plan(module) -> WorkflowPlan:
+    """Compiles & validates a workflow's structure.
+
+    """
+    phases = tuple(_compile_phase(i, p, i == len(module.PHASES) - 1) for i, p in enumerate(module.PHASES))
+
+    # Validate.
+    if not phases:
+        error = "invalid workflow - has no associated phases"
+    elif not all(i.steps for i in phases):
+        error = "invalid workflow - a phase has no associated steps"
+    else:
+        error = None
+
+    return WorkflowPlan(
+        description=module.DESCRIPTION,
+        error=error,
+        module=module,
+        phases=phases,
+        typeof=module.TYPE,
+    )
+
+
+def _compile_phase(index: int, module, is_last: bool) -> WorkflowPhasePlan:
+    """Compiles a workflow phase's structure.
+
+    """
+    return WorkflowPhasePlan(
+        index=index,
+        is_last=is_last,
+        module=module,
+        steps=tuple(_compile_step(i, s, i == len(module.STEPS) - 1) for i, s in enumerate(module.STEPS)),
+    )
+
+
+def _compile_step(index: int, module, is_last: bool) -> WorkflowStepPlan:
+    """Compiles a workflow step's structure.
+
+    """
+    return WorkflowStepPlan(
+        description=module.DESCRIPTION,
+        has_expected_deploy_count=hasattr(module, "get_expected_deploy_count"),
+        has_verifer=hasattr(module, "verify"),
+        has_verifer_for_deploy=hasattr(module, "verify_deploy"),
+        index=index,
+        is_async=hasattr(module, "verify_deploy"),
+        is_last=is_last,
+        label=module.LABEL,
+        module=module,
+    )
+
+
+def _get_item(items: typing.Tuple, index: int) -> typing.Any:
+    """Returns item at a 1 based ordinal position - none if out of range.
+
+    """
+    return items[index - 1] if 1 <= index <= len(items) else None
+
+
+# Map: workflow type -> compiled workflow structure.
+PLANS: typing.Dict[str, WorkflowPlan] = {k: _compile_plan(v) for k, v in MODULES.items()}
@@ -119,17 +119,11 @@ def is_valid_wflow(ctx: ExecutionContext) -> typing.Tuple[typing.Optional[Workfl
         logger.log_warning(f"WFLOW :: {ctx.run_type} -> unregistered workflow")
         return None, False
 
-    # False if workflow has no phases.
-    if not wflow.phases:
-        logger.log_warning(f"WFLOW :: {ctx.run_type} -> invalid workflow - has no associated phases")
+    # False if workflow structure invalid - validated once upon compilation.
+    if not wflow.plan.is_valid:
+        logger.log_warning(f"WFLOW :: {ctx.run_type} -> {wflow.plan.error}")
         return None, False
 
-    # False if a phase has no steps.
-    for phase in wflow.phases:
-        if not phase.steps:
-            logger.log_warning(f"WFLOW :: {ctx.run_type} -> invalid workflow - a phase has no associated steps")
-            return None, False
-
     # All tests passed, therefore return true.   
     return wflow, True
 
@@ -0,0 +1,42 @@
+import dataclasses
+import os
+import tempfile
+
+from stests.core.cache import archive
+from stests.core.cache.enums import StorePartition
+from stests.core.domain import *
+from stests.core.orchestration import *
+from stests.core.utils import factory as domain_factory
+from test.core import utils_factory as factory
+from test.core.utils_cache import get_key_count
+from test.core.utils_cache import set_run
+from test.core.utils_cache import use_fake_stores
+
+
+
+def _create_context(run_index: int = 1) -> ExecutionContext:
+    return dataclasses.replace(factory.create_execution_context(), run_index=run_index)
+
+
+def test_01():
+    """Test runs round trip through an archive & are evicted from cache."""
+    directory = archive.EnvVars.DIRECTORY
+    archive.EnvVars.DIRECTORY = tempfile.mkdtemp()
+    try:
+        with use_fake_stores():
+            ctx = _create_context()
+            set_run(ctx, 5)
+
+            fpath, count = archive.archive_run(ctx)
+            assert os.path.exists(fpath)
+            assert count == 7
+            assert get_key_count(StorePartition.ORCHESTRATION) == 0
+            assert get_key_count(StorePartition.STATE) == 0
+
+            network_id = domain_factory.create_network_id(ctx.network)
+            assert len(list(archive.get_deploys(network_id, ctx.run_type, ctx.run_index))) == 5
+            assert len(list(archive.get_info_list(network_id, ctx.run_type, ctx.run_index))) == 1
+            assert archive.get_context(ctx.network, ctx.run_index, ctx.run_type).run_index == ctx.run_index
+            assert archive.get_context(ctx.network, 2, ctx.run_type) is None
+    finally:
+        archive.EnvVars.DIRECTORY = directory
@@ -0,0 +1,108 @@
+import dataclasses
+import threading
+import typing
+
+from stests.core import cache
+from stests.core.cache import stores
+from stests.core.cache.batch import CacheBatchResult
+from stests.core.cache.enums import StorePartition
+from stests.core.domain import *
+from stests.core.orchestration import *
+from stests.core.utils import factory as domain_factory
+from test.core import utils_factory as factory
+from test.core.utils_cache import get_key_count
+from test.core.utils_cache import set_run
+from test.core.utils_cache import use_fake_stores
+
+
+
+def _create_context(run_index: int = 1) -> ExecutionContext:
+    return dataclasses.replace(factory.create_execution_context(), run_index=run_index)
+
+
+def _count_round_trips() -> typing.List[StorePartition]:
+    """Wraps store access so as to record partitions against which each round trip is made.
+
+    """
+    round_trips = []
+    get_store = stores.get_store
+    def get_store_counted(partition):
+        round_trips.append(partition)
+        return get_store(partition)
+    stores.get_store = get_store_counted
+
+    return round_trips
+
+
+def test_01():
+    """Test batched writes are dispatched upon exit in one round trip per partition."""
+    with use_fake_stores():
+        ctx = _create_context()
+        round_trips = _count_round_trips()
+        with cache.batch():
+            cache.orchestration.set_context(ctx)
+            cache.monitoring.increment_monitoring_epoch()
+            cache.monitoring.increment_monitoring_epoch()
+            assert round_trips == []
+        assert sorted(round_trips, key=lambda i: i.name) == [StorePartition.MONITORING, StorePartition.ORCHESTRATION]
+        assert cache.monitoring.get_monitoring_epoch() == 2
+
+
+def test_02():
+    """Test batched reads are resolved lazily upon first access."""
+    with use_fake_stores():
+        ctx = _create_context()
+        cache.orchestration.set_context(ctx)
+        round_trips = _count_round_trips()
+        with cache.batch():
+            result = cache.orchestration.get_context(ctx.network, ctx.run_index, ctx.run_type)
+            missing = cache.orchestration.get_context(ctx.network, 2, ctx.run_type)
+            assert isinstance(result, CacheBatchResult)
+            assert round_trips == []
+            assert result.value.run_index == ctx.run_index
+            assert missing.value is None
+            assert len(round_trips) == 1
+
+
+def test_03():
+    """Test batched reads via index pointers are chained within the batch."""
+    with use_fake_stores():
+        ctx = _create_context()
+        set_run(ctx, 2)
+        dhash = f"{ctx.run_index:03d}{0:061d}"
+        with cache.batch():
+            result = cache.state.get_run_deploy(dhash)
+        assert result.value.deploy_hash == dhash
+
+
+def test_04():
+    """Test nested batches join the outermost batch."""
+    with use_fake_stores():
+        with cache.batch() as outer:
+            with cache.batch() as inner:
+                assert inner is outer
+                cache.monitoring.increment_monitoring_epoch()
+            assert get_key_count(StorePartition.MONITORING) == 0
+        assert get_key_count(StorePartition.MONITORING) == 1
+
+
+def test_05():
+    """Test batches are scoped to the calling thread."""
+    with use_fake_stores():
+        with cache.batch():
+            cache.monitoring.increment_monitoring_epoch()
+            thread = threading.Thread(target=cache.monitoring.increment_monitoring_epoch)
+            thread.start()
+            thread.join()
+            assert get_key_count(StorePartition.MONITORING) == 1
+        assert cache.monitoring.get_monitoring_epoch() == 2
+
+
+def test_06():
+    """Test wildcard reads within a batch execute immediately."""
+    with use_fake_stores():
+        ctx = _create_context()
+        set_run(ctx, 3)
+        with cache.batch():
+            deploys = list(cache.state.get_deploys(domain_factory.create_network_id(ctx.network), ctx.run_type, ctx.run_index))
+            assert len(deploys) == 3
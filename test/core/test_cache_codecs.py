@@ -0,0 +1,55 @@
+import inspect
+import json
+
+from stests.core.cache import codecs
+from stests.core.domain import *
+from stests.core.utils import encoder
+from test.core import utils_factory as factory
+
+
+
+# Codecs available without optional dependencies.
+CODECS = {"JSON", "JSON_ZLIB"}
+
+
+def test_01():
+    """Test module import."""
+    assert inspect.ismodule(codecs)
+
+
+def test_02():
+    """Test functions are exposed."""
+    for f in {
+        'decode',
+        'encode',
+        'get_encoder',
+        }:
+        assert inspect.isfunction(getattr(codecs, f))
+
+
+def test_03():
+    """Test encoded values are prefixed with codec header."""
+    for codec in CODECS:
+        header, _ = codecs.get_encoder(codec)
+        assert codecs.encode({"a": 1}, codec)[:1] == header
+
+
+def test_04():
+    """Test domain objects round trip through each codec."""
+    for dcls in {Account, Deploy, Transfer}:
+        obj = encoder.encode(factory.get_instance(dcls))
+        for codec in CODECS:
+            assert codecs.decode(codecs.encode(obj, codec)) == obj
+
+
+def test_05():
+    """Test legacy (header-less) JSON values are decoded."""
+    obj = encoder.encode(factory.get_instance(Deploy))
+    assert codecs.decode(json.dumps(obj, indent=4)) == obj
+    assert codecs.decode(json.dumps(obj, indent=4).encode("utf-8")) == obj
+
+
+def test_06():
+    """Test compact JSON is smaller than legacy JSON."""
+    obj = encoder.encode(factory.get_instance(Deploy))
+    assert len(codecs.encode(obj, "JSON")) < len(json.dumps(obj, indent=4))
@@ -0,0 +1,69 @@
+import dataclasses
+import tempfile
+
+from stests.core import cache
+from stests.core.cache import utils
+from stests.core.cache.enums import StorePartition
+from stests.core.domain import *
+from stests.core.orchestration import *
+from stests.core.utils import factory as domain_factory
+from stests.core.utils import keystore
+from test.core import utils_factory as factory
+from test.core.utils_cache import get_key_count
+from test.core.utils_cache import set_run
+from test.core.utils_cache import use_fake_stores
+
+
+
+def _create_context(run_index: int = 1) -> ExecutionContext:
+    return dataclasses.replace(factory.create_execution_context(), run_index=run_index)
+
+
+def test_01():
+    """Test flushing a run leaves runs whose label it prefixes intact, e.g. R-001 & R-010."""
+    with use_fake_stores():
+        ctx_1, ctx_10 = _create_context(1), _create_context(10)
+        set_run(ctx_1, 3)
+        set_run(ctx_10, 3)
+
+        counts = cache.flush_by_run(ctx_1)
+        assert counts[StorePartition.ORCHESTRATION] == 2
+        assert counts[StorePartition.STATE] == 6
+
+        assert cache.orchestration.get_context(ctx_1.network, 1, ctx_1.run_type) is None
+        assert cache.orchestration.get_context(ctx_10.network, 10, ctx_10.run_type).run_index == 10
+        assert get_key_count(StorePartition.STATE) == 6
+
+
+def test_02():
+    """Test flush matchers scan once per partition & match a single run only."""
+    ctx_1, ctx_10 = _create_context(1), _create_context(10)
+    items = list(cache.state.flush_by_run.keypaths(ctx_1))
+    search_key, matchers = utils._get_flush_matchers(StorePartition.STATE, items)
+    assert len(matchers) == len(items)
+
+    key_1 = utils._get_key(StorePartition.STATE, cache.state.set_run_deploy.keypaths(
+        domain_factory.create_deploy_for_run(ctx_1, factory.create_node(), "a" * 64, DeployType.TRANSFER)
+        )[0])
+    key_10 = key_1.replace(ctx_1.run_index_label, ctx_10.run_index_label)
+    assert utils._get_keys_to_flush(StorePartition.STATE, matchers, [key_1.encode("utf-8")])
+    assert not utils._get_keys_to_flush(StorePartition.STATE, matchers, [key_10.encode("utf-8")])
+
+
+def test_03():
+    """Test partitions are flushed in full with progress reported per partition."""
+    directory = keystore.EnvVars.DIRECTORY
+    keystore.EnvVars.DIRECTORY = tempfile.mkdtemp()
+    try:
+        with use_fake_stores():
+            set_run(_create_context(1), 3)
+            set_run(_create_context(2), 3)
+
+            progress = {}
+            counts = cache.flush_partitions([StorePartition.STATE], lambda partition, count: progress.update({partition: count}))
+            assert counts == {StorePartition.STATE: 12}
+            assert progress[StorePartition.STATE] == 12
+            assert get_key_count(StorePartition.STATE) == 0
+            assert get_key_count(StorePartition.ORCHESTRATION) == 4
+    finally:
+        keystore.EnvVars.DIRECTORY = directory
@@ -0,0 +1,60 @@
+from stests.core import cache
+from stests.core.cache import leases
+from stests.core.cache import stores
+from stests.core.orchestration import StepLock
+from stests.core.utils.exceptions import LeaseLostError
+from test.core import utils_factory as factory
+from test.core.utils_cache import use_fake_stores
+
+
+
+def test_01():
+    """Test leases are acquired, renewed & released by their owner only."""
+    with use_fake_stores():
+        lock = factory.create_block_lock()
+        lease, acquired = cache.monitoring.set_block_lock(lock)
+        assert acquired
+        _, acquired = cache.monitoring.set_block_lock(lock)
+        assert not acquired
+
+        rival = leases.Lease(lease.partition, lease.key, b"another-owner", lease.ttl)
+        assert not rival.renew()
+        assert not rival.release()
+
+        assert lease.renew()
+        assert lease.release()
+        assert not lease.renew()
+        _, acquired = cache.monitoring.set_block_lock(lock)
+        assert acquired
+
+
+def test_02():
+    """Test lease durations are set by lock type - step locks lasting as long as runs."""
+    with use_fake_stores():
+        lease, _ = cache.monitoring.set_block_lock(factory.create_block_lock())
+        assert lease.ttl == leases.EnvVars.TTL_BLOCK
+
+        lock = StepLock(network="LOC-01", run_index=1, run_type="WG-100", phase_index=1, step_index=1)
+        lease, acquired = cache.orchestration.lock_step_end(lock)
+        assert acquired
+        assert lease.ttl == leases.EnvVars.TTL_EXECUTION
+        with stores.get_store(lease.partition) as store:
+            assert 0 < store.ttl(lease.key) <= leases.EnvVars.TTL_EXECUTION
+
+
+def test_03():
+    """Test leases renewed in background are flagged as lost once lost."""
+    with use_fake_stores():
+        lease, _ = cache.monitoring.set_block_lock(factory.create_block_lock())
+        lease.ttl = 1
+        with lease.renewal():
+            lease.verify()
+            with stores.get_store(lease.partition) as store:
+                store.delete(lease.key)
+            assert lease.lost.wait(2)
+        try:
+            lease.verify()
+        except LeaseLostError:
+            pass
+        else:
+            raise AssertionError("Lost lease was verified.")
@@ -0,0 +1,41 @@
+import dataclasses
+import time
+
+from stests.core import cache
+from stests.core.domain import *
+from stests.core.orchestration import *
+from test.core import utils_factory as factory
+from test.core.utils_cache import use_fake_stores
+
+
+
+def _create_context(run_index: int = 1) -> ExecutionContext:
+    return dataclasses.replace(factory.create_execution_context(), run_index=run_index)
+
+
+def test_01():
+    """Test deploy counts are incremented atomically along with expected count."""
+    with use_fake_stores():
+        ctx = _create_context()
+        assert cache.orchestration.increment_deploy_counts(ctx) == (1, 1, 1, None)
+        cache.orchestration.set_expected_deploy_count(ctx, 3)
+        assert cache.orchestration.increment_deploy_counts(ctx) == (2, 2, 2, 3)
+        assert cache.orchestration.increment_deploy_counts(ctx) == (3, 3, 3, 3)
+
+
+def test_02():
+    """Test end of execution is set atomically along with duration."""
+    with use_fake_stores():
+        ctx = _create_context()
+        assert cache.orchestration.update_run_info(ctx) is None
+
+        info = dataclasses.replace(factory.create_execution_info(), ts_start=time.time() - 5, _type_key=None)
+        cache.orchestration.set_info(info)
+        ctx.status = ExecutionStatus.COMPLETE
+        tp_duration = cache.orchestration.update_run_info(ctx)
+        assert 5 <= tp_duration < 6
+
+        info = cache.orchestration.get_run_info(ctx)
+        assert info.status == ExecutionStatus.COMPLETE
+        assert info.tp_duration == tp_duration
+        assert info.ts_end is not None
@@ -0,0 +1,40 @@
+import dataclasses
+import time
+
+from stests.core import cache
+from stests.core.cache import retention
+from stests.core.cache import stores
+from stests.core.cache.enums import StorePartition
+from test.core import utils_factory as factory
+from test.core.utils_cache import get_key_count
+from test.core.utils_cache import use_fake_stores
+
+
+
+def test_01():
+    """Test retention sweep evicts items older than max age & in excess of max count."""
+    with use_fake_stores():
+        now = time.time()
+        for i in range(10):
+            block = dataclasses.replace(factory.create_block(), block_hash=str(i), m_rank=i, _ts_created=now - i * 60)
+            cache.monitoring.set_block(block)
+
+        policy = retention.RetentionPolicy(StorePartition.MONITORING, "block", ttl=3600, max_age=330)
+        assert retention.sweep(policy) == (0, 4)
+        assert get_key_count(StorePartition.MONITORING) == 6
+
+        policy = dataclasses.replace(policy, max_age=None, max_count=2)
+        assert retention.sweep(policy) == (0, 4)
+        with stores.get_store(StorePartition.MONITORING) as store:
+            assert sorted(i.decode("utf-8").split(".")[-1] for i in store.keys()) == ["0", "1"]
+
+
+def test_02():
+    """Test items within declared collections expire as per policy ttl."""
+    with use_fake_stores():
+        cache.monitoring.set_block(factory.create_block())
+        cache.monitoring.increment_monitoring_epoch()
+        with stores.get_store(StorePartition.MONITORING) as store:
+            ttls = {i.decode("utf-8").split(":")[0]: store.ttl(i) for i in store.keys()}
+        assert 0 < ttls["block"] <= retention.EnvVars.MONITORING_BLOCK_TTL
+        assert ttls["monitoring-epoch"] == -1
@@ -0,0 +1,73 @@
+import casperlabs_client
+
+from stests.core.clx import pool
+from test.core import utils_factory as factory
+
+
+
+def _reset():
+    pool._POOL.clear()
+    pool._POOL_PID = None
+
+
+def _raise(err: Exception):
+    raise err
+
+
+def test_01():
+    """Test connection errors are detected from client wrapped gRPC status codes."""
+    assert pool._is_connection_error(casperlabs_client.InternalError("StatusCode.UNAVAILABLE", "connection refused"))
+    assert pool._is_connection_error(casperlabs_client.InternalError("StatusCode.DEADLINE_EXCEEDED", ""))
+    assert not pool._is_connection_error(casperlabs_client.InternalError("StatusCode.NOT_FOUND", ""))
+    assert not pool._is_connection_error(casperlabs_client.InternalError(details="invalid deploy"))
+    assert not pool._is_connection_error(ValueError())
+
+
+def test_02():
+    """Test clients are reused per node over a persistent channel."""
+    _reset()
+    node = factory.create_node()
+    client_1, client_2 = pool.get_client(node), pool.get_client(node)
+    assert client_1._entry is client_2._entry
+    assert client_1._entry.reuse_count == 1
+    assert isinstance(client_1.casperService, pool.ChannelService)
+
+
+def test_03():
+    """Test clients raising connection errors are flagged unhealthy & evicted."""
+    _reset()
+    node = factory.create_node()
+    client = pool.get_client(node)
+    client._entry.client.deploy_stub = lambda: _raise(casperlabs_client.InternalError("StatusCode.UNAVAILABLE"))
+    try:
+        client.deploy_stub()
+    except casperlabs_client.InternalError:
+        pass
+    assert not client._entry.is_healthy
+
+    eviction_count = pool.get_stats()["eviction_count"]
+    assert pool.get_client(node)._entry is not client._entry
+    assert pool.get_stats()["eviction_count"] == eviction_count + 1
+
+
+def test_04():
+    """Test idle clients are evicted."""
+    _reset()
+    node = factory.create_node()
+    entry = pool.get_client(node)._entry
+    idle_timeout = pool.EnvVars.IDLE_TIMEOUT
+    pool.EnvVars.IDLE_TIMEOUT = -1
+    try:
+        assert pool.get_client(node)._entry is not entry
+    finally:
+        pool.EnvVars.IDLE_TIMEOUT = idle_timeout
+
+
+def test_05():
+    """Test pool is reset after a fork."""
+    _reset()
+    node = factory.create_node()
+    entry = pool.get_client(node)._entry
+    pool._POOL_PID = -1
+    assert pool.get_client(node)._entry is not entry
+    assert pool.get_stats()["pid"] != -1
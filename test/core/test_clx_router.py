@@ -0,0 +1,116 @@
+import dataclasses
+import typing
+
+from stests.core import cache
+from stests.core.clx import router
+from stests.core.domain import *
+from stests.core.utils import factory as domain_factory
+from stests.core.utils.exceptions import InvalidEnvironmentVariable
+from test.core import utils_factory as factory
+from test.core.utils_cache import use_fake_stores
+
+
+
+# Network identifier of test nodes.
+NETWORK_ID = domain_factory.create_network_id("LOC-01")
+
+
+def _set_nodes(*statuses: NodeStatus) -> typing.List[Node]:
+    """Encaches a node per status & resets router state.
+
+    """
+    router._SNAPSHOTS.clear()
+    router._STATS.clear()
+    nodes = []
+    for index, status in enumerate(statuses, 1):
+        nodes.append(dataclasses.replace(factory.create_node(), index=index, status=status, port=40400 + index))
+        cache.infra.set_node(nodes[-1])
+
+    return nodes
+
+
+def test_01():
+    """Test round robin strategy cycles over healthy nodes in preference to distressed nodes."""
+    strategy = router.EnvVars.STRATEGY
+    try:
+        with use_fake_stores():
+            _set_nodes(NodeStatus.HEALTHY, NodeStatus.DISTRESSED, NodeStatus.HEALTHY, NodeStatus.DOWN)
+            router.EnvVars.STRATEGY = "ROUND_ROBIN"
+            assert [router.get_node(NETWORK_ID).index for _ in range(4)] == [1, 3, 1, 3]
+            assert router.get_node(NETWORK_ID, 2).index == 2
+            assert router.get_node(NETWORK_ID, 4).index in (1, 3)
+
+        with use_fake_stores():
+            _set_nodes(NodeStatus.DISTRESSED, NodeStatus.DOWN)
+            assert router.get_node(NETWORK_ID).index == 1
+    finally:
+        router.EnvVars.STRATEGY = strategy
+
+
+def test_02():
+    """Test latency & load aware strategies prefer faster & less loaded nodes."""
+    strategy = router.EnvVars.STRATEGY
+    try:
+        with use_fake_stores():
+            node_1, node_2 = _set_nodes(NodeStatus.HEALTHY, NodeStatus.HEALTHY)
+            router._get_stats(node_1).latency_ewma = 0.1
+            router._get_stats(node_2).latency_ewma = 1.0
+
+            router.EnvVars.STRATEGY = "EWMA"
+            assert router.get_node(NETWORK_ID).index == 1
+            router._get_stats(node_1).outstanding = 20
+            assert router.get_node(NETWORK_ID).index == 2
+
+            router.EnvVars.STRATEGY = "LEAST_OUTSTANDING"
+            assert router.get_node(NETWORK_ID).index == 2
+
+            router.EnvVars.STRATEGY = "UNKNOWN"
+            try:
+                router.get_node(NETWORK_ID)
+            except InvalidEnvironmentVariable:
+                pass
+            else:
+                raise AssertionError("Unknown strategy was applied.")
+    finally:
+        router.EnvVars.STRATEGY = strategy
+
+
+def test_03():
+    """Test dispatches record outstanding count, latency & errors."""
+    with use_fake_stores():
+        node, = _set_nodes(NodeStatus.HEALTHY)
+        with router.dispatch(node):
+            assert router._get_stats(node).outstanding == 1
+        try:
+            with router.dispatch(node):
+                raise IOError()
+        except IOError:
+            pass
+
+        stats = router.get_stats()[node.label]
+        assert stats["dispatch_count"] == 2
+        assert stats["error_count"] == 1
+        assert stats["outstanding"] == 0
+        assert stats["latency_ewma"] is not None
+
+
+def test_04():
+    """Test nodeset snapshots are refreshed only once checked & nodeset version has changed."""
+    interval, strategy = router.EnvVars.NODESET_CHECK_INTERVAL, router.EnvVars.STRATEGY
+    try:
+        with use_fake_stores():
+            node, = _set_nodes(NodeStatus.HEALTHY)
+            router.EnvVars.STRATEGY = "ROUND_ROBIN"
+            router.EnvVars.NODESET_CHECK_INTERVAL = 3600
+            snapshot = router._get_snapshot(NETWORK_ID)
+
+            cache.infra.set_node(dataclasses.replace(node, index=2, port=40402))
+            assert router._get_snapshot(NETWORK_ID) is snapshot
+
+            router.EnvVars.NODESET_CHECK_INTERVAL = 0
+            assert sorted(i.index for i in router._get_snapshot(NETWORK_ID).nodes) == [1, 2]
+
+            snapshot = router._get_snapshot(NETWORK_ID)
+            assert router._get_snapshot(NETWORK_ID) is snapshot
+    finally:
+        router.EnvVars.NODESET_CHECK_INTERVAL, router.EnvVars.STRATEGY = interval, strategy
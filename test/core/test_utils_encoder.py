@@ -1,4 +1,7 @@
+import dataclasses
 import inspect
+import typing
+from datetime import datetime as dt
 
 from stests.core.domain import *
 from stests.core.orchestration import *
@@ -20,6 +23,8 @@ FIXTURES = {
     'ENUM_VALUE_MAP',
     'DCLASS_MAP',
     'DCLASS_SET',
+    'DCLASS_ENCODERS',
+    'DCLASS_DECODERS',
 }
 
 
@@ -116,5 +121,48 @@ def test_12():
     assert Example in encoder.DCLASS_MAP.values()
 
 
+def test_13():
+    """Test compiled encoders/decoders are registered per data class & round-trip optional, nested & enum fields."""
+    for i in encoder.DCLASS_SET:
+        if dataclasses.is_dataclass(i):
+            assert i in encoder.DCLASS_ENCODERS
+            assert f"{i.__module__}.{i.__name__}" in encoder.DCLASS_DECODERS
+
+    @dataclasses.dataclass
+    class Example():
+        count: typing.Optional[int]
+        network: NetworkIdentifier
+        network_other: typing.Optional[NetworkIdentifier]
+        networks: typing.List[NetworkIdentifier]
+        status: DeployStatus
+        status_other: typing.Optional[DeployStatus]
+        ts: typing.Optional[dt]
+        _type_key: typing.Optional[str] = None
+    encoder.register_type(Example)
+
+    for i in (
+        Example(1, factory.create_network_id(), factory.create_network_id(), [factory.create_network_id()],
+                DeployStatus.FINALIZED, DeployStatus.DISPATCHED, dt(2020, 1, 1)),
+        Example(None, factory.create_network_id(), None, [], DeployStatus.FINALIZED, None, None),
+        ):
+        encoded = encoder.encode(i)
+        assert encoded["status"] == i.status.name
+        k = encoder.decode(encoded)
+        assert isinstance(k, Example)
+        assert isinstance(k.network, NetworkIdentifier)
+        assert all(isinstance(j, NetworkIdentifier) for j in k.networks)
+        assert (k.count, k.status, k.status_other, k.ts) == (i.count, i.status, i.status_other, i.ts)
+        assert (k.network.name, k.network_other and k.network_other.name) == \
+               (i.network.name, i.network_other and i.network_other.name)
+
+
+def test_14():
+    """Test round-trip over block locks."""
+    i = factory.get_instance(BlockLock)
+    k = encoder.decode(encoder.encode(i))
+    assert isinstance(k, BlockLock)
+    assert (k.network, k.block_hash) == (i.network, i.block_hash)
+
+
 def _get_test_dclass_instances():
     return [factory.get_instance(i) for i in encoder.DCLASS_SET if i not in (RunLock, PhaseLock, StepLock)]
\ No newline at end of file
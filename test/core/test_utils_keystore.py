@@ -0,0 +1,45 @@
+import os
+import tempfile
+import time
+
+from stests.core.utils import keystore
+from test.core import utils_factory as factory
+
+
+
+def test_01():
+    """Test PEM files are written once & flushed by run."""
+    directory = keystore.EnvVars.DIRECTORY
+    keystore.EnvVars.DIRECTORY = tempfile.mkdtemp()
+    try:
+        account = factory.create_account()
+        fpath = keystore.get_pvk_pem_filepath(account.private_key, account.public_key, "LOC-01", "WG-100", 1)
+        assert os.path.exists(fpath)
+        assert keystore.get_pvk_pem_filepath(account.private_key, account.public_key, "LOC-01", "WG-100", 1) == fpath
+
+        keystore.flush_by_run("LOC-01", "WG-100", 1)
+        assert not os.path.exists(fpath)
+    finally:
+        keystore.EnvVars.DIRECTORY = directory
+
+
+def test_02():
+    """Test sweep deletes stale run directories only."""
+    directory = keystore.EnvVars.DIRECTORY
+    keystore.EnvVars.DIRECTORY = tempfile.mkdtemp()
+    try:
+        account = factory.create_account()
+        fpath_network = keystore.get_pvk_pem_filepath(account.private_key, account.public_key, "LOC-01")
+        fpath_run_1 = keystore.get_pvk_pem_filepath(account.private_key, account.public_key, "LOC-01", "WG-100", 1)
+        fpath_run_2 = keystore.get_pvk_pem_filepath(account.private_key, account.public_key, "LOC-01", "WG-100", 2)
+
+        ts_stale = time.time() - 3600
+        os.utime(os.path.dirname(fpath_run_1), (ts_stale, ts_stale))
+        os.utime(os.path.dirname(fpath_network), (ts_stale, ts_stale))
+
+        assert keystore.sweep(60) == 1
+        assert not os.path.exists(fpath_run_1)
+        assert os.path.exists(fpath_run_2)
+        assert os.path.exists(fpath_network)
+    finally:
+        keystore.EnvVars.DIRECTORY = directory
@@ -0,0 +1,53 @@
+import contextlib
+import dataclasses
+import typing
+
+import fakeredis
+import fakeredis.aioredis
+
+from stests.core import cache
+from stests.core.cache import stores
+from stests.core.cache.enums import StorePartition
+from stests.core.domain import DeployType
+from stests.core.orchestration import ExecutionContext
+from stests.core.utils import factory as domain_factory
+from test.core import utils_factory as factory
+
+
+
+@contextlib.contextmanager
+def use_fake_stores() -> typing.Generator[typing.Dict, None, None]:
+    """Context manager redirecting cache stores to in-memory fakes (with lua scripting) - one server per partition.
+
+    """
+    servers = {}
+    get_store, get_store_async = stores.get_store, stores.get_store_async
+    stores.get_store = lambda partition: \
+        fakeredis.FakeStrictRedis(server=servers.setdefault(partition, fakeredis.FakeServer()))
+    stores.get_store_async = lambda partition: \
+        fakeredis.aioredis.FakeRedis(server=servers.setdefault(partition, fakeredis.FakeServer()))
+    try:
+        yield servers
+    finally:
+        stores.get_store, stores.get_store_async = get_store, get_store_async
+
+
+def get_key_count(partition: StorePartition) -> int:
+    """Returns count of keys held within a partition.
+
+    """
+    with stores.get_store(partition) as store:
+        return store.dbsize()
+
+
+def set_run(ctx: ExecutionContext, deploy_count: int):
+    """Encaches a run's context, info & deploys.
+
+    """
+    cache.orchestration.set_context(ctx)
+    cache.orchestration.set_info(dataclasses.replace(factory.create_execution_info(), run_index=ctx.run_index, _type_key=None))
+    node = factory.create_node()
+    for i in range(deploy_count):
+        cache.state.set_run_deploy(domain_factory.create_deploy_for_run(
+            ctx, node, f"{ctx.run_index:03d}{i:061d}", DeployType.TRANSFER
+            ))
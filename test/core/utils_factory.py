@@ -40,6 +40,13 @@ def create_block() -> Block:
     )
 
 
+def create_block_lock() -> BlockLock:
+    return BlockLock(
+        network="lrt1",
+        block_hash="9dbc064574aafcba8cadbd20aa6ef5b396e64ba970d829c188734ac09ae34f64",
+    )
+
+
 def create_deploy() -> Deploy:
     return Deploy(
         block_hash="9dbc064574aafcba8cadbd20aa6ef5b396e64ba970d829c188734ac09ae34f64",
@@ -88,6 +95,10 @@ def create_node() -> Node:
     )
 
 
+def create_node_health() -> NodeHealth:
+    return factory.create_node_health(create_node())
+
+
 def create_node_id() -> NodeIdentifier:
     return factory.create_node_id(create_network_id(), 1)
 
@@ -96,6 +107,7 @@ def create_execution_context() -> ExecutionContext:
     return ExecutionContext(        
         args=None,
         loop_count=0,
+        loop_index=0,
         loop_interval=0,
         network="LOC-01",
         node_index=1,
@@ -105,6 +117,20 @@ def create_execution_context() -> ExecutionContext:
         status=ExecutionStatus.IN_PROGRESS,
         step_index=1,
         step_label="a-test-step",        
+        use_stored_contracts=False,
+        )
+
+
+def create_execution_context_reference() -> ExecutionContextReference:
+    return ExecutionContextReference(
+        network="LOC-01",
+        phase_index=1,
+        run_index=1,
+        run_type="WG-XXX",
+        status=ExecutionStatus.IN_PROGRESS,
+        step_index=1,
+        step_label="a-test-step",
+        version=1577836800.0,
         )
 
 
@@ -174,13 +200,17 @@ FACTORIES: typing.Dict[typing.Type, typing.Callable] = {
     Network: create_network,
     NetworkIdentifier: create_network_id,
     Node: create_node,
+    NodeHealth: create_node_health,
     NodeIdentifier: create_node_id,
     Transfer: create_transfer,
     # Orchestration types.
     ExecutionContext: create_execution_context,
+    ExecutionContextReference: create_execution_context_reference,
     ExecutionInfo: create_execution_info,
     ExecutionState: create_execution_state,
     RunIdentifier: create_run_id,
+    # Lock types.
+    BlockLock: create_block_lock,
 }
 
 
@@ -0,0 +1,81 @@
+import inspect
+
+from stests.core import cache
+from stests.orchestration import actors
+from test.core import utils_factory as factory
+from test.core.utils_cache import use_fake_stores
+
+
+
+class _Step():
+    """A step dispatching a fixed number of deploys - verification may be set to fail transiently.
+
+    """
+    has_verifer = True
+    has_verifer_for_deploy = True
+    label = "a-test-step"
+
+    def __init__(self, verify_errors: int = 0):
+        self.verify_errors = verify_errors
+        self.verify_calls = 0
+
+    def verify(self):
+        self.verify_calls += 1
+        if self.verify_calls <= self.verify_errors:
+            raise ConnectionError("node unavailable")
+
+    def verify_deploy(self, dhash: str):
+        pass
+
+
+def _finalize(step, dhashes, expected_count):
+    """Processes a sequence of finalized deploys & returns (messages signalling step end, messages signalling step error).
+
+    """
+    ended, errored = [], []
+    get_phase_step, end_send, error_send = actors.Workflow.get_phase_step, actors.do_step_end.send, actors.do_step_error.send
+    actors.Workflow.get_phase_step = lambda ctx, phase_index, step_index: step
+    actors.do_step_end.send = lambda ctx: ended.append(ctx)
+    actors.do_step_error.send = lambda ctx, err: errored.append(err)
+    try:
+        with use_fake_stores():
+            ctx = factory.create_execution_context()
+            cache.orchestration.set_expected_deploy_count(ctx, expected_count)
+            for dhash in dhashes:
+                try:
+                    actors.on_step_deploy_finalized.fn(ctx, dhash)
+                except ConnectionError:
+                    # Redelivered by broker.
+                    actors.on_step_deploy_finalized.fn(ctx, dhash)
+    finally:
+        actors.Workflow.get_phase_step, actors.do_step_end.send, actors.do_step_error.send = get_phase_step, end_send, error_send
+
+    return ended, errored
+
+
+def test_01():
+    """Test module import."""
+    assert inspect.ismodule(actors)
+
+
+def test_02():
+    """Test step ends once all of its deploys are finalized."""
+    ended, errored = _finalize(_Step(), ["d1", "d2", "d3"], 3)
+    assert len(ended) == 1 and not errored
+
+    ended, errored = _finalize(_Step(), ["d1", "d2"], 3)
+    assert not ended and not errored
+
+
+def test_03():
+    """Test step ends exactly once when deploy messages are redelivered."""
+    ended, errored = _finalize(_Step(), ["d1", "d2", "d3", "d3", "d2"], 3)
+    assert len(ended) == 1 and not errored
+
+
+def test_04():
+    """Test step ends once when its final deploy message is retried after a transient verification error."""
+    step = _Step(verify_errors=1)
+    ended, errored = _finalize(step, ["d1", "d2", "d3"], 3)
+    assert len(ended) == 1 and not errored
+    assert step.verify_calls == 2